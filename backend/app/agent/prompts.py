@@ -31,7 +31,7 @@ You have access to tools provided via the API. Use them strategically to answer
    - Do not assume one search will yield all necessary data.
 
 2. **Data Freshness**:
-   - Current Date: {current_date}.
+   - The current date is given under Operational Context below.
    - If searching for "current" status, check the date of the retrieved documents.
 
 3. **Citation Rules**:
@@ -17,13 +17,14 @@ Requirements:
        synthesize a final comprehensive answer.
 """
 
+import asyncio
 import json
 import logging
 import time
 from datetime import datetime
-from typing import Any, AsyncIterator, Dict, List, Optional, Tuple, NamedTuple
+from typing import Any, AsyncIterator, Dict, List, Optional, Set, Tuple, NamedTuple, Union
 
-from openai import OpenAI
+from openai import AsyncOpenAI, OpenAI
 
 try:
     from google import genai  # type: ignore
@@ -53,6 +54,7 @@ from .types import (
 from .router import IntentRouter
 from .tools.registry import ToolRegistry, ToolNotFoundError
 from ..core.config import get_settings
+from ..services.openai_client import get_async_client
 
 
 from .prompts import REACT_AGENT_SYSTEM_PROMPT
@@ -64,12 +66,17 @@ logger = logging.getLogger(__name__)
 # Default maximum steps to prevent infinite loops (Requirement 3.3)
 DEFAULT_MAX_STEPS = 10
 
+# Upper bound on tool calls from one LLM turn executed concurrently
+MAX_PARALLEL_TOOL_CALLS = 8
+
 
 class ToolCall(NamedTuple):
     """Represents a request from the LLM to call a tool."""
     name: str
     arguments: Dict[str, Any]
     id: Optional[str] = None
+    # Further calls the LLM issued in the same turn (parallel tool calling)
+    parallel: Tuple["ToolCall", ...] = ()
 
 
 class ReActAgent:
@@ -91,7 +98,7 @@ class ReActAgent:
         tool_registry: ToolRegistry,
         router: Optional[IntentRouter] = None,
         max_steps: int = DEFAULT_MAX_STEPS,
-        openai_client: Optional[OpenAI] = None,
+        openai_client: Optional[Union[AsyncOpenAI, OpenAI]] = None,
     ) -> None:
         """
         Initialize the ReAct Agent.
@@ -100,7 +107,8 @@ class ReActAgent:
             tool_registry: Registry of available tools
             router: Intent router for query classification (optional)
             max_steps: Maximum reasoning steps (default: 10, Requirement 3.3)
-            openai_client: Optional OpenAI client for LLM calls
+            openai_client: Optional OpenAI client for LLM calls (defaults to the
+                shared AsyncOpenAI client; a sync client runs in a worker thread)
         """
         self.tools = tool_registry
         self.router = router
@@ -111,7 +119,7 @@ class ReActAgent:
         self.provider = (self.settings.llm_provider or "openai").lower()
         
         if self.provider == "openai":
-            self.openai = openai_client or (OpenAI() if self.settings.openai_api_key else None)
+            self.openai = openai_client
             self._gemini_client = None
         else:
             self.openai = None
@@ -119,6 +127,24 @@ class ReActAgent:
             if genai and self.settings.google_api_key:
                 self._gemini_client = genai.Client(api_key=self.settings.google_api_key)
     
+    @property
+    def openai(self) -> Optional[Union[AsyncOpenAI, OpenAI]]:
+        """OpenAI client for LLM calls.
+        
+        Without an injected client this is the shared AsyncOpenAI client of the
+        running event loop, looked up per call, so an agent outlives the loop
+        it was first used on (sync wrappers call ``asyncio.run`` repeatedly).
+        """
+        if self._openai is not None:
+            return self._openai
+        if self.provider == "openai" and self.settings.openai_api_key:
+            return get_async_client()
+        return None
+    
+    @openai.setter
+    def openai(self, client: Optional[Union[AsyncOpenAI, OpenAI]]) -> None:
+        self._openai = client
+    
     async def run(
         self,
         query: str,
@@ -146,6 +172,7 @@ class ReActAgent:
         # Initialize state
         intermediate_steps: List[ThoughtStep] = []
         sources: List[Dict[str, Any]] = []
+        seen_sources: Set[str] = set()
         observations: List[str] = []
         
         # Build initial conversation history
@@ -164,7 +191,7 @@ class ReActAgent:
             logger.debug(f"ReAct step {step_count}/{self.max_steps}")
             
             # Get next action from LLM with native tool calling
-            thought_process, tool_call = self._call_llm(conversation_history)
+            thought_process, tool_call = await self._call_llm(conversation_history)
             
             thought = thought_process
             action = tool_call.name if tool_call else None
@@ -202,56 +229,24 @@ class ReActAgent:
                 intermediate_steps.append(step)
                 continue
 
-            # Execute tool
-            observation = self._execute_tool(
-                action=action,
-                action_input=action_input,
-                user_id=user_id,
-            )
-            step.observation = observation
-            observations.append(observation)
+            # Execute tool(s); parallel calls from the same turn run concurrently
+            tool_calls = self._turn_tool_calls(tool_call)
+            turn_observations = await self._execute_tool_calls(tool_calls, user_id)
+            step.observation = "\n\n".join(turn_observations)
+            observations.extend(turn_observations)
             intermediate_steps.append(step)
             
             # Extract sources
-            self._extract_sources(action, observation, sources)
+            for call, observation in zip(tool_calls, turn_observations):
+                self._extract_sources(call.name, observation, sources, seen_sources)
             
             # Add to history
-            # For OpenAI, we need to append the tool call message properly
-            # For Gemini, it handles it differently, but our abstraction unifies it
-            if self.provider == "openai":
-                conversation_history.append({
-                    "role": "assistant",
-                    "content": thought,
-                    "tool_calls": [{
-                        "id": tool_call.id,
-                        "type": "function",
-                        "function": {
-                            "name": tool_call.name,
-                            "arguments": json.dumps(tool_call.arguments)
-                        }
-                    }]
-                })
-                conversation_history.append({
-                    "role": "tool",
-                    "tool_call_id": tool_call.id,
-                    "content": observation
-                })
-            else:
-                # Gemini simplified history update (abstraction layer handles format)
-                conversation_history.append({
-                    "role": "model",
-                    "parts": [{"function_call": {"name": tool_call.name, "args": tool_call.arguments}}]
-                })
-                conversation_history.append({
-                    "role": "function", # Special role for Gemini in our internal format
-                    "name": tool_call.name,
-                    "content": observation
-                })
+            self._append_tool_turn(conversation_history, thought, tool_calls, turn_observations)
 
         # Synthesize if needed
         if final_answer is None:
             logger.warning(f"Step limit ({self.max_steps}) reached")
-            final_answer = self._synthesize_final_answer(query, observations, intermediate_steps)
+            final_answer = await self._synthesize_final_answer(query, observations, intermediate_steps)
         
         return AgentResponse(
             answer=final_answer,
@@ -287,6 +282,7 @@ class ReActAgent:
         
         intermediate_steps = []
         sources = []
+        seen_sources: Set[str] = set()
         observations = []
         
         conversation_history = self._build_initial_history(query=query, user_id=user_id)
@@ -304,7 +300,7 @@ class ReActAgent:
             )
             
             # Call LLM
-            thought, tool_call = self._call_llm(conversation_history)
+            thought, tool_call = await self._call_llm(conversation_history)
             
             if thought:
                 yield AgentStreamEvent(
@@ -326,56 +322,31 @@ class ReActAgent:
                     )
                     return
                 
-                yield AgentStreamEvent(
-                    event_type="tool_call",
-                    content=f"Calling {tool_call.name}",
-                    metadata={"tool": tool_call.name, "input": tool_call.arguments},
-                )
-                
-                observation = self._execute_tool(
-                    action=tool_call.name,
-                    action_input=tool_call.arguments,
-                    user_id=user_id,
-                )
-                observations.append(observation)
+                tool_calls = self._turn_tool_calls(tool_call)
+                for call in tool_calls:
+                    yield AgentStreamEvent(
+                        event_type="tool_call",
+                        content=f"Calling {call.name}",
+                        metadata={"tool": call.name, "input": call.arguments},
+                    )
                 
-                yield AgentStreamEvent(
-                    event_type="tool_result",
-                    content=observation[:500] + "..." if len(observation) > 500 else observation,
-                    metadata={"tool": tool_call.name},
-                )
+                # Stream each result as soon as its call finishes
+                turn_observations = [""] * len(tool_calls)
+                async for index, observation in self._iter_tool_results(tool_calls, user_id):
+                    turn_observations[index] = observation
+                    yield AgentStreamEvent(
+                        event_type="tool_result",
+                        content=observation[:500] + "..." if len(observation) > 500 else observation,
+                        metadata={"tool": tool_calls[index].name},
+                    )
+                observations.extend(turn_observations)
                 
-                self._extract_sources(tool_call.name, observation, sources)
+                # Number sources in call order, as run() does, not completion order
+                for call, observation in zip(tool_calls, turn_observations):
+                    self._extract_sources(call.name, observation, sources, seen_sources)
                 
                 # Update history
-                if self.provider == "openai":
-                    conversation_history.append({
-                        "role": "assistant",
-                        "content": thought,
-                        "tool_calls": [{
-                            "id": tool_call.id,
-                            "type": "function",
-                            "function": {
-                                "name": tool_call.name,
-                                "arguments": json.dumps(tool_call.arguments)
-                            }
-                        }]
-                    })
-                    conversation_history.append({
-                        "role": "tool",
-                        "tool_call_id": tool_call.id,
-                        "content": observation
-                    })
-                else:
-                    conversation_history.append({
-                        "role": "model",
-                        "parts": [{"function_call": {"name": tool_call.name, "args": tool_call.arguments}}]
-                    })
-                    conversation_history.append({
-                        "role": "function",
-                        "name": tool_call.name,
-                        "content": observation
-                    })
+                self._append_tool_turn(conversation_history, thought, tool_calls, turn_observations)
             else:
                 # No tool call - ask for continuation
                 conversation_history.append({"role": "assistant", "content": thought})
@@ -389,7 +360,7 @@ class ReActAgent:
             event_type="thinking",
             content="Reached step limit, synthesizing final answer...",
         )
-        final_answer = self._synthesize_final_answer(query, observations, [])
+        final_answer = await self._synthesize_final_answer(query, observations, [])
         yield AgentStreamEvent(
             event_type="answer",
             content=final_answer,
@@ -417,20 +388,24 @@ User Question: {query}
             {"role": "user", "content": context},
         ]
 
-    def _call_llm(self, messages: List[Dict[str, Any]]) -> Tuple[str, Optional[ToolCall]]:
-        """Call LLM with tools and return thought and optional tool call."""
+    async def _call_llm(self, messages: List[Dict[str, Any]]) -> Tuple[str, Optional[ToolCall]]:
+        """Call LLM with tools and return thought and optional tool call.
+        
+        The call never blocks the event loop: OpenAI goes through the async
+        client and the (sync) Gemini SDK runs in a worker thread, so concurrent
+        agent sessions overlap their LLM latency.
+        """
         if self.provider == "gemini" and self._gemini_client:
-            return self._call_gemini(messages)
+            return await asyncio.to_thread(self._call_gemini, messages)
         elif self.openai:
-            return self._call_openai(messages)
+            return await self._call_openai(messages)
         else:
             raise RuntimeError("No LLM client available")
 
-    def _call_openai(self, messages: List[Dict[str, Any]]) -> Tuple[str, Optional[ToolCall]]:
+    async def _call_openai(self, messages: List[Dict[str, Any]]) -> Tuple[str, Optional[ToolCall]]:
         """Call OpenAI with native tools."""
         tools = self.tools.to_openai_tools()
-        
-        response = self.openai.chat.completions.create(
+        request = dict(
             model=self.settings.openai_model_mini,
             messages=messages,
             tools=tools,
@@ -439,16 +414,25 @@ User Question: {query}
             temperature=0.3,
         )
         
+        client = self.openai
+        if isinstance(client, AsyncOpenAI):
+            response = await client.chat.completions.create(**request)
+        else:
+            response = await asyncio.to_thread(client.chat.completions.create, **request)
+        
         msg = response.choices[0].message
         content = msg.content or ""
         
         if msg.tool_calls:
-            tc = msg.tool_calls[0]
-            return content, ToolCall(
-                name=tc.function.name,
-                arguments=json.loads(tc.function.arguments),
-                id=tc.id
-            )
+            calls = [
+                ToolCall(
+                    name=tc.function.name,
+                    arguments=json.loads(tc.function.arguments),
+                    id=tc.id
+                )
+                for tc in msg.tool_calls
+            ]
+            return content, calls[0]._replace(parallel=tuple(calls[1:]))
         
         return content, None
 
@@ -517,19 +501,119 @@ User Question: {query}
         # Extract
         candidate = response.candidates[0]
         content = ""
-        tool_call = None
+        calls: List[ToolCall] = []
         
         for part in candidate.content.parts:
             if part.text:
                 content += part.text
             if part.function_call:
-                tool_call = ToolCall(
+                calls.append(ToolCall(
                     name=part.function_call.name,
                     arguments=dict(part.function_call.args),
                     id="gemini_id"
-                )
+                ))
+        
+        if not calls:
+            return content, None
+        return content, calls[0]._replace(parallel=tuple(calls[1:]))
+
+    @staticmethod
+    def _turn_tool_calls(tool_call: ToolCall) -> List[ToolCall]:
+        """All tool calls of one LLM turn; a parallel 'finish' is ignored in favour of the tools."""
+        return [tool_call] + [call for call in tool_call.parallel if call.name != "finish"]
+
+    async def _execute_tool_calls(self, tool_calls: List[ToolCall], user_id: str) -> List[str]:
+        """Execute the tool calls of one turn; results keep call order."""
+        observations = [""] * len(tool_calls)
+        async for index, observation in self._iter_tool_results(tool_calls, user_id):
+            observations[index] = observation
+        return observations
+
+    async def _iter_tool_results(
+        self, tool_calls: List[ToolCall], user_id: str
+    ) -> AsyncIterator[Tuple[int, str]]:
+        """Yield (call index, observation) for the calls of one turn as each one finishes.
+
+        Tools are synchronous (retrieval, web search), so every call runs in a
+        worker thread; parallel calls are bounded by MAX_PARALLEL_TOOL_CALLS.
+        Identical calls (same tool and arguments) run once and share the
+        observation. Yielding in completion order lets streaming surface fast
+        results without waiting for the slowest call.
+        """
+        if len(tool_calls) == 1:
+            call = tool_calls[0]
+            yield 0, await asyncio.to_thread(self._execute_tool, call.name, call.arguments, user_id)
+            return
+        
+        unique_calls, slots = self._plan_tool_calls(tool_calls)
+        semaphore = asyncio.Semaphore(MAX_PARALLEL_TOOL_CALLS)
+        
+        async def execute(position: int, call: ToolCall) -> Tuple[int, str]:
+            async with semaphore:
+                return position, await asyncio.to_thread(self._execute_tool, call.name, call.arguments, user_id)
         
-        return content, tool_call
+        pending = [execute(position, call) for position, call in enumerate(unique_calls)]
+        for finished in asyncio.as_completed(pending):
+            position, observation = await finished
+            for index, slot in enumerate(slots):
+                if slot == position:
+                    yield index, observation
+
+    @staticmethod
+    def _plan_tool_calls(tool_calls: List[ToolCall]) -> Tuple[List[ToolCall], List[int]]:
+        """Collapse duplicate calls; returns the unique calls and, per call, its unique index."""
+        unique_calls: List[ToolCall] = []
+        index: Dict[str, int] = {}
+        slots: List[int] = []
+        for call in tool_calls:
+            key = call.name + json.dumps(call.arguments, sort_keys=True, ensure_ascii=False, default=str)
+            if key not in index:
+                index[key] = len(unique_calls)
+                unique_calls.append(call)
+            slots.append(index[key])
+        return unique_calls, slots
+
+    def _append_tool_turn(
+        self,
+        conversation_history: List[Dict[str, Any]],
+        thought: str,
+        tool_calls: List[ToolCall],
+        observations: List[str],
+    ) -> None:
+        """Record a tool-calling turn and its results in the conversation history."""
+        # For OpenAI, every tool call id needs a matching tool message
+        # For Gemini, it handles it differently, but our abstraction unifies it
+        if self.provider == "openai":
+            conversation_history.append({
+                "role": "assistant",
+                "content": thought,
+                "tool_calls": [{
+                    "id": call.id,
+                    "type": "function",
+                    "function": {
+                        "name": call.name,
+                        "arguments": json.dumps(call.arguments)
+                    }
+                } for call in tool_calls]
+            })
+            for call, observation in zip(tool_calls, observations):
+                conversation_history.append({
+                    "role": "tool",
+                    "tool_call_id": call.id,
+                    "content": observation
+                })
+        else:
+            # Gemini simplified history update (abstraction layer handles format)
+            conversation_history.append({
+                "role": "model",
+                "parts": [{"function_call": {"name": call.name, "args": call.arguments}} for call in tool_calls]
+            })
+            for call, observation in zip(tool_calls, observations):
+                conversation_history.append({
+                    "role": "function", # Special role for Gemini in our internal format
+                    "name": call.name,
+                    "content": observation
+                })
 
     def _execute_tool(self, action: str, action_input: Dict[str, Any], user_id: str) -> str:
         """Execute tool safely."""
@@ -541,26 +625,41 @@ User Question: {query}
             
             if isinstance(result, str):
                 return result
-            return json.dumps(result, ensure_ascii=False, indent=2)
+            # Compact separators: the observation is re-sent to the LLM every step,
+            # and indentation only adds characters (and tokens) to each chunk
+            return json.dumps(result, ensure_ascii=False, separators=(",", ":"))
         except ToolNotFoundError:
             return f"Error: Tool '{action}' not found."
         except Exception as e:
             logger.error(f"Tool {action} failed: {e}", exc_info=True)
             return f"Error: {str(e)}"
 
-    def _extract_sources(self, action: str, observation: str, sources: List[Dict]):
-        """Extract sources from tool observations."""
+    def _extract_sources(
+        self,
+        action: str,
+        observation: str,
+        sources: List[Dict],
+        seen: Optional[Set[str]] = None,
+    ):
+        """Extract sources from tool observations.
+
+        ``seen`` holds chunk ids / URLs already in ``sources`` so that repeated
+        searches don't list the same source twice.
+        """
         try:
             if action in ("web_search", "document_search"):
                 # Simplified extraction logic
                 import json
                 data = json.loads(observation) if isinstance(observation, str) else observation
                 if isinstance(data, list):
-                    start_idx = len(sources) + 1
-                    for i, item in enumerate(data):
+                    for item in data:
                          if not isinstance(item, dict): continue
+                         key = item.get("id") or item.get("url")
+                         if key and seen is not None:
+                             if key in seen: continue
+                             seen.add(key)
                          sources.append({
-                             "documentId": str(start_idx + i),
+                             "documentId": str(len(sources) + 1),
                              "title": item.get("title") or item.get("document_name", "Untitled"),
                              "textSnippet": (item.get("content") or item.get("text", ""))[:200],
                              "url": item.get("url", ""),
@@ -581,18 +680,19 @@ User Question: {query}
             if k in q: return v
         return "Hello! How can I help?"
 
-    def _synthesize_final_answer(self, query: str, observations: List[str], steps: List[ThoughtStep]) -> str:
+    async def _synthesize_final_answer(self, query: str, observations: List[str], steps: List[ThoughtStep]) -> str:
         """Synthesize answer if loop limit reached."""
         if not observations: return "I couldn't find enough information."
         
-        obs_text = "\n".join(observations)
+        # Repeated searches return identical observations; send each once, in order
+        obs_text = "\n".join(dict.fromkeys(observations))
         messages = [
             {"role": "system", "content": "Synthesize the following information."},
             {"role": "user", "content": f"Query: {query}\n\nInfo:\n{obs_text}"}
         ]
         
         # Simple synthesis call
-        thought, _ = self._call_llm(messages)
+        thought, _ = await self._call_llm(messages)
         return thought
 
     def _get_model_name(self) -> str:
@@ -17,7 +17,7 @@ from rank_bm25 import BM25Okapi
 from .tokenizer import tokenize
 
 
-@dataclass
+@dataclass(slots=True)
 class BM25SearchResult:
     """Result from a BM25 search query."""
     chunk_id: str
@@ -15,8 +15,10 @@ Requirements:
        vector and keyword search results with a default of 0.7:0.3.
 """
 
+import asyncio
 import logging
 from dataclasses import dataclass, field
+from operator import attrgetter
 from typing import Any, Dict, List, Optional
 
 import chromadb
@@ -28,7 +30,7 @@ from .bm25_store import BM25IndexStore
 logger = logging.getLogger(__name__)
 
 
-@dataclass
+@dataclass(slots=True)
 class RetrievalResult:
     """
     Result from hybrid retrieval.
@@ -167,6 +169,58 @@ class HybridRetriever:
             k=k * 2,
         )
         
+        return self._combine_results(vector_results, bm25_results, document_id, k)
+    
+    async def asearch(
+        self,
+        query: str,
+        document_id: str,
+        user_id: str,
+        query_embedding: List[float],
+        k: int = 10,
+    ) -> List[RetrievalResult]:
+        """
+        Async variant of search() running vector and BM25 search concurrently.
+        
+        Both searches are blocking (ChromaDB client / in-process BM25), so they
+        are dispatched to worker threads and awaited together.
+        
+        Args:
+            query: The search query string
+            document_id: ID of the document to search within
+            user_id: ID of the user who owns the document
+            query_embedding: Pre-computed embedding for the query
+            k: Maximum number of results to return
+            
+        Returns:
+            List of RetrievalResult objects sorted by fused score (descending)
+        """
+        vector_results, bm25_results = await asyncio.gather(
+            asyncio.to_thread(
+                self._vector_search,
+                query_embedding=query_embedding,
+                document_id=document_id,
+                user_id=user_id,
+                k=k * 2,
+            ),
+            asyncio.to_thread(
+                self._bm25_search,
+                query=query,
+                document_id=document_id,
+                k=k * 2,
+            ),
+        )
+        
+        return self._combine_results(vector_results, bm25_results, document_id, k)
+    
+    def _combine_results(
+        self,
+        vector_results: List[RetrievalResult],
+        bm25_results: List[RetrievalResult],
+        document_id: str,
+        k: int,
+    ) -> List[RetrievalResult]:
+        """Fuse vector and BM25 results, falling back to vector-only when BM25 is empty."""
         # If BM25 returns no results, fall back to vector-only
         # Requirement 6.5: IF keyword search returns no results, THEN THE
         # Agentic_RAG_System SHALL fall back to vector-only search.
@@ -316,10 +370,12 @@ class HybridRetriever:
         result_map: Dict[str, RetrievalResult] = {}
         
         # Process vector results and assign RRF scores
+        # (one dict probe per result: get() then insert only on a miss)
         for rank, result in enumerate(vector_results, start=1):
             rrf_score = self._vector_weight * (1.0 / (self._rrf_k + rank))
             
-            if result.chunk_id not in result_map:
+            fused = result_map.get(result.chunk_id)
+            if fused is None:
                 result_map[result.chunk_id] = RetrievalResult(
                     chunk_id=result.chunk_id,
                     text=result.text,
@@ -329,14 +385,15 @@ class HybridRetriever:
                     fused_score=rrf_score,
                 )
             else:
-                result_map[result.chunk_id].vector_score = result.vector_score
-                result_map[result.chunk_id].fused_score += rrf_score
+                fused.vector_score = result.vector_score
+                fused.fused_score += rrf_score
         
         # Process BM25 results and add/update RRF scores
         for rank, result in enumerate(bm25_results, start=1):
             rrf_score = self._bm25_weight * (1.0 / (self._rrf_k + rank))
             
-            if result.chunk_id not in result_map:
+            fused = result_map.get(result.chunk_id)
+            if fused is None:
                 result_map[result.chunk_id] = RetrievalResult(
                     chunk_id=result.chunk_id,
                     text=result.text,
@@ -346,13 +403,13 @@ class HybridRetriever:
                     fused_score=rrf_score,
                 )
             else:
-                result_map[result.chunk_id].bm25_score = result.bm25_score
-                result_map[result.chunk_id].fused_score += rrf_score
+                fused.bm25_score = result.bm25_score
+                fused.fused_score += rrf_score
         
         # Sort by fused score descending
         fused_results = sorted(
             result_map.values(),
-            key=lambda r: r.fused_score,
+            key=attrgetter("fused_score"),
             reverse=True,
         )
         
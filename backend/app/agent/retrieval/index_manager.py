@@ -9,6 +9,7 @@ Requirements: 6.2 - THE Agentic_RAG_System SHALL support keyword-based search us
 """
 
 import logging
+import sys
 from dataclasses import dataclass, field
 from pathlib import Path
 from typing import Any, Callable, Dict, List, Optional, Protocol
@@ -16,6 +17,13 @@ from typing import Any, Callable, Dict, List, Optional, Protocol
 from .bm25_service import BM25Service, ChunkData
 from .bm25_store import BM25IndexStore
 
+# Low-cardinality metadata values repeated across a document's chunks. Interning
+# makes equal values a single object, so the pickled BM25 index stores each once
+# (pickle memoizes by identity) and every loaded index shares them.
+_SHARED_METADATA_KEYS = frozenset(
+    {"section_path", "element_type", "page_number", "chunk_index", "has_summary"}
+)
+
 
 class VectorStoreProtocol(Protocol):
     """Protocol for vector store operations."""
@@ -266,7 +274,8 @@ class IndexManager:
         """
         Prepare metadata dictionaries for each chunk.
         
-        Ensures each metadata dict contains user_id and document_id.
+        Ensures each metadata dict contains user_id and document_id, and
+        interns repeated values such as section paths.
         """
         metadatas: List[Dict[str, Any]] = []
         
@@ -276,6 +285,11 @@ class IndexManager:
             else:
                 metadata = {}
             
+            for key in _SHARED_METADATA_KEYS.intersection(metadata):
+                value = metadata[key]
+                if isinstance(value, str):
+                    metadata[key] = sys.intern(value)
+            
             metadata["user_id"] = request.user_id
             metadata["document_id"] = request.document_id
             metadatas.append(metadata)
@@ -16,7 +16,7 @@ import jieba
 
 
 # CJK Unicode ranges (characters only, not punctuation)
-CJK_RANGES = [
+CJK_RANGES = (
     (0x4E00, 0x9FFF),    # CJK Unified Ideographs
     (0x3400, 0x4DBF),    # CJK Unified Ideographs Extension A
     (0x20000, 0x2A6DF),  # CJK Unified Ideographs Extension B
@@ -25,10 +25,10 @@ CJK_RANGES = [
     (0x2B820, 0x2CEAF),  # CJK Unified Ideographs Extension E
     (0xF900, 0xFAFF),    # CJK Compatibility Ideographs
     (0x2F800, 0x2FA1F),  # CJK Compatibility Ideographs Supplement
-]
+)
 
 # Chinese punctuation characters to filter out
-CHINESE_PUNCTUATION = set('，。！？、；：""''（）【】《》〈〉「」『』…—～·')
+CHINESE_PUNCTUATION = frozenset('，。！？、；：""''（）【】《》〈〉「」『』…—～·')
 
 # Threshold for determining if text is primarily Chinese
 CJK_RATIO_THRESHOLD = 0.3
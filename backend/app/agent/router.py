@@ -9,7 +9,7 @@ web search, or complex reasoning).
 import logging
 import re
 import time
-from typing import Any, Dict, List, Optional
+from typing import Any, Dict, Optional, Tuple
 
 from openai import OpenAI
 
@@ -22,6 +22,8 @@ except ImportError:  # pragma: no cover
 
 from .types import IntentClassification, IntentType
 from ..core.config import get_settings
+from ..services.llm_cache import LLMCache, get_llm_cache
+from ..services.openai_client import get_openai_client
 from .prompts import (
     INTENT_CLASSIFICATION_SYSTEM_PROMPT,
     INTENT_CLASSIFICATION_USER_TEMPLATE,
@@ -41,7 +43,7 @@ class IntentRouter:
     
     # Common greeting patterns in English and Chinese
     # Note: Include both ASCII and full-width Chinese punctuation
-    GREETING_PATTERNS: List[str] = [
+    GREETING_PATTERNS: Tuple[str, ...] = (
         # English greetings
         r"^(hi|hello|hey|howdy|greetings)[\s!.,?！。，？]*$",
         r"^good\s+(morning|afternoon|evening|night)[\s!.,?！。，？]*$",
@@ -61,10 +63,10 @@ class IntentRouter:
         r"^你好吗[\s!.,?！。，？]*$",
         r"^最近怎么样[\s!.,?！。，？]*$",
         r"^在吗[\s!.,?！。，？]*$",
-    ]
+    )
     
     # Small-talk patterns (non-greeting but still direct answer)
-    SMALL_TALK_PATTERNS: List[str] = [
+    SMALL_TALK_PATTERNS: Tuple[str, ...] = (
         # English
         r"^(thanks?|thank\s+you|thx)[\s!.,?！。，？]*$",
         r"^(bye|goodbye|see\s+you|later)[\s!.,?！。，？]*$",
@@ -84,7 +86,11 @@ class IntentRouter:
         r"^你是谁[\s!.,?！。，？]*$",
         r"^你能做什么[\s!.,?！。，？]*$",
         r"^帮助[\s!.,?！。，？]*$",
-    ]
+    )
+    
+    # Compiled once per process and shared by all router instances
+    _greeting_patterns: Tuple[re.Pattern, ...] = tuple(re.compile(p, re.IGNORECASE) for p in GREETING_PATTERNS)
+    _small_talk_patterns: Tuple[re.Pattern, ...] = tuple(re.compile(p, re.IGNORECASE) for p in SMALL_TALK_PATTERNS)
     
     # Confidence threshold for fallback mechanism
     CONFIDENCE_THRESHOLD = 0.8
@@ -109,17 +115,13 @@ class IntentRouter:
         self.provider = (self.settings.llm_provider or "openai").lower()
         
         if self.provider == "openai":
-            self.openai = openai_client or (OpenAI() if self.settings.openai_api_key else None)
+            self.openai = openai_client or (get_openai_client() if self.settings.openai_api_key else None)
             self._gemini_client = None
         else:
             self.openai = None
             self._gemini_client = None
             if genai and self.settings.google_api_key:
                 self._gemini_client = genai.Client(api_key=self.settings.google_api_key)
-        
-        # Compile regex patterns for efficiency
-        self._greeting_patterns = [re.compile(p, re.IGNORECASE) for p in self.GREETING_PATTERNS]
-        self._small_talk_patterns = [re.compile(p, re.IGNORECASE) for p in self.SMALL_TALK_PATTERNS]
     
     def classify(
         self,
@@ -268,20 +270,28 @@ class IntentRouter:
         user_prompt: str,
     ) -> IntentClassification:
         """Classify using OpenAI API."""
-        import json
-        
-        response = self.openai.chat.completions.create(
-            model=self.settings.openai_model_mini,
-            messages=[
-                {"role": "system", "content": system_prompt},
-                {"role": "user", "content": user_prompt},
-            ],
-            max_tokens=200,
-            temperature=0.1,
-            response_format={"type": "json_object"},
-        )
-        
-        content = response.choices[0].message.content
+        model_name = self.settings.openai_model_mini
+        messages = [
+            {"role": "system", "content": system_prompt},
+            {"role": "user", "content": user_prompt},
+        ]
+        response_format = {"type": "json_object"}
+        
+        # Same query -> same classification; skip the API call on a cache hit
+        cache = get_llm_cache()
+        cache_key = LLMCache.cache_key(model_name, messages, 0.1, response_format)
+        content = cache.get(cache_key) if cache else None
+        if content is None:
+            response = self.openai.chat.completions.create(
+                model=model_name,
+                messages=messages,
+                max_tokens=200,
+                temperature=0.1,
+                response_format=response_format,
+            )
+            content = response.choices[0].message.content
+            if cache and content:
+                cache.set(cache_key, content)
         return self._parse_llm_response(content)
     
     def _classify_with_gemini(
@@ -290,11 +300,14 @@ class IntentRouter:
         user_prompt: str,
     ) -> IntentClassification:
         """Classify using Gemini API."""
-        import json
-        
         full_prompt = f"{system_prompt}\n\n{user_prompt}"
         
         model_name = self.settings.gemini_model_flash
+        cache = get_llm_cache()
+        cache_key = LLMCache.cache_key(model_name, [{"role": "user", "content": full_prompt}], 0.1)
+        cached = cache.get(cache_key) if cache else None
+        if cached is not None:
+            return self._parse_llm_response(cached)
         self.logger.info(f"Classifying intent with Gemini model: {model_name}")
 
         response = self._gemini_client.models.generate_content(
@@ -317,6 +330,8 @@ class IntentRouter:
                     if len(candidate.content.parts) > 0:
                         content = candidate.content.parts[0].text
         
+        if cache and content:
+            cache.set(cache_key, content)
         return self._parse_llm_response(content)
     
     def _parse_llm_response(self, content: str) -> IntentClassification:
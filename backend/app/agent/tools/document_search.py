@@ -13,6 +13,8 @@ from ...services.retrieval_service import RetrievalService, get_retrieval_servic
 
 logger = logging.getLogger("app.agent.tools.document_search")
 
+_EMPTY_METADATA: Dict[str, Any] = {}
+
 
 def create_document_search_tool(
     retrieval_service: Optional[RetrievalService] = None,
@@ -67,15 +69,17 @@ def create_document_search_tool(
                 rerank_top_n=k,
             )
             
-            # Format results for agent consumption
+            # Format results for agent consumption: metadata fields are flattened
+            # to top-level keys, reading each chunk's metadata dict only once
             results = []
             for chunk in chunks:
+                metadata = chunk.get("metadata") or _EMPTY_METADATA
                 results.append({
                     "id": chunk.get("id"),
                     "text": chunk.get("text", ""),
-                    "document_id": chunk.get("metadata", {}).get("document_id", "unknown"),
-                    "section": chunk.get("metadata", {}).get("section_path", "unknown"),
-                    "page": chunk.get("metadata", {}).get("page_number"),
+                    "document_id": metadata.get("document_id", "unknown"),
+                    "section": metadata.get("section_path", "unknown"),
+                    "page": metadata.get("page_number"),
                     "relevance_score": chunk.get("rerank_score", 1.0 - chunk.get("distance", 0.0)),
                 })
             
@@ -25,6 +25,8 @@ class ToolRegistry:
     def __init__(self) -> None:
         """Initialize an empty tool registry."""
         self._tools: Dict[str, Tool] = {}
+        # Provider-format tool definitions, rebuilt only after the tool set changes
+        self._exported: Dict[str, List[Dict[str, Any]]] = {}
         self._logger = logging.getLogger("app.agent.tools.registry")
     
     def register(self, tool: Tool) -> None:
@@ -40,6 +42,7 @@ class ToolRegistry:
         if name in self._tools:
             self._logger.warning(f"Overwriting existing tool: {name}")
         self._tools[name] = tool
+        self._exported.clear()
         self._logger.debug(f"Registered tool: {name}")
     
     def get(self, name: str) -> Optional[Tool]:
@@ -64,9 +67,15 @@ class ToolRegistry:
     def to_openai_tools(self) -> List[Dict[str, Any]]:
         """Export tools in OpenAI Function Calling format.
         
+        The list is built once per tool set and shared between calls, since it
+        is sent with every agent step; callers must not mutate it.
+        
         Returns:
             List of tool definitions compatible with OpenAI's `tools` parameter
         """
+        cached = self._exported.get("openai")
+        if cached is not None:
+            return cached
         tools = []
         for schema in self.list_tools():
             tools.append({
@@ -81,14 +90,20 @@ class ToolRegistry:
                     },
                 },
             })
+        self._exported["openai"] = tools
         return tools
     
     def to_gemini_tools(self) -> List[Dict[str, Any]]:
         """Export tools in Gemini Tool format.
         
+        Shared and cached like :meth:`to_openai_tools`.
+        
         Returns:
             List of function declarations compatible with Gemini's tool format
         """
+        cached = self._exported.get("gemini")
+        if cached is not None:
+            return cached
         function_declarations = []
         for schema in self.list_tools():
             function_declarations.append({
@@ -100,6 +115,7 @@ class ToolRegistry:
                     "required": schema.required,
                 },
             })
+        self._exported["gemini"] = function_declarations
         return function_declarations
     
     def invoke(self, name: str, **kwargs: Any) -> Any:
@@ -1,3 +1,6 @@
+from contextlib import asynccontextmanager
+from typing import AsyncIterator
+
 from sqlalchemy.ext.asyncio import AsyncSession, create_async_engine, async_sessionmaker
 from sqlalchemy.orm import declarative_base
 from .config import get_settings
@@ -8,7 +11,7 @@ settings = get_settings()
 engine = create_async_engine(
     settings.database_url,
     echo=settings.log_level == "DEBUG",
-    pool_pre_ping=True,
+    pool_pre_ping=settings.database_pool_pre_ping,
     pool_size=5,
     max_overflow=10,
 )
@@ -37,3 +40,10 @@ async def get_db() -> AsyncSession:
             raise
         finally:
             await session.close()
+
+
+@asynccontextmanager
+async def session_scope() -> AsyncIterator[AsyncSession]:
+    """Unit-of-work session for background tasks; the connection goes back to the pool on exit"""
+    async with AsyncSessionLocal() as session:
+        yield session
@@ -1,3 +1,5 @@
+from contextlib import asynccontextmanager
+
 from fastapi import FastAPI, Response
 from fastapi.middleware.cors import CORSMiddleware
 from starlette.middleware.sessions import SessionMiddleware
@@ -13,9 +15,17 @@ except ImportError:  # pragma: no cover
 from .api.routes import auth, documents, subscription, agent, admin
 from .core.config import get_settings
 from .logging_utils import setup_logging
+from .services.rerank_service import warmup_reranker_in_background
 from .middleware.logging_middleware import RequestLoggingMiddleware
 
 
+@asynccontextmanager
+async def lifespan(app: FastAPI):
+    # 本地模型在后台加载，不阻塞启动；首个查询无需承担模型加载耗时
+    warmup_reranker_in_background()
+    yield
+
+
 def create_app() -> FastAPI:
     settings = get_settings()
     setup_logging(settings)
@@ -27,7 +37,7 @@ def create_app() -> FastAPI:
             traces_sample_rate=0.2,
         )
 
-    app = FastAPI(title=settings.app_name)
+    app = FastAPI(title=settings.app_name, lifespan=lifespan)
 
     # Add SessionMiddleware for OAuth (must be added before other middleware)
     app.add_middleware(SessionMiddleware, secret_key=settings.jwt_secret_key)
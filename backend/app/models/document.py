@@ -34,6 +34,7 @@ class Document(BaseModel):
     title: Optional[str] = None
     status: DocumentStatus = DocumentStatus.uploading
     error_message: Optional[str] = None
+    content_hash: Optional[str] = None
     created_at: str = Field(default_factory=utc_now_iso)
     updated_at: str = Field(default_factory=utc_now_iso)
 
@@ -27,6 +27,7 @@ class DocumentModel(Base):
     title = Column(String(500), nullable=True)
     status = Column(String(20), nullable=False, default="pending", index=True)
     error_message = Column(Text, nullable=True)
+    content_hash = Column(String(64), nullable=True, index=True)
     created_at = Column(DateTime(timezone=True), server_default=func.now(), nullable=False, index=True)
     updated_at = Column(DateTime(timezone=True), server_default=func.now(), onupdate=func.now(), nullable=False)
 
@@ -48,6 +49,7 @@ class PostgresDocumentRepository:
             title=document.title,
             status=document.status.value,
             error_message=document.error_message,
+            content_hash=document.content_hash,
             created_at=datetime.fromisoformat(document.created_at) if document.created_at else None,
             updated_at=datetime.fromisoformat(document.updated_at) if document.updated_at else None,
         )
@@ -112,6 +114,38 @@ class PostgresDocumentRepository:
             db_doc.title = title
             await self.session.commit()
 
+    async def update_content_hash(self, document_id: str, content_hash: str) -> None:
+        """Update document content hash"""
+        result = await self.session.execute(
+            select(DocumentModel).where(DocumentModel.id == document_id)
+        )
+        db_doc = result.scalar_one_or_none()
+        if db_doc:
+            db_doc.content_hash = content_hash
+            await self.session.commit()
+
+    async def get_by_hash(
+        self, content_hash: str, user_id: str, exclude_id: Optional[str] = None
+    ) -> Optional[Document]:
+        """Get the user's most recent completed document with the given content hash"""
+        conditions = [
+            DocumentModel.content_hash == content_hash,
+            DocumentModel.user_id == UUID(user_id),
+            DocumentModel.status == DocumentStatus.completed.value,
+        ]
+        if exclude_id:
+            conditions.append(DocumentModel.id != exclude_id)
+        result = await self.session.execute(
+            select(DocumentModel)
+            .where(and_(*conditions))
+            .order_by(DocumentModel.created_at.desc())
+            .limit(1)
+        )
+        db_doc = result.scalar_one_or_none()
+        if not db_doc:
+            return None
+        return self._to_domain(db_doc)
+
     def _to_domain(self, db_doc: DocumentModel) -> Document:
         """Convert ORM model to domain model"""
         return Document(
@@ -123,6 +157,7 @@ class PostgresDocumentRepository:
             title=db_doc.title,
             status=DocumentStatus(db_doc.status),
             error_message=db_doc.error_message,
+            content_hash=db_doc.content_hash,
             created_at=db_doc.created_at.isoformat() if db_doc.created_at else None,
             updated_at=db_doc.updated_at.isoformat() if db_doc.updated_at else None,
         )
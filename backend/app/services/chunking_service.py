@@ -1,14 +1,15 @@
 from __future__ import annotations
 
-import json
 import re
 import base64
 import io
 from dataclasses import dataclass
 from pathlib import Path
-from typing import Dict, List, Optional, Sequence, Tuple
+from typing import Dict, Iterator, List, Optional, Sequence, Set, Tuple
 import logging
 
+import orjson
+
 try:
     from unstructured.partition.pdf import partition_pdf
     from unstructured.partition.html import partition_html
@@ -77,6 +78,10 @@ except Exception:  # pragma: no cover
 DEFAULT_CHUNK_SIZE = 800  # tokens (reduced for better embedding model compatibility)
 DEFAULT_CHUNK_OVERLAP = 150  # increased overlap for better context preservation
 
+# Chunk output directories already created by this process
+_CREATED_DIRS: Set[Path] = set()
+
+CODE_BLOCK_PATTERN = re.compile(r'(```[\s\S]*?```|`[^`]+`)', re.MULTILINE)
 SECTION_HEADING_PATTERN = re.compile(
     r"^(?P<heading>(#+|\d+(\.\d+)*))\s*(?P<title>.+)$"
 )
@@ -87,7 +92,7 @@ HEADER_FOOTER_PATTERN = re.compile(r'^[\s\d\-–—]+$', re.MULTILINE)  # Standa
 MULTIPLE_NEWLINES = re.compile(r'\n{3,}')  # Excessive newlines
 
 
-@dataclass
+@dataclass(slots=True)
 class Chunk:
     text: str
     metadata: Dict[str, str]
@@ -111,7 +116,9 @@ class StructuredChunker:
         self.openai = summarizer_client
         if self.openai is None and OpenAI is not None:
             try:
-                self.openai = OpenAI()
+                from .openai_client import get_openai_client
+
+                self.openai = get_openai_client()
             except Exception:  # pragma: no cover
                 self.openai = None
 
@@ -449,7 +456,20 @@ class StructuredChunker:
     # --------------------- Chunking ---------------------
 
     def chunk_sections(self, sections: List[Dict]) -> List[Chunk]:
-        chunks: List[Chunk] = []
+        return list(self._iter_chunks(sections))
+
+    def iter_chunk_batches(self, sections: List[Dict], batch_size: int) -> Iterator[List[Chunk]]:
+        """Yield chunks in batches as they are produced, so embedding can start early."""
+        batch: List[Chunk] = []
+        for chunk in self._iter_chunks(sections):
+            batch.append(chunk)
+            if len(batch) >= batch_size:
+                yield batch
+                batch = []
+        if batch:
+            yield batch
+
+    def _iter_chunks(self, sections: List[Dict]) -> Iterator[Chunk]:
         for section in sections:
             section_path = " -> ".join(section["path"])
             page_number = section.get("page_number")
@@ -458,45 +478,40 @@ class StructuredChunker:
             if text_content:
                 text_chunks = self._split_text(text_content)
                 for idx, chunk_text in enumerate(text_chunks):
-                    chunks.append(
-                        Chunk(
-                            text=f"Section: {section_path}\n\n{chunk_text}",
-                            metadata={
-                                "section_path": section_path,
-                                "chunk_index": str(idx),
-                                "token_count": str(self._count_tokens(chunk_text)),
-                                "element_type": "text",
-                                "page_number": str(page_number) if page_number is not None else "",
-                            },
-                        )
+                    yield Chunk(
+                        text=f"Section: {section_path}\n\n{chunk_text}",
+                        metadata={
+                            "section_path": section_path,
+                            "chunk_index": str(idx),
+                            "token_count": str(self._count_tokens(chunk_text)),
+                            "element_type": "text",
+                            "page_number": str(page_number) if page_number is not None else "",
+                        },
                     )
 
             for table in section["tables"]:
                 markdown = self._table_to_markdown(table)
                 summary = self._summarize_table(markdown)
-                chunks.append(
-                    Chunk(
-                        text=f"Section: {section_path}\n\nSummary: {summary}\n\nTable:\n{markdown}",
-                        metadata={
-                            "section_path": section_path,
-                            "element_type": "table",
-                            "has_summary": str(bool(summary)),
-                            "page_number": str(table["metadata"].get("page_number") or page_number or ""),
-                        },
-                    )
+                yield Chunk(
+                    text=f"Section: {section_path}\n\nSummary: {summary}\n\nTable:\n{markdown}",
+                    metadata={
+                        "section_path": section_path,
+                        "element_type": "table",
+                        "has_summary": str(bool(summary)),
+                        "page_number": str(table["metadata"].get("page_number") or page_number or ""),
+                    },
                 )
 
-        return chunks
 
     def serialize_chunks(self, chunks: List[Chunk], destination: Path) -> None:
         payload = [
             {"text": chunk.text, "metadata": chunk.metadata} for chunk in chunks
         ]
-        destination.parent.mkdir(parents=True, exist_ok=True)
-        destination.write_text(
-            json.dumps(payload, ensure_ascii=False, indent=2),
-            encoding="utf-8",
-        )
+        parent = destination.parent
+        if parent not in _CREATED_DIRS:
+            parent.mkdir(parents=True, exist_ok=True)
+            _CREATED_DIRS.add(parent)
+        destination.write_bytes(orjson.dumps(payload, option=orjson.OPT_INDENT_2))
 
     # --------------------- Helpers ---------------------
 
@@ -514,14 +529,12 @@ class StructuredChunker:
 
     def _split_by_semantic_boundaries(self, text: str) -> List[str]:
         """Split text at semantic boundaries (paragraphs, code blocks, formulas)."""
-        # Preserve code blocks as single units
-        code_block_pattern = re.compile(r'(```[\s\S]*?```|`[^`]+`)', re.MULTILINE)
-        
         # Split by double newlines (paragraphs) while preserving code blocks
         parts = []
         last_end = 0
         
-        for match in code_block_pattern.finditer(text):
+        # Preserve code blocks as single units
+        for match in CODE_BLOCK_PATTERN.finditer(text):
             # Add text before code block
             before = text[last_end:match.start()]
             if before.strip():
@@ -553,8 +566,11 @@ class StructuredChunker:
                 return len(text)
             return len(self.tokenizer.encode(text))
         
+        # Encode each paragraph once; sizes run parallel to current_chunk for overlap reuse
+        newline_size = get_size('\n\n')
         chunks: List[str] = []
         current_chunk: List[str] = []
+        current_sizes: List[int] = []
         current_size = 0
         
         for para in paragraphs:
@@ -566,6 +582,7 @@ class StructuredChunker:
                 if current_chunk:
                     chunks.append('\n\n'.join(current_chunk))
                     current_chunk = []
+                    current_sizes = []
                     current_size = 0
                 
                 # Split large paragraph by tokens
@@ -574,7 +591,7 @@ class StructuredChunker:
                 continue
             
             # Check if adding this paragraph exceeds limit
-            separator_size = get_size('\n\n') if current_chunk else 0
+            separator_size = newline_size if current_chunk else 0
             if current_size + separator_size + para_size > max_size:
                 # Save current chunk
                 if current_chunk:
@@ -583,14 +600,19 @@ class StructuredChunker:
                 # Start new chunk with overlap from previous
                 if overlap > 0 and current_chunk:
                     # Include last paragraph(s) as overlap context
-                    overlap_paras = self._get_overlap_context(current_chunk, overlap, char_mode)
+                    overlap_paras = self._get_overlap_context(
+                        current_chunk, overlap, char_mode, sizes=current_sizes
+                    )
+                    current_sizes = current_sizes[len(current_sizes) - len(overlap_paras):] + [para_size]
                     current_chunk = overlap_paras + [para]
                     current_size = get_size('\n\n'.join(current_chunk))
                 else:
                     current_chunk = [para]
+                    current_sizes = [para_size]
                     current_size = para_size
             else:
                 current_chunk.append(para)
+                current_sizes.append(para_size)
                 current_size += separator_size + para_size
         
         # Don't forget the last chunk
@@ -633,9 +655,13 @@ class StructuredChunker:
         self, 
         paragraphs: List[str], 
         target_overlap: int,
-        char_mode: bool
+        char_mode: bool,
+        sizes: Optional[Sequence[int]] = None,
     ) -> List[str]:
-        """Get paragraphs from the end to use as overlap context."""
+        """Get paragraphs from the end to use as overlap context.
+
+        ``sizes`` holds already-computed sizes of ``paragraphs`` to skip re-encoding.
+        """
         def get_size(text: str) -> int:
             if char_mode or not self.tokenizer:
                 return len(text)
@@ -644,8 +670,9 @@ class StructuredChunker:
         overlap_paras = []
         total_size = 0
         
-        for para in reversed(paragraphs):
-            para_size = get_size(para)
+        for idx in range(len(paragraphs) - 1, -1, -1):
+            para = paragraphs[idx]
+            para_size = sizes[idx] if sizes is not None else get_size(para)
             if total_size + para_size > target_overlap:
                 break
             overlap_paras.insert(0, para)
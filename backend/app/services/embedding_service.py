@@ -4,8 +4,9 @@ import json
 from datetime import datetime, timezone
 import logging
 import time
+from operator import itemgetter
 from pathlib import Path
-from typing import Dict, List, Optional
+from typing import TYPE_CHECKING, Dict, Iterable, List, Optional, Tuple
 
 import chromadb
 from chromadb.config import Settings as ChromaSettings
@@ -17,6 +18,10 @@ except ImportError:  # pragma: no cover
     genai = None
 
 from ..core.config import get_settings
+from .openai_client import get_openai_client
+
+if TYPE_CHECKING:  # pragma: no cover
+    from .chunking_service import Chunk
 
 
 def _now_iso() -> str:
@@ -61,8 +66,7 @@ class EmbeddingService:
 
     def _client(self) -> OpenAI:
         if self._openai_client is None:
-            api_key = self.settings.openai_api_key
-            self._openai_client = OpenAI(api_key=api_key) if api_key else OpenAI()
+            self._openai_client = get_openai_client()
         return self._openai_client
 
     def _init_gemini(self) -> None:
@@ -73,16 +77,30 @@ class EmbeddingService:
         self._gemini_client = genai.Client(api_key=self.settings.google_api_key)
 
     def embed_chunks(self, document_id: str, user_id: str, chunks_file: Path) -> None:
+        """Embed chunks previously written by ``StructuredChunker.serialize_chunks``."""
         payload = json.loads(chunks_file.read_text(encoding="utf-8"))
+        self._embed_records(document_id, user_id, ((item["text"], item["metadata"]) for item in payload))
+
+    def embed_chunks_inmem(self, document_id: str, user_id: str, chunks: Iterable["Chunk"]) -> None:
+        """Embed chunks straight from memory, skipping the JSON round-trip."""
+        self._embed_records(document_id, user_id, ((chunk.text, chunk.metadata) for chunk in chunks))
+
+    def _embed_records(
+        self,
+        document_id: str,
+        user_id: str,
+        records: Iterable[Tuple[str, Dict[str, str]]],
+    ) -> None:
         created_at = _now_iso()
         batch_ids: List[str] = []
         batch_texts: List[str] = []
         batch_metadatas: List[Dict[str, str]] = []
 
-        for idx, item in enumerate(payload):
+        # Records may be a lazy stream (see document_tasks); flush each full batch as it fills
+        for idx, (text, chunk_metadata) in enumerate(records):
             batch_ids.append(f"{document_id}_chunk_{idx}")
-            batch_texts.append(item["text"])
-            metadata: Dict[str, str] = dict(item["metadata"])
+            batch_texts.append(text)
+            metadata: Dict[str, str] = dict(chunk_metadata)
             metadata.update(
                 {
                     "user_id": user_id,
@@ -91,31 +109,81 @@ class EmbeddingService:
                 }
             )
             batch_metadatas.append(metadata)
+            if len(batch_texts) >= self.batch_size:
+                self._add_batch(document_id, user_id, batch_ids, batch_texts, batch_metadatas)
+                batch_ids, batch_texts, batch_metadatas = [], [], []
 
-        for start in range(0, len(batch_texts), self.batch_size):
-            end = start + self.batch_size
-            texts = batch_texts[start:end]
-            ids = batch_ids[start:end]
-            metadatas = batch_metadatas[start:end]
+        if batch_texts:
+            self._add_batch(document_id, user_id, batch_ids, batch_texts, batch_metadatas)
+
+    def _add_batch(
+        self,
+        document_id: str,
+        user_id: str,
+        ids: List[str],
+        texts: List[str],
+        metadatas: List[Dict[str, str]],
+    ) -> None:
+        batch_start = time.perf_counter()
+        embeddings = self._create_embeddings(texts)
+        self.collection.add(
+            documents=texts,
+            embeddings=embeddings,
+            metadatas=metadatas,
+            ids=ids,
+        )
+        self._log_batch(document_id, user_id, ids, metadatas)
+        self.logger.info(
+            "Embedded chunk batch",
+            extra={
+                "document_id": document_id,
+                "user_id": user_id,
+                "batch_size": len(texts),
+                "duration_ms": round((time.perf_counter() - batch_start) * 1000, 2),
+            },
+        )
 
-            batch_start = time.perf_counter()
-            embeddings = self._create_embeddings(texts)
+    def copy_document_vectors(self, source_document_id: str, document_id: str, user_id: str) -> int:
+        """复制同一用户已入库文档的向量到新文档（内容相同无需重新计算 embedding），返回复制的 chunk 数。"""
+        result = self.collection.get(
+            where={
+                "$and": [
+                    {"document_id": {"$eq": source_document_id}},
+                    {"user_id": {"$eq": user_id}},
+                ]
+            },
+            include=["metadatas", "documents", "embeddings"],
+        )
+        source_ids = result.get("ids") or []
+        if not source_ids:
+            return 0
+        documents = result.get("documents") or []
+        metadatas = result.get("metadatas") or []
+        embeddings = result.get("embeddings")
+        created_at = _now_iso()
+        prefix = f"{source_document_id}_chunk_"
+        ids: List[str] = []
+        new_metadatas: List[Dict[str, str]] = []
+        for source_id, metadata in zip(source_ids, metadatas):
+            ids.append(f"{document_id}_chunk_{source_id[len(prefix):]}" if source_id.startswith(prefix) else f"{document_id}_{source_id}")
+            metadata = dict(metadata or {})
+            metadata.update({"user_id": user_id, "document_id": document_id, "created_at": created_at})
+            new_metadatas.append(metadata)
+
+        for start in range(0, len(ids), self.batch_size):
+            end = start + self.batch_size
             self.collection.add(
-                documents=texts,
-                embeddings=embeddings,
-                metadatas=metadatas,
-                ids=ids,
-            )
-            self._log_batch(document_id, user_id, ids, metadatas)
-            self.logger.info(
-                "Embedded chunk batch",
-                extra={
-                    "document_id": document_id,
-                    "user_id": user_id,
-                    "batch_size": len(texts),
-                    "duration_ms": round((time.perf_counter() - batch_start) * 1000, 2),
-                },
+                documents=documents[start:end],
+                embeddings=embeddings[start:end],
+                metadatas=new_metadatas[start:end],
+                ids=ids[start:end],
             )
+            self._log_batch(document_id, user_id, ids[start:end], new_metadatas[start:end])
+        self.logger.info(
+            "Copied document vectors",
+            extra={"document_id": document_id, "source_document_id": source_document_id, "chunks": len(ids)},
+        )
+        return len(ids)
 
     def delete_document_vectors(self, document_id: str, user_id: str) -> None:
         try:
@@ -180,30 +248,30 @@ class EmbeddingService:
     def get_document_chunks(self, document_id: str) -> List[Dict]:
         """Get all chunks for a specific document"""
         try:
+            # Embeddings are not returned to callers, so don't transfer them
             result = self.collection.get(
                 where={"document_id": document_id},
-                include=["metadatas", "documents", "embeddings"]
+                include=["metadatas", "documents"]
             )
             
-            chunks = []
             ids = result.get("ids", [])
             metadatas = result.get("metadatas", []) or []
             documents = result.get("documents", []) or []
             
+            # Decorate with the chunk index parsed once per id (format document_id_chunk_N);
+            # ids without one keep their relative order after the indexed chunks
+            decorated = []
             for i, chunk_id in enumerate(ids):
-                chunks.append({
+                position = chunk_id.rpartition("_chunk_")[2]
+                order = (0, int(position)) if position.isdigit() else (1, i)
+                decorated.append((order, {
                     "id": chunk_id,
                     "text": documents[i] if i < len(documents) else "",
                     "metadata": metadatas[i] if i < len(metadatas) else {},
-                })
-            
-            # Sort by chunk index if possible (assuming id format document_id_chunk_N)
-            try:
-                chunks.sort(key=lambda x: int(x["id"].split("_chunk_")[-1]))
-            except (ValueError, IndexError):
-                pass
+                }))
+            decorated.sort(key=itemgetter(0))
                 
-            return chunks
+            return [chunk for _, chunk in decorated]
         except Exception as e:
             self.logger.error(f"Failed to get chunks for document {document_id}", exc_info=True)
             return []
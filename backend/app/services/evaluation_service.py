@@ -1,16 +1,19 @@
 """RAG Evaluation Service using RAGAS framework."""
 from __future__ import annotations
 
-import json
+import asyncio
+import hashlib
 import logging
 from dataclasses import dataclass
 from datetime import datetime
 from pathlib import Path
-from typing import Any, Dict, List, Optional
+from typing import Any, Callable, Dict, List, Optional, Protocol, Tuple
 
+import orjson
 from ragas import EvaluationDataset, SingleTurnSample, evaluate
 from ragas.llms import LangchainLLMWrapper
 from ragas.embeddings import LangchainEmbeddingsWrapper
+from ragas.run_config import RunConfig
 from ragas.metrics import (
     Faithfulness,
     ResponseRelevancy,
@@ -21,6 +24,16 @@ from ragas.metrics import (
 from ..core.config import get_settings
 
 
+class AnswerCache(Protocol):
+    """Key/value store for agent answers, keyed by ``_answer_cache_key``."""
+
+    def get(self, key: str) -> Optional[Dict[str, Any]]:
+        ...
+
+    def set(self, key: str, value: Dict[str, Any]) -> None:
+        ...
+
+
 @dataclass
 class EvaluationSample:
     """A single evaluation sample."""
@@ -46,11 +59,65 @@ class EvaluationResult:
     embedding_model: str = ""
 
 
+class _BatchedEmbeddings:
+    """Embeddings adapter that memoizes vectors and batches document calls.
+
+    ResponseRelevancy embeds every sample's question plus its generated
+    questions, which are frequently identical strings. Each distinct text is
+    embedded once per service instance, and ``embed_documents`` sends only
+    the unseen texts, ``batch_size`` at a time. Query and document vectors are
+    cached separately because some providers embed them differently.
+    """
+
+    def __init__(self, embeddings: Any, batch_size: int = 64):
+        self.embeddings = embeddings
+        self.batch_size = max(1, batch_size)
+        self._query_vectors: Dict[str, List[float]] = {}
+        self._document_vectors: Dict[str, List[float]] = {}
+
+    def __getattr__(self, name: str) -> Any:
+        # Anything else (model name, timeouts, ...) comes from the real client
+        if name == "embeddings":
+            raise AttributeError(name)
+        return getattr(self.embeddings, name)
+
+    def _missing(self, texts: List[str]) -> List[str]:
+        return list(dict.fromkeys(t for t in texts if t not in self._document_vectors))
+
+    def embed_query(self, text: str) -> List[float]:
+        vector = self._query_vectors.get(text)
+        if vector is None:
+            vector = self._query_vectors[text] = self.embeddings.embed_query(text)
+        return vector
+
+    async def aembed_query(self, text: str) -> List[float]:
+        vector = self._query_vectors.get(text)
+        if vector is None:
+            vector = self._query_vectors[text] = await self.embeddings.aembed_query(text)
+        return vector
+
+    def embed_documents(self, texts: List[str]) -> List[List[float]]:
+        missing = self._missing(texts)
+        for start in range(0, len(missing), self.batch_size):
+            batch = missing[start:start + self.batch_size]
+            self._document_vectors.update(zip(batch, self.embeddings.embed_documents(batch)))
+        return [self._document_vectors[t] for t in texts]
+
+    async def aembed_documents(self, texts: List[str]) -> List[List[float]]:
+        missing = self._missing(texts)
+        batches = [missing[start:start + self.batch_size] for start in range(0, len(missing), self.batch_size)]
+        vectors = await asyncio.gather(*(self.embeddings.aembed_documents(batch) for batch in batches))
+        for batch, batch_vectors in zip(batches, vectors):
+            self._document_vectors.update(zip(batch, batch_vectors))
+        return [self._document_vectors[t] for t in texts]
+
+
 class RAGEvaluationService:
     """Service for evaluating RAG pipeline quality using RAGAS."""
 
-    def __init__(self):
+    def __init__(self, embed_batch_size: int = 64):
         self.settings = get_settings()
+        self.embed_batch_size = embed_batch_size
         self.logger = logging.getLogger("app.services.evaluation")
         self._llm = None
         self._embeddings = None
@@ -89,24 +156,60 @@ class RAGEvaluationService:
                     model=self.settings.embedding_model_openai,
                     api_key=self.settings.openai_api_key,
                 )
-            self._embeddings = LangchainEmbeddingsWrapper(embeddings)
+            self._embeddings = LangchainEmbeddingsWrapper(
+                _BatchedEmbeddings(embeddings, batch_size=self.embed_batch_size)
+            )
         return self._embeddings
 
+    def _answer_cache_key(self, question: str, user_id: str) -> str:
+        """Cache key for an agent answer.
+
+        Covers the question, the user, every setting (models, retrieval
+        weights, top-k, rerank options, ...) and the agent system prompt, so
+        a pipeline configuration change misses the cache. Document changes
+        and agent code changes are not detected, which is why the cache is
+        opt-in.
+        """
+        from ..agent.prompts import REACT_AGENT_SYSTEM_PROMPT
+
+        payload = orjson.dumps(
+            [question, user_id, self.settings.model_dump(mode="json"), REACT_AGENT_SYSTEM_PROMPT],
+            option=orjson.OPT_SORT_KEYS,
+        )
+        return hashlib.sha256(payload).hexdigest()
+
     def evaluate_samples(
         self,
         samples: List[EvaluationSample],
         include_ground_truth: bool = False,
+        judge_concurrency: int = 16,
     ) -> EvaluationResult:
         """
         Evaluate a list of RAG samples.
         
+        RAGAS scores every (sample, metric) pair as an independent async job;
+        ``judge_concurrency`` caps how many judge/embedding calls are in flight,
+        so it can be raised up to the provider's rate limit (or lowered for
+        tightly rate-limited judges).
+        
         Args:
             samples: List of EvaluationSample objects
             include_ground_truth: Whether to include context_recall (requires ground_truth)
+            judge_concurrency: Maximum concurrent RAGAS metric jobs
         
         Returns:
             EvaluationResult with metrics
         """
+        df = self._score_samples(samples, include_ground_truth, judge_concurrency)
+        return self._summarize(df, include_ground_truth, len(samples))
+
+    def _score_samples(
+        self,
+        samples: List[EvaluationSample],
+        include_ground_truth: bool,
+        judge_concurrency: int,
+    ):
+        """Run RAGAS over ``samples`` and return the per-sample scores DataFrame."""
         # Build RAGAS dataset
         ragas_samples = []
         for sample in samples:
@@ -138,11 +241,14 @@ class RAGEvaluationService:
             metrics=metrics,
             llm=self._get_llm(),
             embeddings=self._get_embeddings(),
+            run_config=RunConfig(max_workers=max(1, judge_concurrency)),
         )
+        return result.to_pandas()
 
+    def _summarize(self, df, include_ground_truth: bool, sample_count: int) -> EvaluationResult:
+        """Aggregate a per-sample scores DataFrame into an EvaluationResult."""
         # Extract scores (fill NaN with 0 before calculating mean)
-        df = result.to_pandas()
-        
+
         if "faithfulness" in df:
             faithfulness = df["faithfulness"].fillna(0.0).mean()
         else:
@@ -186,7 +292,7 @@ class RAGEvaluationService:
             context_precision=round(context_precision, 4),
             context_recall=round(context_recall, 4) if context_recall else None,
             overall_score=round(overall_score, 4),
-            sample_count=len(samples),
+            sample_count=sample_count,
             timestamp=datetime.utcnow().isoformat(),
             details=details,
             judge_model=judge_model,
@@ -198,6 +304,41 @@ class RAGEvaluationService:
         user_id: str,
         test_questions: List[str],
         ground_truths: Optional[List[str]] = None,
+        max_concurrency: int = 4,
+        judge_concurrency: int = 16,
+        answer_cache: Optional[AnswerCache] = None,
+        batch_size: Optional[int] = None,
+        on_sample_done: Optional[Callable[[int], None]] = None,
+    ) -> EvaluationResult:
+        """
+        Evaluate Agent with test questions.
+        
+        Synchronous wrapper around :meth:`aevaluate_from_agent`; see there for
+        the concurrency model.
+        """
+        return asyncio.run(
+            self.aevaluate_from_agent(
+                user_id=user_id,
+                test_questions=test_questions,
+                ground_truths=ground_truths,
+                max_concurrency=max_concurrency,
+                judge_concurrency=judge_concurrency,
+                answer_cache=answer_cache,
+                batch_size=batch_size,
+                on_sample_done=on_sample_done,
+            )
+        )
+
+    async def aevaluate_from_agent(
+        self,
+        user_id: str,
+        test_questions: List[str],
+        ground_truths: Optional[List[str]] = None,
+        max_concurrency: int = 4,
+        judge_concurrency: int = 16,
+        answer_cache: Optional[AnswerCache] = None,
+        batch_size: Optional[int] = None,
+        on_sample_done: Optional[Callable[[int], None]] = None,
     ) -> EvaluationResult:
         """
         Evaluate Agent with test questions.
@@ -207,71 +348,135 @@ class RAGEvaluationService:
         
         Note: Agent searches across ALL user documents, no document_id needed.
         
+        Questions are dispatched together with ``asyncio.gather`` and an
+        ``asyncio.Semaphore`` keeps at most ``max_concurrency`` in flight. The
+        agent awaits its LLM calls and runs tools in worker threads, so the
+        questions overlap on this one event loop. Samples keep the order of
+        ``test_questions``.
+        
+        With ``answer_cache``, questions answered by an earlier run with the
+        same settings and agent prompt are read back instead of re-running the
+        agent; failed answers are never cached.
+        
+        With ``batch_size``, questions are answered a batch at a time and each
+        finished batch is scored by RAGAS while the agent answers the next one,
+        overlapping the answer and judge phases on large datasets. Scores are
+        aggregated over all samples exactly as in a single pass.
+        
         Args:
             user_id: User ID for access control
             test_questions: List of test questions
             ground_truths: Optional list of expected answers
+            max_concurrency: Maximum number of questions answered at once
+            judge_concurrency: Maximum concurrent RAGAS metric jobs
+            answer_cache: Optional store of previous agent answers
+            batch_size: Questions per answer/judge batch (default: one batch)
+            on_sample_done: Called with the question index as each answer
+                (success, failure or cache hit) completes, e.g. for progress bars
         
         Returns:
             EvaluationResult
+        
+        Raises:
+            ValueError: If ``test_questions`` is empty
         """
-        from ..agent.react_agent import ReActAgent
+        if not test_questions:
+            raise ValueError("No test questions to evaluate")
+        
         from .agent_service import AgentService
-        import asyncio
         
         # Use AgentService which properly initializes all tools
         agent_service = AgentService()
-        samples = []
-        answer_model = "unknown"
+        total = len(test_questions)
+        semaphore = asyncio.Semaphore(max(1, max_concurrency))
         
-        for i, question in enumerate(test_questions):
-            print(f"[{i+1}/{len(test_questions)}] Q: {question[:50]}...")
-            
+        async def answer(i: int, question: str) -> Tuple[EvaluationSample, Optional[str]]:
+            ground_truth = ground_truths[i] if ground_truths and i < len(ground_truths) else None
+            cache_key = None
+            if answer_cache is not None:
+                cache_key = self._answer_cache_key(question, user_id)
+                cached = answer_cache.get(cache_key)
+                if cached is not None:
+                    self.logger.debug(f"[{i+1}/{total}] {question[:50]}... (cached)")
+                    return EvaluationSample(
+                        question=question,
+                        answer=cached["answer"],
+                        contexts=cached["contexts"],
+                        ground_truth=ground_truth,
+                    ), cached.get("model")
             try:
-                # agent_service.chat() is async
-                response = asyncio.get_event_loop().run_until_complete(
-                    agent_service.chat(
-                        query=question,
-                        user_id=user_id,
-                    )
-                )
-                
-                # Extract contexts from sources
-                contexts = []
-                for source in response.sources:
-                    if isinstance(source, dict) and "text" in source:
-                        contexts.append(source["text"])
-                    elif isinstance(source, str):
-                        contexts.append(source)
-                
-                answer_model = response.model_used
-                
-                sample = EvaluationSample(
-                    question=question,
-                    answer=response.answer,
-                    contexts=contexts,
-                    ground_truth=ground_truths[i] if ground_truths and i < len(ground_truths) else None,
-                )
-                samples.append(sample)
-                
-                print(f"  ✓ Answer: {response.answer[:60]}...")
-                print(f"  📚 Sources: {len(contexts)} chunks")
-                
+                async with semaphore:
+                    response = await agent_service.chat(query=question, user_id=user_id)
             except Exception as e:
                 self.logger.error(f"Agent evaluation failed for question: {question[:50]}...: {e}")
-                print(f"  ❌ Error: {e}")
                 # Add empty sample to maintain alignment with ground_truths
-                samples.append(EvaluationSample(
+                return EvaluationSample(
                     question=question,
                     answer=f"Error: {str(e)}",
                     contexts=[],
-                    ground_truth=ground_truths[i] if ground_truths and i < len(ground_truths) else None,
-                ))
+                    ground_truth=ground_truth,
+                ), None
+            
+            # Extract contexts from sources
+            contexts = []
+            for source in response.sources:
+                if isinstance(source, dict) and "text" in source:
+                    contexts.append(source["text"])
+                elif isinstance(source, str):
+                    contexts.append(source)
+            
+            self.logger.debug(f"[{i+1}/{total}] {question[:50]}... ({len(contexts)} chunks)")
+            if cache_key is not None:
+                answer_cache.set(cache_key, {
+                    "answer": response.answer,
+                    "contexts": contexts,
+                    "model": response.model_used,
+                })
+            return EvaluationSample(
+                question=question,
+                answer=response.answer,
+                contexts=contexts,
+                ground_truth=ground_truth,
+            ), response.model_used
         
-        result = self.evaluate_samples(
-            samples=samples,
-            include_ground_truth=bool(ground_truths),
-        )
+        async def tracked(i: int) -> Tuple[EvaluationSample, Optional[str]]:
+            outcome = await answer(i, test_questions[i])
+            if on_sample_done is not None:
+                on_sample_done(i)
+            return outcome
+        
+        include_ground_truth = bool(ground_truths)
+        step = batch_size if batch_size and batch_size > 0 else total
+        outcomes: List[Tuple[EvaluationSample, Optional[str]]] = []
+        scores = []
+        judging = None
+        
+        for start in range(0, total, step):
+            batch = await asyncio.gather(
+                *(tracked(i) for i in range(start, min(start + step, total)))
+            )
+            outcomes.extend(batch)
+            # One batch is judged at a time, overlapping the next batch's answers
+            if judging is not None:
+                scores.append(await judging)
+            # RAGAS evaluate() drives its own event loop; keep it off this one
+            judging = asyncio.ensure_future(asyncio.to_thread(
+                self._score_samples,
+                [sample for sample, _ in batch],
+                include_ground_truth,
+                judge_concurrency,
+            ))
+        if judging is not None:
+            scores.append(await judging)
+        
+        if len(scores) == 1:
+            df = scores[0]
+        else:
+            import pandas as pd
+            df = pd.concat(scores, ignore_index=True)
+        
+        answer_model = next((model for _, model in reversed(outcomes) if model), "unknown")
+        result = self._summarize(df, include_ground_truth, total)
         result.answer_model = answer_model
         return result
 
@@ -297,8 +502,8 @@ class RAGEvaluationService:
             "details": result.details,
         }
         
-        output_path.write_text(
-            json.dumps(data, ensure_ascii=False, indent=2),
-            encoding="utf-8",
+        # orjson writes UTF-8 bytes directly and turns NaN scores into null
+        output_path.write_bytes(
+            orjson.dumps(data, option=orjson.OPT_INDENT_2 | orjson.OPT_SERIALIZE_NUMPY)
         )
         self.logger.info(f"Saved evaluation results to {output_path}")
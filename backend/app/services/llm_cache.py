@@ -0,0 +1,127 @@
+"""LLM 响应缓存：对确定性较强的 LLM 调用（低温度、相同提示）按请求内容缓存结果。
+
+用法::
+
+    cache = get_llm_cache()
+    key = LLMCache.cache_key(model, messages, temperature, response_format)
+    content = cache.get(key) if cache else None
+    if content is None:
+        content = call_llm(...)
+        if cache:
+            cache.set(key, content)
+"""
+from __future__ import annotations
+
+import hashlib
+import json
+import logging
+import threading
+import time
+from collections import OrderedDict
+from functools import lru_cache
+from typing import Any, Dict, List, Optional, Protocol, Tuple
+
+from ..core.config import get_settings
+
+logger = logging.getLogger("app.services.llm_cache")
+
+
+class CacheBackend(Protocol):
+    """缓存后端协议；CacheService（Redis）天然满足该接口，layer 用于其命中率统计。"""
+
+    def get(self, key: str, layer: Optional[str] = None) -> Optional[str]:
+        ...
+
+    def set(self, key: str, value: str, ttl: int, layer: Optional[str] = None) -> None:
+        ...
+
+
+class MemoryCacheBackend:
+    """进程内 LRU + TTL 缓存，线程安全。"""
+
+    def __init__(self, max_entries: int = 1024):
+        self.max_entries = max_entries
+        self._entries: "OrderedDict[str, Tuple[float, str]]" = OrderedDict()
+        self._lock = threading.Lock()
+
+    def get(self, key: str, layer: Optional[str] = None) -> Optional[str]:
+        with self._lock:
+            entry = self._entries.get(key)
+            if entry is None:
+                return None
+            expires_at, value = entry
+            if expires_at <= time.monotonic():
+                del self._entries[key]
+                return None
+            self._entries.move_to_end(key)
+            return value
+
+    def set(self, key: str, value: str, ttl: int, layer: Optional[str] = None) -> None:
+        with self._lock:
+            self._entries[key] = (time.monotonic() + ttl, value)
+            self._entries.move_to_end(key)
+            while len(self._entries) > self.max_entries:
+                self._entries.popitem(last=False)
+
+
+class LLMCache:
+    """按 (model, messages, temperature, response_format) 的 SHA-256 缓存 LLM 文本输出。"""
+
+    LAYER = "llm"
+
+    def __init__(self, backend: CacheBackend, ttl: int = 3600):
+        self.backend = backend
+        self.ttl = ttl
+
+    @staticmethod
+    def cache_key(
+        model: str,
+        messages: List[Dict[str, Any]],
+        temperature: float,
+        response_format: Optional[Dict[str, Any]] = None,
+    ) -> str:
+        payload = json.dumps(
+            {
+                "model": model,
+                "messages": messages,
+                "temperature": temperature,
+                "response_format": response_format,
+            },
+            sort_keys=True,
+            ensure_ascii=False,
+        )
+        return "llm:" + hashlib.sha256(payload.encode("utf-8")).hexdigest()
+
+    def get(self, key: str) -> Optional[str]:
+        try:
+            return self.backend.get(key, layer=self.LAYER)
+        except Exception:  # 缓存故障不影响主流程
+            logger.warning("LLM cache read failed", exc_info=True)
+            return None
+
+    def set(self, key: str, content: str) -> None:
+        try:
+            self.backend.set(key, content, self.ttl, layer=self.LAYER)
+        except Exception:
+            logger.warning("LLM cache write failed", exc_info=True)
+
+
+@lru_cache(maxsize=1)
+def get_llm_cache() -> Optional[LLMCache]:
+    """根据配置返回全局 LLMCache；llm_cache_backend 为 none 时返回 None。"""
+    settings = get_settings()
+    backend_name = (settings.llm_cache_backend or "none").lower()
+    if backend_name == "memory":
+        return LLMCache(MemoryCacheBackend(), ttl=settings.llm_cache_ttl)
+    if backend_name == "redis":
+        from .cache_service import CacheService
+
+        try:
+            return LLMCache(CacheService(metric_layers=[LLMCache.LAYER]), ttl=settings.llm_cache_ttl)
+        except Exception:
+            logger.warning("Redis LLM cache unavailable, caching disabled", exc_info=True)
+            return None
+    return None
+
+
+__all__ = ["CacheBackend", "LLMCache", "MemoryCacheBackend", "get_llm_cache"]
@@ -0,0 +1,60 @@
+"""进程级共享的 OpenAI 客户端。
+
+所有服务（检索、向量化、意图路由、Agent、表格摘要）复用同一个同步客户端及其
+httpx 连接池（SDK 默认上限 1000 连接 / 100 keep-alive），避免每个实例各自建立 TCP + TLS 连接；
+异步客户端的连接池绑定创建它的事件循环，因此按事件循环各持有一个（评估脚本、Celery 任务会
+多次 ``asyncio.run``）。请求超时与重试次数由配置统一控制（SDK 默认 600 秒超时过长）。
+
+用法::
+
+    from app.services.openai_client import get_async_client, get_openai_client
+
+    response = await get_async_client().embeddings.create(model=..., input=[...])
+"""
+from __future__ import annotations
+
+import asyncio
+import weakref
+from typing import Optional
+
+from openai import AsyncOpenAI, OpenAI, Timeout
+
+from ..core.config import get_settings
+
+
+def _client_options() -> dict:
+    settings = get_settings()
+    return {
+        # 未配置时传 None，由 SDK 读取 OPENAI_API_KEY 环境变量
+        "api_key": settings.openai_api_key or None,
+        "timeout": Timeout(settings.openai_timeout, connect=5.0),
+        "max_retries": settings.openai_max_retries,
+    }
+
+
+# 进程内共享的同步客户端：首次使用时创建，之后所有调用方复用同一连接池
+_OPENAI_CLIENT: Optional[OpenAI] = None
+# 异步客户端按事件循环缓存；事件循环被回收后条目自动清除
+_async_openai_clients: "weakref.WeakKeyDictionary[asyncio.AbstractEventLoop, AsyncOpenAI]" = (
+    weakref.WeakKeyDictionary()
+)
+
+
+def get_openai_client() -> OpenAI:
+    """获取进程级共享的 OpenAI 客户端（懒加载）"""
+    global _OPENAI_CLIENT
+    if _OPENAI_CLIENT is None:
+        _OPENAI_CLIENT = OpenAI(**_client_options())
+    return _OPENAI_CLIENT
+
+
+def get_async_client() -> AsyncOpenAI:
+    """获取当前事件循环共享的 AsyncOpenAI 客户端（懒加载，须在协程内调用）"""
+    loop = asyncio.get_running_loop()
+    client = _async_openai_clients.get(loop)
+    if client is None or client.is_closed():
+        client = _async_openai_clients[loop] = AsyncOpenAI(**_client_options())
+    return client
+
+
+__all__ = ["get_async_client", "get_openai_client"]
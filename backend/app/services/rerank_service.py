@@ -15,16 +15,45 @@ Rerank Service Module
 
 from __future__ import annotations
 
+import asyncio
 import logging
+import threading
 import time
+import weakref
 from abc import ABC, abstractmethod
+from operator import itemgetter
 from typing import Any, Dict, List, Optional
 
+import httpx
+import orjson
+
 from ..core.config import get_settings
 
 
 logger = logging.getLogger("app.services.rerank")
 
+_EMPTY_METADATA: Dict[str, Any] = {}
+
+
+# 按事件循环共享的异步 HTTP 客户端（连接池复用，供 API 类 reranker 使用）。
+# httpx 连接池绑定创建它的事件循环，而 Celery 任务和同步包装会多次 asyncio.run，
+# 因此每个运行中的事件循环各用一个客户端；循环被回收后对应条目自动移除。
+_async_http_clients: "weakref.WeakKeyDictionary[asyncio.AbstractEventLoop, httpx.AsyncClient]" = (
+    weakref.WeakKeyDictionary()
+)
+
+
+def get_async_http_client() -> httpx.AsyncClient:
+    """获取当前事件循环共享的 httpx.AsyncClient（懒加载，须在协程内调用）"""
+    loop = asyncio.get_running_loop()
+    client = _async_http_clients.get(loop)
+    if client is None or client.is_closed:
+        client = _async_http_clients[loop] = httpx.AsyncClient(
+            limits=httpx.Limits(max_connections=64, max_keepalive_connections=32),
+            timeout=httpx.Timeout(30.0, connect=5.0),
+        )
+    return client
+
 
 class RerankResult:
     """重排序结果"""
@@ -80,6 +109,19 @@ class BaseReranker(ABC):
         """
         pass
     
+    async def _arerank_impl(
+        self,
+        query: str,
+        documents: List[str],
+        top_n: int,
+    ) -> List[RerankResult]:
+        """
+        异步重排序实现
+        
+        默认在线程池中执行同步实现；基于网络 API 的子类可覆盖为原生异步调用。
+        """
+        return await asyncio.to_thread(self._rerank_impl, query, documents, top_n)
+    
     def rerank(
         self,
         query: str,
@@ -119,6 +161,35 @@ class BaseReranker(ABC):
         
         return results
     
+    async def arerank(
+        self,
+        query: str,
+        documents: List[str],
+        top_n: int = 5,
+    ) -> List[RerankResult]:
+        """rerank() 的异步版本"""
+        if not documents:
+            return []
+        
+        top_n = min(top_n, len(documents))
+        
+        start = time.perf_counter()
+        results = await self._arerank_impl(query, documents, top_n)
+        duration = time.perf_counter() - start
+        
+        self.logger.info(
+            f"{self.name} rerank completed",
+            extra={
+                "reranker": self.name,
+                "query_length": len(query),
+                "input_docs": len(documents),
+                "output_docs": len(results),
+                "duration_ms": round(duration * 1000, 2),
+            },
+        )
+        
+        return results
+    
     def rerank_chunks(
         self,
         query: str,
@@ -139,12 +210,59 @@ class BaseReranker(ABC):
         if not chunks:
             return []
         
-        documents = [chunk.get("text", "") for chunk in chunks]
+        documents, representatives = self._dedupe_documents(chunks)
         results = self.rerank(query, documents, top_n)
+        return self._attach_scores(chunks, results, representatives)
+    
+    async def arerank_chunks(
+        self,
+        query: str,
+        chunks: List[Dict],
+        top_n: int = 5,
+    ) -> List[Dict]:
+        """rerank_chunks() 的异步版本"""
+        if not chunks:
+            return []
+        
+        documents, representatives = self._dedupe_documents(chunks)
+        results = await self.arerank(query, documents, top_n)
+        return self._attach_scores(chunks, results, representatives)
+    
+    def _dedupe_documents(self, chunks: List[Dict]) -> tuple[List[str], List[int]]:
+        """
+        按归一化文本（折叠空白、小写）去重，避免重复文本占用 reranker 调用和 top_n 名额
         
+        Returns:
+            (唯一文档列表, 每个唯一文档对应的代表 chunk 下标，即首次出现的位置)
+        """
+        documents: List[str] = []
+        representatives: List[int] = []
+        seen: set = set()
+        for idx, chunk in enumerate(chunks):
+            text = chunk.get("text") or ""
+            key = " ".join(text.split()).lower()
+            if key not in seen:
+                seen.add(key)
+                documents.append(text)
+                representatives.append(idx)
+        
+        if len(documents) < len(chunks):
+            self.logger.debug(
+                "Deduplicated rerank candidates",
+                extra={"input_docs": len(chunks), "unique_docs": len(documents)},
+            )
+        return documents, representatives
+    
+    @staticmethod
+    def _attach_scores(
+        chunks: List[Dict],
+        results: List[RerankResult],
+        representatives: List[int],
+    ) -> List[Dict]:
+        """按重排序结果复制代表 chunk 并写入 rerank_score（每组重复文本只保留一个）"""
         reranked_chunks: List[Dict] = []
         for result in results:
-            chunk = chunks[result.index].copy()
+            chunk = chunks[representatives[result.index]].copy()
             chunk["rerank_score"] = result.relevance_score
             reranked_chunks.append(chunk)
         
@@ -167,6 +285,21 @@ class JinaReranker(BaseReranker):
     def name(self) -> str:
         return "JinaReranker"
     
+    def _headers(self) -> Dict[str, str]:
+        return {
+            "Content-Type": "application/json",
+            "Authorization": f"Bearer {self.api_key}",
+        }
+    
+    def _payload(self, query: str, documents: List[str], top_n: int) -> Dict[str, Any]:
+        return {
+            "model": self.MODEL,
+            "query": query,
+            "top_n": top_n,
+            "documents": documents,
+            "return_documents": False,
+        }
+    
     def _rerank_impl(
         self,
         query: str,
@@ -178,17 +311,8 @@ class JinaReranker(BaseReranker):
         try:
             response = requests.post(
                 self.ENDPOINT,
-                headers={
-                    "Content-Type": "application/json",
-                    "Authorization": f"Bearer {self.api_key}",
-                },
-                json={
-                    "model": self.MODEL,
-                    "query": query,
-                    "top_n": top_n,
-                    "documents": documents,
-                    "return_documents": False,
-                },
+                headers=self._headers(),
+                data=orjson.dumps(self._payload(query, documents, top_n)),
                 timeout=30,
             )
             response.raise_for_status()
@@ -199,7 +323,31 @@ class JinaReranker(BaseReranker):
             self.logger.warning(f"Jina API request failed: {e}{error_detail}")
             raise
         
-        data = response.json()
+        return self._parse_results(orjson.loads(response.content))
+    
+    async def _arerank_impl(
+        self,
+        query: str,
+        documents: List[str],
+        top_n: int,
+    ) -> List[RerankResult]:
+        try:
+            response = await get_async_http_client().post(
+                self.ENDPOINT,
+                headers=self._headers(),
+                content=orjson.dumps(self._payload(query, documents, top_n)),
+            )
+            response.raise_for_status()
+        except httpx.HTTPError as e:
+            error_detail = ""
+            if isinstance(e, httpx.HTTPStatusError):
+                error_detail = f" | Status: {e.response.status_code} | Response: {e.response.text[:300]}"
+            self.logger.warning(f"Jina API request failed: {e}{error_detail}")
+            raise
+        
+        return self._parse_results(orjson.loads(response.content))
+    
+    def _parse_results(self, data: Dict[str, Any]) -> List[RerankResult]:
         results: List[RerankResult] = []
         for item in data.get("results", []):
             results.append(
@@ -265,51 +413,53 @@ class RuleBasedReranker(BaseReranker):
         
         这是原来 rag_service 中的实现，保留用于兼容
         """
-        if not chunks:
+        if not chunks or top_n <= 0:
             return []
         
-        section_groups: Dict[str, List[Dict]] = {}
+        # 单次遍历完成按章节分组：累计距离和、是否含表格、(chunk_index, chunk)
+        section_groups: Dict[str, list] = {}
         for chunk in chunks:
-            section = chunk.get("metadata", {}).get("section_path", "unknown")
-            section_groups.setdefault(section, []).append(chunk)
+            metadata = chunk.get("metadata") or _EMPTY_METADATA
+            section = metadata.get("section_path", "unknown")
+            group = section_groups.get(section)
+            if group is None:
+                group = section_groups[section] = [0.0, False, []]
+            group[0] += chunk.get("distance", 1.0)
+            if metadata.get("element_type") == "table":
+                group[1] = True
+            group[2].append((int(metadata.get("chunk_index", 0)), chunk))
 
+        wants_table = "表格" in query or "table" in query.lower()
         scores: List[tuple[str, float]] = []
 
-        for section, section_chunks in section_groups.items():
+        for section, (distance_sum, has_table, members) in section_groups.items():
             # 1. Base score from average distance
-            distances = [c.get("distance", 1.0) for c in section_chunks]
-            avg_distance = sum(distances) / len(distances)
-            score = avg_distance
+            score = distance_sum / len(members)
 
             # 2. Boost core sections by 30% (lower distance = higher rank)
             if any(core in section for core in self.CORE_SECTIONS):
                 score *= 0.7
 
             # 3. Only boost tables if question explicitly asks about them
-            has_table = any(
-                c.get("metadata", {}).get("element_type") == "table"
-                for c in section_chunks
-            )
-            if "表格" in query or "table" in query.lower():
-                if has_table:
-                    score *= 0.8
+            if wants_table and has_table:
+                score *= 0.8
 
             scores.append((section, score))
 
-        scores.sort(key=lambda item: item[1])
+        scores.sort(key=itemgetter(1))
 
         reranked: List[Dict] = []
         for section, section_score in scores:
-            section_chunks = sorted(
-                section_groups[section],
-                key=lambda c: int(c.get("metadata", {}).get("chunk_index", 0)),
-            )
-            for chunk in section_chunks:
+            members = section_groups[section][2]
+            members.sort(key=itemgetter(0))
+            for _, chunk in members:
                 chunk_copy = chunk.copy()
                 chunk_copy["rerank_score"] = 1.0 - section_score  # 转换为相关性分数
                 reranked.append(chunk_copy)
+                if len(reranked) >= top_n:
+                    return reranked
 
-        return reranked[:top_n]
+        return reranked
 
 
 # TODO: 实现 BGE Reranker (本地模型)
@@ -321,28 +471,46 @@ class BGEReranker(BaseReranker):
     模型: BAAI/bge-reranker-v2-m3 或 BAAI/bge-reranker-large
     """
     
+    # 已加载的模型按名称在进程内共享：预热一次后，所有实例直接复用
+    _models: Dict[str, Any] = {}
+    _load_lock = threading.Lock()
+    
     def __init__(self, model_name: str = "BAAI/bge-reranker-v2-m3"):
         super().__init__()
         self.model_name = model_name
-        self._model = None
     
     @property
     def name(self) -> str:
         return f"BGEReranker({self.model_name})"
     
     def _load_model(self):
-        """懒加载模型"""
-        if self._model is None:
-            try:
-                from FlagEmbedding import FlagReranker
-                self._model = FlagReranker(self.model_name, use_fp16=True)
+        """懒加载模型（进程内只加载一次）"""
+        model = self._models.get(self.model_name)
+        if model is not None:
+            return model
+        with self._load_lock:
+            model = self._models.get(self.model_name)
+            if model is None:
+                try:
+                    from FlagEmbedding import FlagReranker
+                except ImportError:
+                    raise ImportError(
+                        "FlagEmbedding is required for BGE reranker. "
+                        "Install with: pip install FlagEmbedding"
+                    )
+                model = FlagReranker(self.model_name, use_fp16=True)
+                self._models[self.model_name] = model
                 self.logger.info(f"Loaded BGE reranker model: {self.model_name}")
-            except ImportError:
-                raise ImportError(
-                    "FlagEmbedding is required for BGE reranker. "
-                    "Install with: pip install FlagEmbedding"
-                )
-        return self._model
+        return model
+    
+    def warmup(self) -> None:
+        """加载模型并执行一次推理，避免首个真实查询承担冷启动开销"""
+        start = time.perf_counter()
+        self._rerank_impl("warmup", ["warmup"], 1)
+        self.logger.info(
+            f"{self.name} warmed up",
+            extra={"duration_ms": round((time.perf_counter() - start) * 1000, 2)},
+        )
     
     def _rerank_impl(
         self,
@@ -403,6 +571,21 @@ class FallbackReranker(BaseReranker):
                 extra={"error": str(e)},
             )
             return self.fallback._rerank_impl(query, documents, top_n)
+    
+    async def _arerank_impl(
+        self,
+        query: str,
+        documents: List[str],
+        top_n: int,
+    ) -> List[RerankResult]:
+        try:
+            return await self.primary._arerank_impl(query, documents, top_n)
+        except Exception as e:
+            self.logger.warning(
+                f"Primary reranker {self.primary.name} failed, using fallback: {e}",
+                extra={"error": str(e)},
+            )
+            return await self.fallback._arerank_impl(query, documents, top_n)
 
 
 def get_reranker(provider: Optional[str] = None) -> BaseReranker:
@@ -447,3 +630,28 @@ def get_reranker(provider: Optional[str] = None) -> BaseReranker:
     
     else:
         raise ValueError(f"Unknown reranker provider: {provider}")
+
+
+def warmup_reranker_in_background() -> Optional[threading.Thread]:
+    """
+    在后台线程中预热本地模型 reranker
+    
+    仅当配置使用 bge（本地模型）时生效；API 类 reranker 无需预热。
+    
+    Returns:
+        预热线程；无需预热时返回 None
+    """
+    settings = get_settings()
+    provider = (getattr(settings, "rerank_provider", "jina") or "jina").lower()
+    if not settings.rerank_enabled or provider != "bge":
+        return None
+    
+    def _run() -> None:
+        try:
+            BGEReranker().warmup()
+        except Exception as e:
+            logger.warning(f"BGE reranker warmup failed: {e}", extra={"error": str(e)})
+    
+    thread = threading.Thread(target=_run, name="reranker-warmup", daemon=True)
+    thread.start()
+    return thread
@@ -16,12 +16,17 @@ Retrieval Service Module
         top_k=10,
         rerank_top_n=5,
     )
+    
+    # 在异步上下文中（如 FastAPI 路由）使用非阻塞版本
+    chunks = await retrieval.retrieve_async(query="什么是比特币", user_id="user123")
 """
 
 from __future__ import annotations
 
+import asyncio
 import logging
 import time
+from functools import lru_cache
 from typing import Any, Dict, List, Literal, Optional
 
 import chromadb
@@ -38,7 +43,8 @@ from ..logging_utils import bind_document_context
 from ..agent.retrieval.bm25_store import BM25IndexStore
 from ..agent.retrieval.hybrid_retriever import HybridRetriever, RetrievalResult
 from .cache_service import CacheService, chunks_cache_key
-from .rerank_service import get_reranker, RuleBasedReranker
+from .openai_client import get_async_client, get_openai_client
+from .rerank_service import BaseReranker, get_reranker, RuleBasedReranker
 
 
 logger = logging.getLogger("app.services.retrieval")
@@ -48,6 +54,32 @@ logger = logging.getLogger("app.services.retrieval")
 RetrievalMode = Literal["vector", "hybrid"]
 
 
+# 进程内共享的 Gemini 客户端；OpenAI 客户端由 openai_client 模块统一管理
+_GEMINI_CLIENTS: Dict[str, "genai.Client"] = {}  # type: ignore
+
+
+def _get_gemini_client(api_key: str) -> "genai.Client":  # type: ignore
+    """获取进程级共享的 Gemini 客户端（懒加载，按 API key 区分）"""
+    client = _GEMINI_CLIENTS.get(api_key)
+    if client is None:
+        client = _GEMINI_CLIENTS[api_key] = genai.Client(api_key=api_key)
+    return client
+
+
+@lru_cache(maxsize=1024)
+def _build_where_clause(user_id: str, document_id: Optional[str] = None) -> Dict[str, Any]:
+    """
+    构建 Chroma 元数据过滤条件（按 user_id/document_id 缓存）
+
+    同一用户/文档的查询会复用同一个 where 字典，避免每次查询重复构建。
+    返回值为共享对象，调用方不得修改。
+    """
+    where_conditions: List[Dict[str, Any]] = [{"user_id": {"$eq": user_id}}]
+    if document_id:
+        where_conditions.append({"document_id": {"$eq": document_id}})
+    return {"$and": where_conditions} if len(where_conditions) > 1 else where_conditions[0]
+
+
 class RetrievalService:
     """
     文档检索服务
@@ -105,12 +137,24 @@ class RetrievalService:
         self._gemini_client: Optional["genai.Client"] = None  # type: ignore
         
         if self.embedding_provider == "openai":
-            self._openai = OpenAI()
+            self._openai = get_openai_client()
         elif self.embedding_provider == "gemini":
             self._init_gemini()
         
         # 初始化缓存
         self.cache = cache or CacheService(redis_client=redis_client)
+        
+        # 初始化 Reranker（构造时确定 provider，避免每次查询重新读取配置和创建实例）
+        self._reranker: Optional[BaseReranker] = None
+        if self.settings.rerank_enabled:
+            try:
+                self._reranker = get_reranker()
+            except Exception as e:
+                self.logger.warning(
+                    f"Failed to initialize reranker, using rule-based fallback: {e}",
+                    extra={"error": str(e)},
+                )
+        self._fallback_reranker = RuleBasedReranker()
     
     def _init_chroma(self) -> chromadb.Client:
         """初始化 ChromaDB 客户端"""
@@ -142,7 +186,7 @@ class RetrievalService:
             raise RuntimeError("google-genai is not installed. Run `pip install google-genai`.")
         if not self.settings.google_api_key:
             raise RuntimeError("Missing Google API key for Gemini models.")
-        self._gemini_client = genai.Client(api_key=self.settings.google_api_key)
+        self._gemini_client = _get_gemini_client(self.settings.google_api_key)
     
     def retrieve(
         self,
@@ -238,7 +282,16 @@ class RetrievalService:
         )
         duration = time.perf_counter() - start
         
-        # 转换为标准格式
+        return self._format_hybrid_results(results, document_id, user_id, duration)
+    
+    def _format_hybrid_results(
+        self,
+        results: List[RetrievalResult],
+        document_id: str,
+        user_id: str,
+        duration: float,
+    ) -> List[Dict[str, Any]]:
+        """将混合检索结果转换为标准 chunk 格式"""
         chunks: List[Dict[str, Any]] = []
         for result in results:
             chunks.append({
@@ -298,11 +351,22 @@ class RetrievalService:
         # 生成查询向量
         embedding = self._embed_query(query)
         
-        # 构建过滤条件
-        where_conditions = [{"user_id": {"$eq": user_id}}]
-        if document_id:
-            where_conditions.append({"document_id": {"$eq": document_id}})
-        where_clause = {"$and": where_conditions} if len(where_conditions) > 1 else where_conditions[0]
+        chunks = self._query_collection(embedding, user_id, document_id, k)
+        
+        # 缓存结果
+        self.cache.set_json(cache_key, chunks, self.CACHE_TTL, layer="chunks")
+        return chunks
+    
+    def _query_collection(
+        self,
+        embedding: List[float],
+        user_id: str,
+        document_id: Optional[str],
+        k: int,
+    ) -> List[Dict[str, Any]]:
+        """使用查询向量在 ChromaDB 中检索并格式化结果"""
+        # 构建过滤条件（按用户/文档缓存）
+        where_clause = _build_where_clause(user_id, document_id)
         
         # 执行向量搜索
         start = time.perf_counter()
@@ -335,8 +399,6 @@ class RetrievalService:
             },
         )
         
-        # 缓存结果
-        self.cache.set_json(cache_key, chunks, self.CACHE_TTL, layer="chunks")
         return chunks
     
     def _rerank(
@@ -346,16 +408,16 @@ class RetrievalService:
         top_n: int,
     ) -> List[Dict[str, Any]]:
         """对检索结果进行重排序"""
+        if self._reranker is None:
+            return self._fallback_reranker.rerank_chunks_with_metadata(query, chunks, top_n)
         try:
-            reranker = get_reranker()
-            return reranker.rerank_chunks(query, chunks, top_n)
+            return self._reranker.rerank_chunks(query, chunks, top_n)
         except Exception as e:
             self.logger.warning(
                 f"Reranker failed, using rule-based fallback: {e}",
                 extra={"error": str(e)},
             )
-            reranker = RuleBasedReranker()
-            return reranker.rerank_chunks_with_metadata(query, chunks, top_n)
+            return self._fallback_reranker.rerank_chunks_with_metadata(query, chunks, top_n)
     
     def _embed_query(self, query: str) -> List[float]:
         """生成查询的向量表示"""
@@ -381,7 +443,7 @@ class RetrievalService:
         
         # OpenAI embedding
         if self._openai is None:
-            self._openai = OpenAI()
+            self._openai = get_openai_client()
         response = self._openai.embeddings.create(
             model=self.settings.embedding_model_openai or "text-embedding-3-large",
             input=query,
@@ -396,6 +458,161 @@ class RetrievalService:
         )
         return embedding
     
+    # --- Async API ---
+    
+    async def retrieve_async(
+        self,
+        query: str,
+        user_id: str,
+        document_id: Optional[str] = None,
+        mode: RetrievalMode = "hybrid",
+        top_k: int = 10,
+        rerank: bool = True,
+        rerank_top_n: Optional[int] = None,
+    ) -> List[Dict[str, Any]]:
+        """
+        retrieve() 的异步版本
+        
+        Embedding 与 rerank 使用原生异步 HTTP 客户端，向量检索与 BM25 并发执行，
+        不阻塞事件循环。参数与返回值同 retrieve()。
+        """
+        if document_id:
+            bind_document_context(document_id)
+        
+        if mode == "hybrid" and document_id:
+            chunks = await self.hybrid_search_async(
+                query=query,
+                user_id=user_id,
+                document_id=document_id,
+                k=top_k,
+            )
+        else:
+            if mode == "hybrid" and not document_id:
+                self.logger.info(
+                    "Hybrid search requires document_id, falling back to vector search",
+                )
+            chunks = await self.vector_search_async(
+                query=query,
+                user_id=user_id,
+                document_id=document_id,
+                k=top_k,
+            )
+        
+        if not chunks:
+            return []
+        
+        if rerank and self.settings.rerank_enabled:
+            rerank_top_n = rerank_top_n or self.settings.rerank_top_n
+            chunks = await self._rerank_async(query, chunks, rerank_top_n)
+        
+        return chunks
+    
+    async def hybrid_search_async(
+        self,
+        query: str,
+        user_id: str,
+        document_id: str,
+        k: int = 10,
+    ) -> List[Dict[str, Any]]:
+        """hybrid_search() 的异步版本"""
+        bind_document_context(document_id)
+        
+        embedding = await self._embed_query_async(query)
+        
+        start = time.perf_counter()
+        results = await self._hybrid_retriever.asearch(
+            query=query,
+            document_id=document_id,
+            user_id=user_id,
+            query_embedding=embedding,
+            k=k,
+        )
+        duration = time.perf_counter() - start
+        
+        return self._format_hybrid_results(results, document_id, user_id, duration)
+    
+    async def vector_search_async(
+        self,
+        query: str,
+        user_id: str,
+        document_id: Optional[str] = None,
+        k: int = 10,
+    ) -> List[Dict[str, Any]]:
+        """vector_search() 的异步版本"""
+        if document_id:
+            bind_document_context(document_id)
+        
+        cache_key = chunks_cache_key(document_id or "all_docs", query)
+        cached = self.cache.get_json(cache_key, layer="chunks")
+        if cached:
+            self.logger.debug(
+                "Chunk cache hit",
+                extra={"document_id": document_id or "all", "user_id": user_id, "results": len(cached)},
+            )
+            return cached
+        
+        embedding = await self._embed_query_async(query)
+        chunks = await asyncio.to_thread(
+            self._query_collection, embedding, user_id, document_id, k
+        )
+        
+        self.cache.set_json(cache_key, chunks, self.CACHE_TTL, layer="chunks")
+        return chunks
+    
+    async def _rerank_async(
+        self,
+        query: str,
+        chunks: List[Dict[str, Any]],
+        top_n: int,
+    ) -> List[Dict[str, Any]]:
+        """_rerank() 的异步版本"""
+        if self._reranker is None:
+            return self._fallback_reranker.rerank_chunks_with_metadata(query, chunks, top_n)
+        try:
+            return await self._reranker.arerank_chunks(query, chunks, top_n)
+        except Exception as e:
+            self.logger.warning(
+                f"Reranker failed, using rule-based fallback: {e}",
+                extra={"error": str(e)},
+            )
+            return self._fallback_reranker.rerank_chunks_with_metadata(query, chunks, top_n)
+    
+    async def _embed_query_async(self, query: str) -> List[float]:
+        """_embed_query() 的异步版本"""
+        start = time.perf_counter()
+        
+        if self.embedding_provider == "gemini":
+            if self._gemini_client is None:
+                self._init_gemini()
+            response = await self._gemini_client.aio.models.embed_content(
+                model=self.settings.gemini_embedding_model or "text-embedding-004",
+                contents=[query],
+            )
+            if response.embeddings:
+                self.logger.debug(
+                    "Gemini embedding generated",
+                    extra={
+                        "model": self.settings.gemini_embedding_model,
+                        "duration_ms": round((time.perf_counter() - start) * 1000, 2),
+                    },
+                )
+                return list(response.embeddings[0].values)
+            return []
+        
+        response = await get_async_client().embeddings.create(
+            model=self.settings.embedding_model_openai or "text-embedding-3-large",
+            input=query,
+        )
+        embedding = response.data[0].embedding
+        self.logger.debug(
+            "OpenAI embedding generated",
+            extra={
+                "model": self.settings.embedding_model_openai,
+                "duration_ms": round((time.perf_counter() - start) * 1000, 2),
+            },
+        )
+        return embedding
+    
     # --- Legacy compatibility methods ---
     
     def get_relevant_chunks(
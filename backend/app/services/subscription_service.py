@@ -167,7 +167,10 @@ class SubscriptionService:
             self._ledgers[user_id] = SubscriptionLedger()
         return self._ledgers[user_id]
 
-    def _monthly_quota(self, plan: str) -> float:
+    @staticmethod
+    @lru_cache(maxsize=8)
+    def _monthly_quota(plan: str) -> float:
+        # SUBSCRIPTION_PLANS is static, so each plan's quota is resolved once
         quota = SUBSCRIPTION_PLANS.get(plan, {}).get("monthly_credits", 0)
         return float(quota) if isinstance(quota, (int, float)) else 0.0
 
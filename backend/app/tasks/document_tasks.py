@@ -8,26 +8,42 @@ from __future__ import annotations
 
 import logging
 import asyncio
+import hashlib
+import queue
+import threading
 import time
+from concurrent.futures import Executor, ProcessPoolExecutor
 from functools import lru_cache
 from pathlib import Path
-from typing import Any, Dict, Optional
+from types import MappingProxyType
+from typing import Any, Dict, Iterator, List, Optional, Tuple
+from urllib.parse import urljoin
 
+import lxml.html
 import trafilatura
 from curl_cffi import requests
+from lxml import etree
 
 try:
     from celery import Celery, Task
+    from celery.signals import worker_process_init, worker_process_shutdown
 except ImportError:  # pragma: no cover
     Celery = None
     Task = Any  # type: ignore
+    worker_process_init = None
+    worker_process_shutdown = None
 
 from ..core.config import get_settings
-from ..core.database import AsyncSessionLocal
+from ..core.database import session_scope
 from ..logging_utils import bind_document_context, bind_task_context, clear_context
 from ..models.document import DocumentSource, DocumentStatus
 from ..repositories.document_repository import PostgresDocumentRepository
-from ..services.chunking_service import StructuredChunker
+from ..services.chunking_service import (
+    DEFAULT_CHUNK_OVERLAP,
+    DEFAULT_CHUNK_SIZE,
+    Chunk,
+    StructuredChunker,
+)
 from ..services.embedding_service import EmbeddingService
 from ..services.subscription_service import get_subscription_service
 from ..telemetry.task_metrics import (
@@ -55,21 +71,59 @@ logger = logging.getLogger(__name__)
 DEFAULT_PARSE_SKU = "document_upload_pdf"
 TASK_SLA_SECONDS = {"documents.parse": 600}
 
+# Part of the content-dedup key: bump when chunking output changes so vectors
+# built by the old chunker are not copied into new documents
+_CHUNKING_VERSION = "1"
+
+# Browser-like headers for URL fetches, built once and shared read-only
+_URL_HEADERS = MappingProxyType(
+    {
+        "Referer": "https://www.google.com/",
+        "User-Agent": "Mozilla/5.0 (Macintosh; Intel Mac OS X 10_15_7) AppleWebKit/537.36",
+        "Accept-Language": "zh-CN,zh;q=0.9,en;q=0.8",
+    }
+)
 
-def get_document_repository() -> PostgresDocumentRepository:
-    """Get async document repository with new session"""
-    session = AsyncSessionLocal()
-    return PostgresDocumentRepository(session)
+# Worker-lifetime event loop, running in a dedicated daemon thread
+_WORKER_LOOP: Optional[asyncio.AbstractEventLoop] = None
+_WORKER_THREAD: Optional[threading.Thread] = None
+_WORKER_LOOP_LOCK = threading.Lock()
+
+# Process-wide pipeline services, created on first use
+_CHUNKER: Optional[StructuredChunker] = None
+_EMBEDDER: Optional[EmbeddingService] = None
+
+# Monotonic timestamp of the last progress update sent per task id
+_PROGRESS_LAST_SENT: Dict[str, float] = {}
+
+# Process pool for CPU-bound extraction (enabled via settings.extract_workers)
+_EXTRACT_POOL: Optional[ProcessPoolExecutor] = None
 
 
-@lru_cache(maxsize=1)
 def get_chunker() -> StructuredChunker:
-    return StructuredChunker()
+    global _CHUNKER
+    if _CHUNKER is None:
+        _CHUNKER = StructuredChunker()
+    return _CHUNKER
 
 
-@lru_cache(maxsize=1)
 def get_embedder() -> EmbeddingService:
-    return EmbeddingService()
+    global _EMBEDDER
+    if _EMBEDDER is None:
+        _EMBEDDER = EmbeddingService()
+    return _EMBEDDER
+
+
+@lru_cache(maxsize=1)
+def _get_http_session() -> requests.Session:
+    """Keep-alive session shared by all URL fetches in this process (TLS/DNS reuse)."""
+    return requests.Session(impersonate="chrome120")
+
+
+def _close_http_session() -> None:
+    if _get_http_session.cache_info().currsize:
+        _get_http_session().close()
+        _get_http_session.cache_clear()
 
 
 def _refund_on_failure(user_id: str, sku: str, reason: str) -> None:
@@ -106,200 +160,479 @@ async def _parse_document(
     bind_document_context(document_id)
     if task is not None:
         bind_task_context(getattr(getattr(task, "request", None), "id", None))
-    repo = get_document_repository()
     _update_task_progress(task, 0, "开始解析")
     logger.info("Starting parse_document_task", extra={"document_id": document_id})
     record_task_started("documents.parse")
     start_time = time.perf_counter()
 
     try:
-        document = await repo.get(document_id)
-        if not document:
-            logger.error("Document not found", extra={"document_id": document_id})
-            raise ValueError("Document not found")
+        async with session_scope() as session:
+            repo = PostgresDocumentRepository(session)
+            document = await repo.get(document_id)
+            if not document:
+                logger.error("Document not found", extra={"document_id": document_id})
+                raise ValueError("Document not found")
+
+            await repo.mark_status(document_id, DocumentStatus.parsing)
+
+            try:
+                loop = asyncio.get_running_loop()
+                source_type = document.source_type.value
+                storage_path = str(document.storage_path) if document.storage_path else None
+                embedder = get_embedder()
+
+                # PDF and text sources are hashed before parsing, so a duplicate
+                # skips extraction as well as chunking and embedding
+                source_hash = await loop.run_in_executor(
+                    None, _source_sha256, source_type, storage_path, document.source_value
+                )
+                copied = 0
+                if source_hash:
+                    copied = await _reuse_duplicate_vectors(
+                        repo, embedder, _dedup_key(source_hash), document_id, user_id
+                    )
+
+                if not copied:
+                    elements, fetched_hash = await loop.run_in_executor(
+                        _get_extract_executor(),
+                        _extract_elements,
+                        source_type,
+                        storage_path,
+                        document.source_value,
+                        source_url,
+                    )
+                    _update_task_progress(task, 30, "已提取元素")
+
+                    # Try to extract title from elements
+                    title = None
+                    for element in elements:
+                        if element.get("category") == "Title":
+                            title = element.get("text", "").strip()
+                            if title:
+                                break
+                
+                    if title:
+                        await repo.update_title(document_id, title)
+
+                    if fetched_hash:
+                        # URL content is only known once fetched
+                        source_hash = fetched_hash
+                        copied = await _reuse_duplicate_vectors(
+                            repo, embedder, _dedup_key(source_hash), document_id, user_id
+                        )
+
+                if not copied:
+                    chunker = get_chunker()
+                    sections = await loop.run_in_executor(None, chunker.build_sections, elements)
+                    _update_task_progress(task, 50, "正在分块与向量化")
+
+                    chunks = await loop.run_in_executor(
+                        None,
+                        _chunk_and_embed,
+                        chunker,
+                        embedder,
+                        sections,
+                        document_id,
+                        user_id,
+                    )
+
+                    if settings.persist_chunks_to_disk:
+                        chunks_path = _chunks_path(document_id)
+                        await loop.run_in_executor(None, chunker.serialize_chunks, chunks, chunks_path)
+                await repo.update_content_hash(document_id, _dedup_key(source_hash))
+                _update_task_progress(task, 90, "向量入库完成")
+
+                await repo.mark_status(document_id, DocumentStatus.completed)
+                _update_task_progress(task, 100, "解析完成")
+                logger.info("Completed parse_document_task", extra={"document_id": document_id})
+                duration = time.perf_counter() - start_time
+                record_task_completed("documents.parse", duration)
+                _check_sla("documents.parse", duration)
+            except Exception as exc:
+                logger.exception("Failed to parse document", extra={"document_id": document_id})
+                await repo.mark_status(document_id, DocumentStatus.failed, str(exc))
+                _update_task_progress(task, 100, "解析失败")
+                _refund_on_failure(user_id, sku, str(exc))
+                duration = time.perf_counter() - start_time
+                record_task_failed("documents.parse", duration, str(exc))
+                _check_sla("documents.parse", duration, success=False)
+                setattr(exc, "credits_refunded", True)
+                raise
+    finally:
+        clear_context()
 
-        await repo.mark_status(document_id, DocumentStatus.parsing)
 
+def _chunk_and_embed(
+    chunker: StructuredChunker,
+    embedder: EmbeddingService,
+    sections: List[Dict],
+    document_id: str,
+    user_id: str,
+) -> List[Chunk]:
+    """Chunk and embed as a two-stage pipeline.
+
+    A producer thread chunks sections into embedding-sized batches while the
+    calling thread embeds them, so table summaries and tokenization overlap
+    with embedding API calls. Returns every chunk produced.
+    """
+    batches: "queue.Queue[Any]" = queue.Queue(maxsize=4)
+    cancelled = threading.Event()
+    produced: List[Chunk] = []
+    done = object()
+
+    def produce() -> None:
         try:
-            loop = asyncio.get_running_loop()
-            
-            elements = await loop.run_in_executor(
-                None, _extract_elements, document.source_type, document, source_url
-            )
-            _update_task_progress(task, 30, "已提取元素")
-
-            # Try to extract title from elements
-            title = None
-            for element in elements:
-                if element.get("category") == "Title":
-                    title = element.get("text", "").strip()
-                    if title:
-                        break
-            
-            if title:
-                await repo.update_title(document_id, title)
-
-            chunker = get_chunker()
-            sections = await loop.run_in_executor(None, chunker.build_sections, elements)
-            chunks = await loop.run_in_executor(None, chunker.chunk_sections, sections)
-            _update_task_progress(task, 50, "已完成分块")
-
-            chunks_path = _chunks_path(document_id)
-            await loop.run_in_executor(None, chunker.serialize_chunks, chunks, chunks_path)
-            _update_task_progress(task, 70, "已生成 chunk 文件")
-
-            embedder = get_embedder()
-            await loop.run_in_executor(
-                None,
-                embedder.embed_chunks,
-                document_id,
-                user_id,
-                chunks_path,
-            )
-            _update_task_progress(task, 90, "向量入库完成")
-
-            await repo.mark_status(document_id, DocumentStatus.completed)
-            _update_task_progress(task, 100, "解析完成")
-            logger.info("Completed parse_document_task", extra={"document_id": document_id})
-            duration = time.perf_counter() - start_time
-            record_task_completed("documents.parse", duration)
-            _check_sla("documents.parse", duration)
-        except Exception as exc:
-            logger.exception("Failed to parse document", extra={"document_id": document_id})
-            await repo.mark_status(document_id, DocumentStatus.failed, str(exc))
-            _update_task_progress(task, 100, "解析失败")
-            _refund_on_failure(user_id, sku, str(exc))
-            duration = time.perf_counter() - start_time
-            record_task_failed("documents.parse", duration, str(exc))
-            _check_sla("documents.parse", duration, success=False)
-            setattr(exc, "credits_refunded", True)
-            raise
+            for batch in chunker.iter_chunk_batches(sections, embedder.batch_size):
+                if cancelled.is_set():
+                    break
+                produced.extend(batch)
+                batches.put(batch)
+        except BaseException as exc:  # re-raised in the embedding thread
+            batches.put(exc)
+        else:
+            batches.put(done)
+
+    def consume() -> Iterator[Chunk]:
+        while True:
+            item = batches.get()
+            if item is done:
+                return
+            if isinstance(item, BaseException):
+                raise item
+            yield from item
+
+    producer = threading.Thread(target=produce, name=f"chunker-{document_id}", daemon=True)
+    producer.start()
+    try:
+        embedder.embed_chunks_inmem(document_id, user_id, consume())
     finally:
-        await repo.session.close()
-        clear_context()
+        if producer.is_alive():
+            # Embedding failed early: stop the producer and unblock any pending put()
+            cancelled.set()
+            while producer.is_alive():
+                try:
+                    batches.get(timeout=0.1)
+                except queue.Empty:
+                    pass
+        producer.join()
+    return produced
+
+
+def _get_extract_executor() -> Optional[Executor]:
+    """Executor for element extraction; None selects the loop's default thread pool."""
+    global _EXTRACT_POOL
+    if settings.extract_workers <= 0:
+        return None
+    if _EXTRACT_POOL is None:
+        _EXTRACT_POOL = ProcessPoolExecutor(max_workers=settings.extract_workers)
+    return _EXTRACT_POOL
+
+
+def _file_sha256(path: Path, block_size: int = 1 << 20) -> str:
+    """SHA-256 of a file, read in blocks instead of loading the whole file into memory."""
+    digest = hashlib.sha256()
+    with path.open("rb") as handle:
+        for block in iter(lambda: handle.read(block_size), b""):
+            digest.update(block)
+    return digest.hexdigest()
+
+
+def _source_sha256(source_type: str, storage_path: Optional[str], source_value: str) -> Optional[str]:
+    """SHA-256 of a source that is available without parsing (None for URLs)."""
+    if source_type == DocumentSource.pdf:
+        return _file_sha256(Path(storage_path)) if storage_path else None
+    if source_type == DocumentSource.url:
+        return None
+    return hashlib.sha256(source_value.encode("utf-8")).hexdigest()
+
+
+def _dedup_key(source_hash: str) -> str:
+    """Content hash stored on the document and matched for embedding reuse.
+
+    Combines the source digest with everything that shapes the stored
+    vectors (chunking version and sizes, embedding provider and model), so
+    vectors are never reused across a pipeline change.
+    """
+    if settings.embedding_provider == "gemini":
+        embedding_model = settings.gemini_embedding_model
+    else:
+        embedding_model = settings.embedding_model_openai
+    fingerprint = ":".join((
+        source_hash,
+        _CHUNKING_VERSION,
+        str(DEFAULT_CHUNK_SIZE),
+        str(DEFAULT_CHUNK_OVERLAP),
+        settings.embedding_provider or "openai",
+        embedding_model or "",
+    ))
+    return hashlib.sha256(fingerprint.encode("utf-8")).hexdigest()
+
+
+async def _reuse_duplicate_vectors(
+    repo: PostgresDocumentRepository,
+    embedder: EmbeddingService,
+    content_hash: str,
+    document_id: str,
+    user_id: str,
+) -> int:
+    """Copy vectors from the user's own completed document with the same content hash.
+
+    Returns the number of chunks copied (0 when there is no usable duplicate).
+    """
+    duplicate = await repo.get_by_hash(content_hash, user_id, exclude_id=document_id)
+    if not duplicate:
+        return 0
+    copied = await asyncio.get_running_loop().run_in_executor(
+        None,
+        embedder.copy_document_vectors,
+        duplicate.id,
+        document_id,
+        user_id,
+    )
+    if copied:
+        if duplicate.title:
+            await repo.update_title(document_id, duplicate.title)
+        logger.info(
+            "Reused embeddings of identical document",
+            extra={"document_id": document_id, "source_document_id": duplicate.id},
+        )
+    return copied
 
 
-def _extract_elements(source_type: DocumentSource, document, source_url: Optional[str]) -> list[Dict]:
+def _extract_elements(
+    source_type: str,
+    storage_path: Optional[str],
+    source_value: str,
+    source_url: Optional[str],
+) -> Tuple[list[Dict], Optional[str]]:
+    """Extract elements; for URLs also return the SHA-256 of the fetched HTML.
+
+    PDF and text sources are hashed up front by _source_sha256, so the second
+    item is None for them.
+    """
+    # Takes primitives only so it can run in a worker process (see _get_extract_executor)
     chunker = get_chunker()
     if source_type == DocumentSource.pdf:
-        if not document.storage_path:
+        if not storage_path:
             raise ValueError("PDF document missing storage_path")
-        return chunker.parse_pdf(Path(document.storage_path))
+        return chunker.parse_pdf(Path(storage_path)), None
     if source_type == DocumentSource.url:
-        url = source_url or document.source_value
-        html = _fetch_remote_content(url)
-        text = trafilatura.extract(
-            html, include_comments=False, include_tables=True, 
-            no_fallback=True, output_format="markdown"
-        )
+        url = source_url or source_value
+        html, text = _fetch_remote_content(url)
+        content_hash = hashlib.sha256(html.encode("utf-8")).hexdigest()
         if not text:
-            return chunker.parse_html(html)
-        return chunker.parse_plain_text(text)
-    return chunker.parse_plain_text(document.source_value)
+            return chunker.parse_html(html), content_hash
+        return chunker.parse_plain_text(text), content_hash
+    return chunker.parse_plain_text(source_value), None
+
 
+def _fetch_remote_content(url: str) -> Tuple[str, Optional[str]]:
+    """Fetch URL content with browser impersonation.
 
-def _fetch_remote_content(url: str) -> str:
-    """Fetch URL content with browser impersonation."""
+    Returns the HTML that holds the page content (the page itself, or its
+    main content iframe) together with the trafilatura-extracted text.
+    """
     try:
-        response = requests.get(
-            url,
-            impersonate="chrome120", 
-            headers={
-                "Referer": "https://www.google.com/",
-                "User-Agent": "Mozilla/5.0 (Macintosh; Intel Mac OS X 10_15_7) AppleWebKit/537.36",
-                "Accept-Language": "zh-CN,zh;q=0.9,en;q=0.8"
-            },
-            timeout=15
-        )
+        session = _get_http_session()
+        response = session.get(url, headers=_URL_HEADERS, timeout=15)
         
         if response.status_code != 200:
             raise RuntimeError(f"Download failed with status {response.status_code}")
 
         html = response.text
-        
-        # Check for content iframes
-        try:
-            from bs4 import BeautifulSoup
-            from urllib.parse import urljoin
-            
-            soup = BeautifulSoup(html, 'html.parser')
-            iframes = soup.find_all('iframe')
-            
-            if not iframes:
-                return html
-                
-            # Score iframes to find main content
-            best_iframe = None
-            max_score = 0
-            
-            for iframe in iframes:
-                src = iframe.get('src')
-                if not src:
-                    continue
-                    
-                score = 0
-                width = iframe.get('width')
-                height = iframe.get('height')
-                style = iframe.get('style', '').lower()
-                
-                if width and (width == '100%' or (width.isdigit() and int(width) > 800)):
-                    score += 2
-                if height and (height == '100%' or (height.isdigit() and int(height) > 600)):
-                    score += 2
-                if 'width: 100%' in style or 'height: 100%' in style:
-                    score += 2
-                    
-                src_lower = src.lower()
-                if 'pdf' in src_lower:
-                    score += 3
-                if 'article' in src_lower or 'content' in src_lower:
-                    score += 1
-                if 'viewer' in src_lower:
-                    score += 2
-                    
-                if 'ads' in src_lower or 'tracker' in src_lower:
-                    score -= 10
-
-                if score > max_score:
-                    max_score = score
-                    best_iframe = src
-
-            if best_iframe and max_score > 0:
-                logger.info(f"Found content iframe with score {max_score}: {best_iframe}")
+        tree = _parse_html(html)
+        best_iframe = _select_content_iframe(tree) if tree is not None else None
+        if best_iframe:
+            # Sequential by necessity: the iframe URL is only known once the page is parsed.
+            # The shared keep-alive session reuses the page's connection for same-origin iframes.
+            try:
                 full_url = urljoin(url, best_iframe)
-                
-                iframe_response = requests.get(
+                iframe_response = session.get(
                     full_url,
-                    impersonate="chrome120",
                     headers={"Referer": url},
                     timeout=15
                 )
                 
                 if iframe_response.status_code == 200:
-                    return iframe_response.text
-                    
-        except ImportError:
-            logger.warning("BeautifulSoup not installed, skipping iframe extraction")
-        except Exception as e:
-            logger.warning(f"Iframe extraction failed: {e}")
+                    iframe_html = iframe_response.text
+                    return iframe_html, _extract_markdown(iframe_html)
+            except Exception as e:
+                logger.warning(f"Iframe extraction failed: {e}")
 
-        return html
+        # No usable iframe: extract from the page, reusing its parsed tree
+        return html, _extract_markdown(tree if tree is not None else html)
 
     except Exception as e:
         raise RuntimeError(f"Failed to fetch URL content: {url}. Error: {str(e)}")
 
 
+def _parse_html(html: str) -> Optional[lxml.html.HtmlElement]:
+    """Parse fetched HTML into an lxml tree, or None if it cannot be parsed."""
+    try:
+        return lxml.html.fromstring(html)
+    except ValueError:
+        # lxml refuses str input that carries an XML encoding declaration
+        # (XHTML pages); parse the UTF-8 bytes and ignore the declared charset.
+        try:
+            return lxml.html.fromstring(
+                html.encode("utf-8"), parser=lxml.html.HTMLParser(encoding="utf-8")
+            )
+        except (etree.ParserError, ValueError):
+            return None
+    except etree.ParserError:
+        return None
+
+
+def _extract_markdown(document: Any) -> Optional[str]:
+    """Run trafilatura on a parsed tree (or raw HTML string) and return markdown."""
+    # Markdown is required: parse_plain_text turns "#" headings into section titles.
+    # fast=True skips trafilatura's fallback extractors (formerly no_fallback=True).
+    return trafilatura.extract(
+        document, include_comments=False, include_tables=True,
+        fast=True, output_format="markdown"
+    )
+
+
+# (keywords, weight): the weight applies once if any keyword occurs in the lowercased src
+_IFRAME_SRC_KEYWORDS: Tuple[Tuple[Tuple[str, ...], int], ...] = (
+    (("pdf",), 3),
+    (("viewer",), 2),
+    (("article", "content"), 1),
+    (("ads", "tracker"), -10),
+)
+
+
+def _is_full_size(value: Optional[str], min_pixels: int) -> bool:
+    if not value:
+        return False
+    return value == "100%" or (value.isdigit() and int(value) > min_pixels)
+
+
+def _score_iframe(src: str, width: Optional[str], height: Optional[str], style: str) -> int:
+    score = 0
+    if _is_full_size(width, 800):
+        score += 2
+    if _is_full_size(height, 600):
+        score += 2
+    if 'width: 100%' in style or 'height: 100%' in style:
+        score += 2
+
+    src_lower = src.lower()
+    for keywords, weight in _IFRAME_SRC_KEYWORDS:
+        for keyword in keywords:
+            if keyword in src_lower:
+                score += weight
+                break
+    return score
+
+
+def _select_content_iframe(tree) -> Optional[str]:
+    """Score iframes to find the one holding the main content."""
+    best_iframe = None
+    max_score = 0
+
+    for iframe in tree.iter("iframe"):
+        attrib = iframe.attrib
+        src = attrib.get("src")
+        if not src:
+            continue
+
+        score = _score_iframe(
+            src, attrib.get("width"), attrib.get("height"), attrib.get("style", "").lower()
+        )
+        if score > max_score:
+            max_score = score
+            best_iframe = src
+
+    if best_iframe:
+        logger.info(f"Found content iframe with score {max_score}: {best_iframe}")
+    return best_iframe
+
+
 def _chunks_path(document_id: str) -> Path:
     return settings.storage_base_path.parent / "chunks" / f"{document_id}.json"
 
 
 def _update_task_progress(task: Optional[Task], progress: int, message: str) -> None:
-    if not task:
+    """Publish task progress, throttling intermediate ticks.
+
+    The first (0%) and final (100%) updates are always sent; intermediate
+    updates closer than ``task_progress_min_interval`` to the previous one
+    are dropped to save result-backend round-trips.
+    """
+    if not task or not settings.task_progress_enabled:
         return
+    task_id = getattr(getattr(task, "request", None), "id", None)
+    now = time.monotonic()
+    final = progress >= 100
+    if 0 < progress and not final:
+        last_sent = _PROGRESS_LAST_SENT.get(task_id)
+        if last_sent is not None and now - last_sent < settings.task_progress_min_interval:
+            return
     try:
         task.update_state(state="PROGRESS", meta={"progress": progress, "message": message})
     except Exception:  # pragma: no cover
         logger.debug("Failed to update task progress", exc_info=True)
+    if final:
+        _PROGRESS_LAST_SENT.pop(task_id, None)
+    else:
+        _PROGRESS_LAST_SENT[task_id] = now
+
+
+def _get_worker_loop() -> asyncio.AbstractEventLoop:
+    """Return the shared worker event loop, starting it on first use."""
+    global _WORKER_LOOP, _WORKER_THREAD
+    with _WORKER_LOOP_LOCK:
+        if _WORKER_LOOP is None or _WORKER_LOOP.is_closed():
+            loop = asyncio.new_event_loop()
+            thread = threading.Thread(target=loop.run_forever, name="task-event-loop", daemon=True)
+            thread.start()
+            _WORKER_LOOP, _WORKER_THREAD = loop, thread
+        return _WORKER_LOOP
+
+
+def _stop_worker_loop() -> None:
+    global _WORKER_LOOP, _WORKER_THREAD
+    with _WORKER_LOOP_LOCK:
+        loop, thread = _WORKER_LOOP, _WORKER_THREAD
+        _WORKER_LOOP, _WORKER_THREAD = None, None
+    if loop is None:
+        return
+    loop.call_soon_threadsafe(loop.stop)
+    if thread is not None:
+        thread.join(timeout=5)
+    if not loop.is_running():
+        loop.close()
+
+
+def _run_coroutine(coro) -> None:
+    """Run a task coroutine to completion from synchronous (worker) code.
+
+    With ``shared_event_loop`` enabled the coroutine is scheduled on the
+    worker-lifetime loop instead of paying for a fresh loop per task; this
+    also keeps pooled async DB connections on the loop that created them.
+    """
+    if settings.shared_event_loop:
+        asyncio.run_coroutine_threadsafe(coro, _get_worker_loop()).result()
+    else:
+        asyncio.run(coro)
+
+
+if worker_process_init is not None:
+
+    @worker_process_init.connect
+    def _init_worker_loop(**_kwargs) -> None:
+        if settings.shared_event_loop:
+            _get_worker_loop()
+
+    @worker_process_shutdown.connect
+    def _shutdown_worker_loop(**_kwargs) -> None:
+        global _EXTRACT_POOL
+        _stop_worker_loop()
+        _close_http_session()
+        if _EXTRACT_POOL is not None:
+            _EXTRACT_POOL.shutdown(wait=False, cancel_futures=True)
+            _EXTRACT_POOL = None
 
 
 def _dispatch_task(task_callable, task_name: str, priority: TaskPriority, *args, **kwargs):
@@ -336,7 +669,7 @@ if celery_app:
         if loop:
             loop.create_task(_parse_document(document_id, user_id, source_url, sku=sku, task=self))
         else:
-            asyncio.run(_parse_document(document_id, user_id, source_url, sku=sku, task=self))
+            _run_coroutine(_parse_document(document_id, user_id, source_url, sku=sku, task=self))
 
 else:
 
@@ -354,7 +687,7 @@ else:
         if loop:
             loop.create_task(_parse_document(document_id, user_id, source_url, sku=sku, task=None))
         else:
-            asyncio.run(_parse_document(document_id, user_id, source_url, sku=sku, task=None))
+            _run_coroutine(_parse_document(document_id, user_id, source_url, sku=sku, task=None))
 
 
 def enqueue_parse_document(
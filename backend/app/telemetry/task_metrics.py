@@ -1,7 +1,7 @@
 from __future__ import annotations
 
 import logging
-from typing import Optional
+from typing import Dict, Optional, Tuple
 
 from prometheus_client import Counter, Histogram
 
@@ -38,9 +38,28 @@ TASK_DURATION = Histogram(
     buckets=(5, 15, 30, 60, 120, 300, 600, 900, 1800, float("inf")),
 )
 
+# Resolved label children, so the hot path skips labels()' lock and validation
+_ENQUEUED_CHILDREN: Dict[Tuple[str, str], Counter] = {}
+_STARTED_CHILDREN: Dict[str, Counter] = {}
+_COMPLETED_CHILDREN: Dict[str, Counter] = {}
+_FAILED_CHILDREN: Dict[str, Counter] = {}
+_DURATION_CHILDREN: Dict[str, Histogram] = {}
+
+
+def _child(children: Dict, metric, task_name: str):
+    child = children.get(task_name)
+    if child is None:
+        child = children[task_name] = metric.labels(task_name=task_name)
+    return child
+
 
 def record_task_enqueued(task_name: str, priority: str) -> None:
-    TASK_ENQUEUED.labels(task_name=task_name, priority=priority).inc()
+    child = _ENQUEUED_CHILDREN.get((task_name, priority))
+    if child is None:
+        child = _ENQUEUED_CHILDREN[(task_name, priority)] = TASK_ENQUEUED.labels(
+            task_name=task_name, priority=priority
+        )
+    child.inc()
     logger.info(
         "Task enqueued",
         extra={"task_name": task_name, "priority": priority},
@@ -48,18 +67,18 @@ def record_task_enqueued(task_name: str, priority: str) -> None:
 
 
 def record_task_started(task_name: str) -> None:
-    TASK_STARTED.labels(task_name=task_name).inc()
+    _child(_STARTED_CHILDREN, TASK_STARTED, task_name).inc()
 
 
 def record_task_completed(task_name: str, duration: float) -> None:
-    TASK_COMPLETED.labels(task_name=task_name).inc()
-    TASK_DURATION.labels(task_name=task_name).observe(duration)
+    _child(_COMPLETED_CHILDREN, TASK_COMPLETED, task_name).inc()
+    _child(_DURATION_CHILDREN, TASK_DURATION, task_name).observe(duration)
 
 
 def record_task_failed(task_name: str, duration: Optional[float] = None, reason: Optional[str] = None) -> None:
-    TASK_FAILED.labels(task_name=task_name).inc()
+    _child(_FAILED_CHILDREN, TASK_FAILED, task_name).inc()
     if duration is not None:
-        TASK_DURATION.labels(task_name=task_name).observe(duration)
+        _child(_DURATION_CHILDREN, TASK_DURATION, task_name).observe(duration)
     if reason:
         logger.warning(
             "Task failed",
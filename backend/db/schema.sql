@@ -38,10 +38,15 @@ CREATE TABLE IF NOT EXISTS documents (
     title VARCHAR(500),
     status VARCHAR(20) NOT NULL DEFAULT 'pending',
     error_message TEXT,
+    content_hash VARCHAR(64),
     created_at TIMESTAMP WITH TIME ZONE DEFAULT NOW(),
     updated_at TIMESTAMP WITH TIME ZONE DEFAULT NOW()
 );
 
+-- Added after the initial release; keeps existing databases in sync
+ALTER TABLE documents ADD COLUMN IF NOT EXISTS content_hash VARCHAR(64);
+CREATE INDEX IF NOT EXISTS idx_documents_content_hash ON documents(content_hash);
+
 CREATE INDEX idx_documents_user_id ON documents(user_id);
 CREATE INDEX idx_documents_status ON documents(status);
 CREATE INDEX idx_documents_created_at ON documents(created_at DESC);
@@ -0,0 +1,39 @@
+"""On-disk cache of agent answers for evaluation reruns."""
+import os
+from pathlib import Path
+from typing import Any, Dict, Optional
+
+import orjson
+
+
+DEFAULT_CACHE_DIR = os.path.join("backend", "evaluation", ".cache")
+
+
+class AnswerCache:
+    """Store one JSON file per key under ``directory``.
+
+    Keys are hex digests computed by the evaluation service (they include
+    the question, user, settings and agent prompt), so a configuration change
+    simply misses. Changes to the indexed documents or the agent code are not
+    part of the key: clear the directory after those.
+    """
+
+    def __init__(self, directory: str = DEFAULT_CACHE_DIR):
+        self.directory = Path(directory)
+
+    def _path(self, key: str) -> Path:
+        return self.directory / key[:2] / f"{key}.json"
+
+    def get(self, key: str) -> Optional[Dict[str, Any]]:
+        try:
+            return orjson.loads(self._path(key).read_bytes())
+        except (OSError, orjson.JSONDecodeError):
+            return None
+
+    def set(self, key: str, value: Dict[str, Any]) -> None:
+        path = self._path(key)
+        path.parent.mkdir(parents=True, exist_ok=True)
+        # Write then rename so an interrupted run never leaves a torn entry
+        tmp_path = path.with_suffix(f".{os.getpid()}.tmp")
+        tmp_path.write_bytes(orjson.dumps(value))
+        os.replace(tmp_path, path)
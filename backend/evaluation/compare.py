@@ -1,110 +1,121 @@
 """Script to compare two RAG evaluation JSON results."""
-import json
 import argparse
+import io
+import json
+import math
 import sys
 from pathlib import Path
-from typing import Dict, Any, List
+from typing import Dict, Any, List, Optional
 
 
 def load_result(path: str) -> Dict[str, Any]:
+    # stdlib json: older result files contain bare NaN, which orjson rejects
     try:
-        with open(path, 'r', encoding='utf-8') as f:
-            return json.load(f)
+        return json.loads(Path(path).read_text(encoding='utf-8'))
     except Exception as e:
         print(f"Error loading {path}: {e}")
         sys.exit(1)
 
 
-def calculate_delta(curr: float, base: float) -> str:
-    delta = curr - base
+def calculate_delta(delta: float) -> str:
     symbol = "+" if delta > 0 else ""
     return f"{symbol}{delta:.2%}"
 
 
-def main():
-    parser = argparse.ArgumentParser(description="Compare two RAG evaluation results")
-    parser.add_argument("baseline", help="Path to baseline result JSON (e.g., plain_rag.json)")
-    parser.add_argument("candidate", help="Path to candidate result JSON (e.g., main.json)")
-    parser.add_argument("--output", default="evaluation_comparison.md", help="Output Markdown report path")
-    args = parser.parse_args()
+def metric_status(delta: float) -> str:
+    if delta > 0.02:
+        return "✅ Improved"
+    if delta < -0.02:
+        return "❌ Regressed"
+    return "➖ Similar"
 
-    base_data = load_result(args.baseline)
-    curr_data = load_result(args.candidate)
 
+def metric_value(value: Any) -> Optional[float]:
+    """Return a score as float, or None when it is missing (null or NaN)."""
+    if value is None:
+        return None
+    value = float(value)
+    return None if math.isnan(value) else value
+
+
+def format_percent(value: Optional[float]) -> str:
+    return "N/A" if value is None else f"{value:.2%}"
+
+
+METRICS = ("faithfulness", "response_relevancy", "context_precision", "context_recall", "overall_score")
+METRIC_LABELS = {m: m.replace('_', ' ').title() for m in METRICS}
+
+
+def build_report(base_data: Dict[str, Any], curr_data: Dict[str, Any], baseline: str, candidate: str) -> str:
+    """Render the Markdown comparison report for two result files."""
     base_metrics = base_data.get("metrics", {})
     curr_metrics = curr_data.get("metrics", {})
 
-    report = []
-    report.append(f"# RAG Evaluation Comparison Report\n")
-    report.append(f"- **Baseline**: `{args.baseline}` ({base_data.get('models', {}).get('answer_model', 'Unknown')})")
-    report.append(f"- **Candidate**: `{args.candidate}` ({curr_data.get('models', {}).get('answer_model', 'Unknown')})\n")
-
-    report.append("## 📊 Metric Overview\n")
-    report.append("| Metric | Baseline | Candidate | Delta | Status |")
-    report.append("| :--- | :--- | :--- | :--- | :--- |")
-
-    metrics_list = ["faithfulness", "response_relevancy", "context_precision", "context_recall", "overall_score"]
-    
-    for m in metrics_list:
-        base_val = base_metrics.get(m, 0.0)
-        curr_val = curr_metrics.get(m, 0.0)
-        delta_str = calculate_delta(curr_val, base_val)
-        
-        # Determine status icon
-        if curr_val > base_val + 0.02:
-            status = "✅ Improved"
-        elif curr_val < base_val - 0.02:
-            status = "❌ Regressed"
-        else:
-            status = "➖ Similar"
-            
-        report.append(f"| **{m.replace('_', ' ').title()}** | {base_val:.2%} | {curr_val:.2%} | **{delta_str}** | {status} |")
-
-    report.append("\n## 🔍 Deep Dive Analysis\n")
-    
+    buf = io.StringIO()
+    w = buf.write
+    w("# RAG Evaluation Comparison Report\n\n")
+    w(f"- **Baseline**: `{baseline}` ({base_data.get('models', {}).get('answer_model', 'Unknown')})\n")
+    w(f"- **Candidate**: `{candidate}` ({curr_data.get('models', {}).get('answer_model', 'Unknown')})\n\n")
+
+    w("## 📊 Metric Overview\n\n")
+    w("| Metric | Baseline | Candidate | Delta | Status |\n")
+    w("| :--- | :--- | :--- | :--- | :--- |\n")
+
+    # One pass: each metric is looked up and its delta computed exactly once
+    for m in METRICS:
+        base_val = metric_value(base_metrics.get(m, 0.0))
+        curr_val = metric_value(curr_metrics.get(m, 0.0))
+        if base_val is None or curr_val is None:
+            w(f"| **{METRIC_LABELS[m]}** | {format_percent(base_val)} | {format_percent(curr_val)} | N/A | ➖ Missing |\n")
+            continue
+        delta = curr_val - base_val
+        w(f"| **{METRIC_LABELS[m]}** | {base_val:.2%} | {curr_val:.2%} | **{calculate_delta(delta)}** | {metric_status(delta)} |\n")
+
+    w("\n## 🔍 Deep Dive Analysis\n\n")
+
     # Compare individual questions
     base_details = base_data.get("details", [])
     curr_details = curr_data.get("details", [])
-    
+
     if len(base_details) != len(curr_details):
-        report.append(f"> ⚠️ **Warning**: Sample counts differ! Baseline: {len(base_details)}, Candidate: {len(curr_details)}. Comparison may be misaligned.\n")
-    
-    # Identify significant changes
+        w(f"> ⚠️ **Warning**: Sample counts differ! Baseline: {len(base_details)}, Candidate: {len(curr_details)}. Comparison may be misaligned.\n\n")
+
+    # Identify significant faithfulness changes (>30%)
     significant_changes = []
-    
-    limit = min(len(base_details), len(curr_details))
-    for i in range(limit):
-        b_item = base_details[i]
-        c_item = curr_details[i]
-        
-        # Check faithfulness drop
-        b_faith = b_item.get("faithfulness", 0.0)
-        c_faith = c_item.get("faithfulness", 0.0)
-        
-        if abs(c_faith - b_faith) > 0.3: # Significant change threshold
-            significant_changes.append({
-                "index": i + 1,
-                "question": b_item.get("user_input", "unknown"),
-                "metric": "Faithfulness",
-                "base": b_faith,
-                "curr": c_faith,
-                "diff": c_faith - b_faith
-            })
-            
+    for i, (b_item, c_item) in enumerate(zip(base_details, curr_details), start=1):
+        b_faith = metric_value(b_item.get("faithfulness", 0.0))
+        c_faith = metric_value(c_item.get("faithfulness", 0.0))
+        if b_faith is None or c_faith is None:
+            continue
+        diff = c_faith - b_faith
+        if abs(diff) > 0.3:
+            significant_changes.append((i, b_item.get("user_input", "unknown"), b_faith, c_faith, diff))
+
     if significant_changes:
-        report.append("### Significant Deviations (>30% change)\n")
-        for item in significant_changes:
-            icon = "🟢" if item['diff'] > 0 else "🔴"
-            report.append(f"**Q{item['index']}: {item['question']}**")
-            report.append(f"- {icon} {item['metric']}: {item['base']:.2f} -> **{item['curr']:.2f}** ({item['diff']:+.2f})")
-            report.append("")
+        w("### Significant Deviations (>30% change)\n\n")
+        for index, question, b_faith, c_faith, diff in significant_changes:
+            icon = "🟢" if diff > 0 else "🔴"
+            w(f"**Q{index}: {question}**\n")
+            w(f"- {icon} Faithfulness: {b_faith:.2f} -> **{c_faith:.2f}** ({diff:+.2f})\n\n")
     else:
-        report.append("No significant (>30%) deviations found in individual questions.\n")
+        w("No significant (>30%) deviations found in individual questions.\n\n")
+
+    return buf.getvalue().rstrip("\n") + "\n"
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Compare two RAG evaluation results")
+    parser.add_argument("baseline", help="Path to baseline result JSON (e.g., plain_rag.json)")
+    parser.add_argument("candidate", help="Path to candidate result JSON (e.g., main.json)")
+    parser.add_argument("--output", default="evaluation_comparison.md", help="Output Markdown report path")
+    args = parser.parse_args()
+
+    base_data = load_result(args.baseline)
+    curr_data = load_result(args.candidate)
 
     # Generate output
-    output_content = "\n".join(report)
-    with open(args.output, 'w', encoding='utf-8') as f:
-        f.write(output_content)
+    output_content = build_report(base_data, curr_data, args.baseline, args.candidate)
+    Path(args.output).write_text(output_content, encoding='utf-8')
         
     print(output_content)
     print(f"\nReport saved to {args.output}")
@@ -1,9 +1,13 @@
 """Script to evaluate Agent pipeline quality using RAGAS."""
 import sys
 import os
-import json
 import argparse
+import io
+import asyncio
 from pathlib import Path
+from typing import Any, Dict, List, Optional, Tuple
+
+import orjson
 
 # Ensure we run from project root
 script_dir = os.path.dirname(os.path.abspath(__file__))
@@ -14,22 +18,44 @@ os.chdir(project_root)
 if backend_dir not in sys.path:
     sys.path.insert(0, backend_dir)
 
-from app.services.evaluation_service import RAGEvaluationService
+from _cache import DEFAULT_CACHE_DIR, AnswerCache
 
 
 # Default test user ID
 DEFAULT_USER_ID = "99d0b344-1647-465c-9663-25e9207c69f4"
 
 
-def load_dataset(path: str):
-    """Load QA pairs from JSON file."""
+def load_dataset(path: str, limit: Optional[int] = None) -> Tuple[List[str], List[str]]:
+    """Load QA pairs from JSON file as (questions, ground_truths).
+    
+    Only the first ``limit`` records are unpacked when a limit is given.
+    """
     try:
-        with open(path, 'r', encoding='utf-8') as f:
-            data = json.load(f)
-        return data
+        dataset = orjson.loads(Path(path).read_bytes())
     except Exception as e:
         print(f"Error loading dataset {path}: {e}")
         sys.exit(1)
+    
+    records = dataset[:limit] if limit else dataset
+    return [qa["question"] for qa in records], [qa["ground_truth"] for qa in records]
+
+
+def _percent(value: Any) -> Optional[str]:
+    return f"{value:.2%}" if isinstance(value, (int, float)) else None
+
+
+def format_details(questions: List[str], details: List[Dict[str, Any]]) -> str:
+    """Render the per-question metric block as one string."""
+    buf = io.StringIO()
+    w = buf.write
+    for i, detail in enumerate(details):
+        q = questions[i] if i < len(questions) else "N/A"
+        faith = _percent(detail.get('faithfulness'))
+        rel = _percent(detail.get('response_relevancy'))
+        w(f"\nQ{i+1}: {q[:50]}...\n")
+        w(f"    Faithfulness: {faith}\n" if faith else "    Faithfulness: N/A\n")
+        w(f"    Relevancy:    {rel}\n" if rel else "    Relevancy: N/A\n")
+    return buf.getvalue()
 
 
 def main():
@@ -38,55 +64,85 @@ def main():
     parser.add_argument("--no-ground-truth", action="store_true", help="Skip context_recall metric")
     parser.add_argument("--output", type=str, default="evaluation_results.json", help="Output JSON filename")
     parser.add_argument("--user-id", type=str, default=DEFAULT_USER_ID, help="User ID for access")
+    parser.add_argument("--concurrency", type=int, default=4, help="Questions answered in parallel")
+    parser.add_argument("--judge-concurrency", type=int, default=16, help="Concurrent RAGAS metric (judge) calls")
+    parser.add_argument("--batch-size", type=int, default=None, help="Judge each batch of answers while the next batch runs")
+    parser.add_argument("--embed-batch", type=int, default=64, help="Max texts per embedding request when scoring")
+    parser.add_argument("--cache", action="store_true", help="Reuse agent answers cached by earlier runs with the same settings (ignores document and code changes)")
+    parser.add_argument("--cache-dir", type=str, default=DEFAULT_CACHE_DIR, help="Directory for cached agent answers")
     
     default_dataset = os.path.join(os.path.dirname(__file__), "datasets", "tesla_10k_qa.json")
     parser.add_argument("--dataset", type=str, default=default_dataset, help="Path to QA dataset JSON")
     
     args = parser.parse_args()
     
+    # Resolve (and create) the output location before the expensive run, so a
+    # bad path fails now rather than after every question has been scored
+    if os.path.isabs(args.output):
+        output_path = Path(args.output)
+    else:
+        output_path = Path(f"backend/evaluation/results/{args.output}")
+    try:
+        output_path.parent.mkdir(parents=True, exist_ok=True)
+    except OSError as e:
+        print(f"Error preparing output directory {output_path.parent}: {e}")
+        sys.exit(1)
+    
     print("\n" + "=" * 60)
     print("Agent Pipeline Evaluation using RAGAS")
     print("=" * 60)
     
     # Load dataset
     print(f"Loading dataset from: {args.dataset}")
-    dataset = load_dataset(args.dataset)
-    
-    # Extract questions and ground truths
-    all_questions = [qa["question"] for qa in dataset]
-    all_ground_truths = [qa["ground_truth"] for qa in dataset]
+    questions, ground_truths = load_dataset(args.dataset, args.sample)
+    if not questions:
+        print(f"No questions to evaluate in {args.dataset}")
+        sys.exit(1)
+    if args.no_ground_truth:
+        ground_truths = None
 
-    # Initialize service
+    # Initialize service (imported here: RAGAS and its model stack load slowly,
+    # and --help or a bad path should not pay for them)
+    from app.services.evaluation_service import RAGEvaluationService
+    
     try:
-        eval_service = RAGEvaluationService()
+        eval_service = RAGEvaluationService(embed_batch_size=args.embed_batch)
     except Exception as e:
         print(f"Error initializing evaluation service: {e}")
         return
 
-    # Select samples
-    questions = all_questions[:args.sample] if args.sample else all_questions
-    ground_truths = None if args.no_ground_truth else (all_ground_truths[:args.sample] if args.sample else all_ground_truths)
-    
     print(f"\n🔧 Mode: AGENT (multi-step reasoning)")
     print(f"User ID: {args.user_id}")
     print(f"Test questions: {len(questions)}")
     print(f"Ground truth: {'Disabled' if args.no_ground_truth else 'Enabled'}")
-    print(f"Output file: {args.output}")
+    print(f"Concurrency: {args.concurrency} (judge: {args.judge_concurrency})")
+    print(f"Answer cache: {args.cache_dir if args.cache else 'Disabled'}")
+    print(f"Output file: {output_path}")
     
     # Run evaluation
-    print("\n🚀 Running evaluation (this may take a few minutes)...")
+    print("\n🚀 Running evaluation...")
+    
+    from tqdm import tqdm
+    progress = tqdm(total=len(questions), desc="Answering", unit="q")
     
     try:
-        result = eval_service.evaluate_from_agent(
+        result = asyncio.run(eval_service.aevaluate_from_agent(
             user_id=args.user_id,
             test_questions=questions,
             ground_truths=ground_truths,
-        )
+            max_concurrency=args.concurrency,
+            judge_concurrency=args.judge_concurrency,
+            answer_cache=AnswerCache(args.cache_dir) if args.cache else None,
+            batch_size=args.batch_size,
+            on_sample_done=lambda i: progress.update(1),
+        ))
     except Exception as e:
         print(f"\n❌ Evaluation failed: {e}")
         import traceback
         traceback.print_exc()
         return
+    finally:
+        progress.close()
 
     # Print results
     print("\n" + "=" * 60)
@@ -109,11 +165,6 @@ def main():
     print(f"🕐 Timestamp:           {result.timestamp}")
     
     # Save results
-    if os.path.isabs(args.output):
-        output_path = Path(args.output)
-    else:
-        output_path = Path(f"backend/evaluation/results/{args.output}")
-        
     eval_service.save_results(result, output_path)
     print(f"\n💾 Results saved to: {output_path}")
     
@@ -121,13 +172,7 @@ def main():
     print("\n" + "-" * 60)
     print("Per-Question Details:")
     print("-" * 60)
-    for i, detail in enumerate(result.details):
-        q = questions[i] if i < len(questions) else "N/A"
-        print(f"\nQ{i+1}: {q[:50]}...")
-        faith = detail.get('faithfulness')
-        rel = detail.get('response_relevancy')
-        print(f"    Faithfulness: {faith:.2%}" if isinstance(faith, (int, float)) else "    Faithfulness: N/A")
-        print(f"    Relevancy:    {rel:.2%}" if isinstance(rel, (int, float)) else "    Relevancy: N/A")
+    sys.stdout.write(format_details(questions, result.details))
 
 
 if __name__ == "__main__":
@@ -77,16 +77,18 @@ class MockLLMResponder:
     def __init__(self, responses: List[str]):
         self.responses = responses
         self.call_count = 0
+        # Encoded once: replayed for every call past the scripted responses
+        self.final_response = create_llm_response(
+            thought="Providing final answer",
+            final_answer="Default final answer after exhausting responses",
+        )
     
     def __call__(self, messages: List[Dict[str, str]]) -> str:
         if self.call_count < len(self.responses):
             response = self.responses[self.call_count]
             self.call_count += 1
             return response
-        return create_llm_response(
-            thought="Providing final answer",
-            final_answer="Default final answer after exhausting responses",
-        )
+        return self.final_response
 
 
 def create_mock_agent_response(
@@ -12,6 +12,7 @@ sys.path.insert(0, str(Path(__file__).parent.parent))
 
 import asyncio
 import json
+from functools import lru_cache
 from typing import Any, Dict, List
 from unittest.mock import MagicMock, patch
 
@@ -51,13 +52,22 @@ def create_mock_tool(name: str, description: str, return_value: Any) -> Tool:
     )
 
 
+# Canned search hits shared by every example; the agent only reads them
+_SEARCH_RESULTS = ({"id": "chunk1", "text": "Test content about the topic", "section": "intro"},)
+
+
+@lru_cache(maxsize=None)
 def create_registry_with_tools() -> ToolRegistry:
-    """Create a registry with standard test tools."""
+    """Create a registry with standard test tools.
+
+    Built once per module: agents never mutate their registry, so hypothesis
+    examples can share it instead of rebuilding schemas for every run.
+    """
     registry = ToolRegistry()
     registry.register(create_mock_tool(
         "document_search",
         "Search for relevant information in documents",
-        [{"id": "chunk1", "text": "Test content about the topic", "section": "intro"}],
+        _SEARCH_RESULTS,
     ))
     return registry
 
@@ -83,16 +93,18 @@ class MockLLMResponder:
     def __init__(self, responses: List[str]):
         self.responses = responses
         self.call_count = 0
+        # Encoded once: replayed for every call past the scripted responses
+        self.final_response = create_llm_response(
+            thought="Providing final answer",
+            final_answer="Default final answer",
+        )
     
     def __call__(self, messages: List[Dict[str, str]]) -> str:
         if self.call_count < len(self.responses):
             response = self.responses[self.call_count]
             self.call_count += 1
             return response
-        return create_llm_response(
-            thought="Providing final answer",
-            final_answer="Default final answer",
-        )
+        return self.final_response
 
 
 # =============================================================================
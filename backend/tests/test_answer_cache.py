@@ -0,0 +1,43 @@
+import sys
+from pathlib import Path
+sys.path.insert(0, str(Path(__file__).parent.parent))
+
+"""
+Tests for the on-disk evaluation answer cache.
+"""
+
+from evaluation._cache import AnswerCache
+
+
+KEY = "ab" + "0" * 62
+
+
+def test_set_then_get_round_trips(tmp_path):
+    cache = AnswerCache(str(tmp_path))
+    value = {"answer": "Tesla 的营收增长了 19%", "contexts": ["chunk a", "chunk b"], "model": "gpt-4o-mini"}
+
+    cache.set(KEY, value)
+
+    assert cache.get(KEY) == value
+    assert (tmp_path / "ab" / f"{KEY}.json").exists()
+
+
+def test_missing_key_returns_none(tmp_path):
+    assert AnswerCache(str(tmp_path)).get(KEY) is None
+
+
+def test_corrupt_entry_is_a_miss(tmp_path):
+    cache = AnswerCache(str(tmp_path))
+    cache.set(KEY, {"answer": "ok"})
+    (tmp_path / "ab" / f"{KEY}.json").write_bytes(b"{not json")
+
+    assert cache.get(KEY) is None
+
+
+def test_set_overwrites_without_leaving_temp_files(tmp_path):
+    cache = AnswerCache(str(tmp_path))
+    cache.set(KEY, {"answer": "old"})
+    cache.set(KEY, {"answer": "new"})
+
+    assert cache.get(KEY) == {"answer": "new"}
+    assert [p.name for p in (tmp_path / "ab").iterdir()] == [f"{KEY}.json"]
@@ -0,0 +1,135 @@
+import sys
+from pathlib import Path
+sys.path.insert(0, str(Path(__file__).parent.parent))
+
+"""
+Tests for paragraph merging in the structured chunker.
+"""
+
+from typing import List
+
+from hypothesis import given, strategies as st, settings
+
+from app.services.chunking_service import StructuredChunker
+
+
+class WordTokenizer:
+    """Deterministic stand-in for tiktoken: one token per whitespace-separated word."""
+
+    def __init__(self):
+        self.calls = 0
+
+    def encode(self, text: str) -> List[str]:
+        self.calls += 1
+        return text.split()
+
+    def decode(self, tokens: List[str]) -> str:
+        return " ".join(tokens)
+
+
+def _chunker(tokenizer: WordTokenizer) -> StructuredChunker:
+    chunker = StructuredChunker(chunk_size=12, chunk_overlap=5, summarizer_client=object())
+    chunker.tokenizer = tokenizer
+    return chunker
+
+
+def _reference_merge(tokenizer: WordTokenizer, paragraphs: List[str], max_size: int, overlap: int) -> List[str]:
+    """Original merge loop that re-encodes separators and overlap paragraphs."""
+    size = lambda text: len(tokenizer.encode(text))
+    chunks: List[str] = []
+    current: List[str] = []
+    current_size = 0
+    for para in paragraphs:
+        para_size = size(para)
+        if para_size > max_size:
+            if current:
+                chunks.append("\n\n".join(current))
+                current, current_size = [], 0
+            tokens = tokenizer.encode(para)
+            step = max(1, max_size - overlap)
+            for start in range(0, len(tokens), step):
+                end = min(len(tokens), start + max_size)
+                chunks.append(tokenizer.decode(tokens[start:end]))
+                if end == len(tokens):
+                    break
+            continue
+        separator_size = size("\n\n") if current else 0
+        if current_size + separator_size + para_size > max_size:
+            if current:
+                chunks.append("\n\n".join(current))
+            if overlap > 0 and current:
+                overlap_paras: List[str] = []
+                total = 0
+                for prev in reversed(current):
+                    prev_size = size(prev)
+                    if total + prev_size > overlap:
+                        break
+                    overlap_paras.insert(0, prev)
+                    total += prev_size
+                current = overlap_paras + [para]
+                current_size = size("\n\n".join(current))
+            else:
+                current, current_size = [para], para_size
+        else:
+            current.append(para)
+            current_size += separator_size + para_size
+    if current:
+        chunks.append("\n\n".join(current))
+    return chunks
+
+
+paragraph_strategy = st.lists(st.sampled_from(["alpha", "beta", "gamma", "delta"]), min_size=1, max_size=15).map(" ".join)
+
+
+@settings(max_examples=200)
+@given(paragraphs=st.lists(paragraph_strategy, min_size=1, max_size=20))
+def test_merge_small_chunks_matches_reference(paragraphs):
+    tokenizer = WordTokenizer()
+    chunker = _chunker(tokenizer)
+
+    merged = chunker._merge_small_chunks(paragraphs, chunker.chunk_size, chunker.chunk_overlap)
+
+    assert merged == _reference_merge(WordTokenizer(), paragraphs, chunker.chunk_size, chunker.chunk_overlap)
+
+
+def test_merge_small_chunks_encodes_overlap_paragraphs_once():
+    paragraphs = ["one two three", "four five", "six seven eight", "nine ten eleven twelve", "thirteen"] * 4
+    tokenizer = WordTokenizer()
+    chunker = _chunker(tokenizer)
+    reference_tokenizer = WordTokenizer()
+
+    merged = chunker._merge_small_chunks(paragraphs, chunker.chunk_size, chunker.chunk_overlap)
+    expected = _reference_merge(reference_tokenizer, paragraphs, chunker.chunk_size, chunker.chunk_overlap)
+
+    assert merged == expected
+    assert tokenizer.calls < reference_tokenizer.calls
+
+
+def test_serialize_chunks_writes_utf8_json(tmp_path):
+    import json
+
+    from app.services.chunking_service import Chunk
+
+    chunker = _chunker(WordTokenizer())
+    chunks = [Chunk(text="区块链 consensus", metadata={"section_path": "简介"})]
+    destination = tmp_path / "nested" / "doc.json"
+
+    chunker.serialize_chunks(chunks, destination)
+    chunker.serialize_chunks(chunks, destination)
+
+    raw = destination.read_text(encoding="utf-8")
+    assert "区块链" in raw
+    assert json.loads(raw) == [{"text": "区块链 consensus", "metadata": {"section_path": "简介"}}]
+
+
+def test_iter_chunk_batches_matches_chunk_sections():
+    chunker = _chunker(WordTokenizer())
+    sections = [
+        {"path": ["Intro", f"Part {i}"], "text": ["alpha beta gamma delta " * 3, "beta gamma"], "tables": [], "page_number": i}
+        for i in range(7)
+    ]
+
+    batches = list(chunker.iter_chunk_batches(sections, batch_size=4))
+
+    assert all(len(batch) == 4 for batch in batches[:-1])
+    assert [chunk for batch in batches for chunk in batch] == chunker.chunk_sections(sections)
@@ -0,0 +1,66 @@
+import sys
+from pathlib import Path
+sys.path.insert(0, str(Path(__file__).parent.parent))
+
+"""
+Tests for the evaluation comparison report.
+"""
+
+import math
+
+from evaluation.compare import build_report, load_result, metric_value
+
+
+def _result(metrics, details=()):
+    return {"models": {"answer_model": "gpt-4o-mini"}, "metrics": metrics, "details": list(details)}
+
+
+def test_metric_rows_show_delta_and_status():
+    report = build_report(
+        _result({"faithfulness": 0.5, "context_recall": 0.8}),
+        _result({"faithfulness": 0.75, "context_recall": 0.8}),
+        "base.json",
+        "cand.json",
+    )
+
+    assert "| **Faithfulness** | 50.00% | 75.00% | **+25.00%** | ✅ Improved |" in report
+    assert "| **Context Recall** | 80.00% | 80.00% | **0.00%** | ➖ Similar |" in report
+    assert report.endswith("\n") and not report.endswith("\n\n")
+
+
+def test_null_and_nan_metrics_are_reported_as_missing():
+    report = build_report(
+        _result({"context_recall": None, "context_precision": float("nan")}),
+        _result({"context_recall": 0.5, "context_precision": 0.4}),
+        "base.json",
+        "cand.json",
+    )
+
+    assert "| **Context Recall** | N/A | 50.00% | N/A | ➖ Missing |" in report
+    assert "| **Context Precision** | N/A | 40.00% | N/A | ➖ Missing |" in report
+
+
+def test_deep_dive_skips_questions_without_faithfulness():
+    base = _result({}, [
+        {"user_input": "q1", "faithfulness": None},
+        {"user_input": "q2", "faithfulness": 0.1},
+    ])
+    cand = _result({}, [
+        {"user_input": "q1", "faithfulness": 0.9},
+        {"user_input": "q2", "faithfulness": 0.9},
+    ])
+
+    report = build_report(base, cand, "base.json", "cand.json")
+
+    assert "**Q2: q2**" in report
+    assert "Q1" not in report
+
+
+def test_load_result_accepts_bare_nan(tmp_path):
+    path = tmp_path / "result.json"
+    path.write_text('{"metrics": {"context_precision": NaN}}', encoding="utf-8")
+
+    value = load_result(str(path))["metrics"]["context_precision"]
+
+    assert math.isnan(value)
+    assert metric_value(value) is None
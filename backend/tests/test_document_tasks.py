@@ -0,0 +1,188 @@
+import sys
+from pathlib import Path
+sys.path.insert(0, str(Path(__file__).parent.parent))
+
+"""
+Tests for helpers in the document parsing task module.
+"""
+
+import threading
+
+import lxml.html
+import pytest
+
+from app.tasks import document_tasks
+
+
+@pytest.mark.parametrize(
+    ("src", "width", "height", "style", "expected"),
+    [
+        ("/viewer/file.pdf", None, None, "", 5),
+        ("/article-content.html", None, None, "", 1),
+        ("/ads/tracker.js", "1024", "768", "", -6),
+        ("/embed", "100%", "100%", "width: 100%", 6),
+        ("/embed", "640", "abc", "", 0),
+    ],
+)
+def test_score_iframe(src, width, height, style, expected):
+    assert document_tasks._score_iframe(src, width, height, style) == expected
+
+
+def test_select_content_iframe_prefers_highest_positive_score():
+    tree = lxml.html.fromstring(
+        "<html><body>"
+        "<iframe src='https://ads.example.com/banner'></iframe>"
+        "<iframe src='/docs/whitepaper.pdf' width='100%'></iframe>"
+        "<iframe></iframe>"
+        "</body></html>"
+    )
+
+    assert document_tasks._select_content_iframe(tree) == "/docs/whitepaper.pdf"
+
+
+def test_select_content_iframe_ignores_non_positive_scores():
+    tree = lxml.html.fromstring("<html><body><iframe src='/widget'></iframe></body></html>")
+
+    assert document_tasks._select_content_iframe(tree) is None
+
+
+def test_extracted_markdown_keeps_headings_as_section_titles():
+    paragraph = "<p>" + "Proof of work secures the ledger against double spending. " * 10 + "</p>"
+    html = f"<html><body><article><h1>Whitepaper</h1><h2>Consensus</h2>{paragraph}</article></body></html>"
+
+    text = document_tasks._extract_markdown(document_tasks._parse_html(html))
+    elements = document_tasks.StructuredChunker(summarizer_client=object()).parse_plain_text(text)
+
+    assert [e["text"] for e in elements if e["category"] == "Title"] == ["# Whitepaper", "## Consensus"]
+
+
+
+def test_xhtml_with_encoding_declaration_still_extracts_main_content():
+    paragraph = "<p>" + "Proof of work secures the ledger against double spending. " * 10 + "</p>"
+    html = (
+        '<?xml version="1.0" encoding="utf-8"?>'
+        '<html xmlns="http://www.w3.org/1999/xhtml"><body>'
+        f"<nav>Home | About</nav><article><h1>Whitepaper</h1>{paragraph}</article>"
+        "</body></html>"
+    )
+
+    tree = document_tasks._parse_html(html)
+    text = document_tasks._extract_markdown(tree)
+
+    assert tree is not None
+    assert text.startswith("# Whitepaper")
+    assert "<p>" not in text
+
+class RecordingTask:
+    def __init__(self, task_id: str = "task-1"):
+        self.request = type("Request", (), {"id": task_id})()
+        self.updates = []
+
+    def update_state(self, state, meta):
+        self.updates.append(meta["progress"])
+
+
+def test_progress_updates_throttle_intermediate_ticks(monkeypatch):
+    clock = iter([0.0, 0.5, 1.0, 3.0, 3.1])
+    monkeypatch.setattr(document_tasks.time, "monotonic", lambda: next(clock))
+    monkeypatch.setattr(document_tasks.settings, "task_progress_min_interval", 2.0)
+    task = RecordingTask()
+
+    for progress in (0, 30, 50, 90, 100):
+        document_tasks._update_task_progress(task, progress, "msg")
+
+    assert task.updates == [0, 90, 100]
+    assert "task-1" not in document_tasks._PROGRESS_LAST_SENT
+
+
+def test_progress_updates_can_be_disabled(monkeypatch):
+    monkeypatch.setattr(document_tasks.settings, "task_progress_enabled", False)
+    task = RecordingTask()
+
+    document_tasks._update_task_progress(task, 0, "msg")
+
+    assert task.updates == []
+
+
+class FakeChunker:
+    def __init__(self, count: int, fail_at: int = -1):
+        self.count = count
+        self.fail_at = fail_at
+
+    def iter_chunk_batches(self, sections, batch_size):
+        batch = []
+        for idx in range(self.count):
+            if idx == self.fail_at:
+                raise RuntimeError("chunking failed")
+            batch.append(document_tasks.Chunk(text=f"chunk {idx}", metadata={}))
+            if len(batch) >= batch_size:
+                yield batch
+                batch = []
+        if batch:
+            yield batch
+
+
+class FakeEmbedder:
+    batch_size = 3
+
+    def __init__(self, fail_after: int = -1):
+        self.fail_after = fail_after
+        self.embedded = []
+
+    def embed_chunks_inmem(self, document_id, user_id, chunks):
+        for chunk in chunks:
+            if len(self.embedded) == self.fail_after:
+                raise RuntimeError("embedding failed")
+            self.embedded.append(chunk.text)
+
+
+def test_chunk_and_embed_pipeline_embeds_every_chunk_in_order():
+    embedder = FakeEmbedder()
+
+    chunks = document_tasks._chunk_and_embed(FakeChunker(50), embedder, [], "doc", "user")
+
+    assert embedder.embedded == [f"chunk {i}" for i in range(50)]
+    assert [c.text for c in chunks] == embedder.embedded
+
+
+def test_chunk_and_embed_pipeline_propagates_chunker_errors():
+    with pytest.raises(RuntimeError, match="chunking failed"):
+        document_tasks._chunk_and_embed(FakeChunker(50, fail_at=10), FakeEmbedder(), [], "doc", "user")
+
+
+def test_chunk_and_embed_pipeline_stops_producer_when_embedding_fails():
+    with pytest.raises(RuntimeError, match="embedding failed"):
+        document_tasks._chunk_and_embed(FakeChunker(500), FakeEmbedder(fail_after=2), [], "doc", "user")
+
+    assert not [t for t in threading.enumerate() if t.name == "chunker-doc"]
+
+
+def test_file_sha256_matches_whole_file_digest(tmp_path):
+    import hashlib
+
+    payload = bytes(range(256)) * 50
+    path = tmp_path / "doc.pdf"
+    path.write_bytes(payload)
+
+    assert document_tasks._file_sha256(path, block_size=1000) == hashlib.sha256(payload).hexdigest()
+
+
+def test_pdf_and_text_sources_are_hashed_before_parsing(tmp_path):
+    path = tmp_path / "doc.pdf"
+    path.write_bytes(b"%PDF-1.4 test")
+
+    assert document_tasks._source_sha256("pdf", str(path), path.name) == document_tasks._file_sha256(path)
+    assert document_tasks._source_sha256("text", None, "hello") is not None
+    assert document_tasks._source_sha256("url", None, "https://example.com") is None
+
+
+def test_dedup_key_changes_with_embedding_model(monkeypatch):
+    source_hash = "0" * 64
+    monkeypatch.setattr(document_tasks.settings, "embedding_provider", "openai")
+    monkeypatch.setattr(document_tasks.settings, "embedding_model_openai", "text-embedding-3-large")
+    large = document_tasks._dedup_key(source_hash)
+
+    monkeypatch.setattr(document_tasks.settings, "embedding_model_openai", "text-embedding-3-small")
+
+    assert document_tasks._dedup_key(source_hash) != large
+    assert document_tasks._dedup_key(source_hash) != document_tasks._dedup_key("1" * 64)
@@ -4,10 +4,11 @@ import io
 
 from backend.app.tasks import document_tasks
 
+_PDF_BYTES = b"%PDF-1.4\n1 0 obj << /Type /Catalog >>\n"
+
 
 def _upload_pdf(client, token: str) -> str:
-    file_content = b"%PDF-1.4\n1 0 obj << /Type /Catalog >>\n"
-    files = {"file": ("sample.pdf", io.BytesIO(file_content), "application/pdf")}
+    files = {"file": ("sample.pdf", io.BytesIO(_PDF_BYTES), "application/pdf")}
     response = client.post(
         "/api/documents/upload",
         headers={"Authorization": f"Bearer {token}"},
@@ -59,8 +60,7 @@ def test_upload_document_requires_credits(client):
     ledger = service.subscription._ledger(token)  # type: ignore[attr-defined]
     ledger.consumed = service.subscription._monthly_quota(ledger.plan)  # type: ignore[attr-defined]
 
-    file_content = b"%PDF-1.4\n1 0 obj << /Type /Catalog >>\n"
-    files = {"file": ("sample.pdf", io.BytesIO(file_content), "application/pdf")}
+    files = {"file": ("sample.pdf", io.BytesIO(_PDF_BYTES), "application/pdf")}
     response = client.post(
         "/api/documents/upload",
         headers={"Authorization": f"Bearer {token}"},
@@ -90,10 +90,9 @@ def test_upload_document_refund_once_on_inline_failure(client, monkeypatch):
     def failing_embed(*args, **kwargs):
         raise RuntimeError("embed failed")
 
-    monkeypatch.setattr(document_tasks.EmbeddingService, "embed_chunks", failing_embed)
+    monkeypatch.setattr(document_tasks.EmbeddingService, "embed_chunks_inmem", failing_embed)
 
-    file_content = b"%PDF-1.4\n1 0 obj << /Type /Catalog >>\n"
-    files = {"file": ("sample.pdf", io.BytesIO(file_content), "application/pdf")}
+    files = {"file": ("sample.pdf", io.BytesIO(_PDF_BYTES), "application/pdf")}
     response = client.post(
         "/api/documents/upload",
         headers={"Authorization": f"Bearer {token}"},
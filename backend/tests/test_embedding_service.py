@@ -0,0 +1,110 @@
+import sys
+from pathlib import Path
+sys.path.insert(0, str(Path(__file__).parent.parent))
+
+"""
+Tests for embedding chunks from memory versus from the serialized chunk file.
+"""
+
+import logging
+
+from app.services.chunking_service import Chunk, StructuredChunker
+from app.services.embedding_service import EmbeddingService
+
+
+class RecordingCollection:
+    def __init__(self):
+        self.calls = []
+
+    def add(self, documents, embeddings, metadatas, ids):
+        self.calls.append((documents, ids, [{k: v for k, v in m.items() if k != "created_at"} for m in metadatas]))
+
+
+def _service() -> EmbeddingService:
+    service = object.__new__(EmbeddingService)
+    service.collection = RecordingCollection()
+    service.batch_size = 2
+    service.log_dir = None
+    service.logger = logging.getLogger("test.embedding")
+    service._create_embeddings = lambda texts: [[0.0] for _ in texts]
+    return service
+
+
+def test_inmem_embedding_matches_file_embedding(tmp_path):
+    chunks = [Chunk(text=f"chunk {i}", metadata={"page": str(i)}) for i in range(5)]
+    chunks_path = tmp_path / "doc.json"
+    StructuredChunker.serialize_chunks(None, chunks, chunks_path)  # type: ignore[arg-type]
+
+    from_file = _service()
+    from_file.embed_chunks("doc", "user", chunks_path)
+    in_memory = _service()
+    in_memory.embed_chunks_inmem("doc", "user", chunks)
+
+    assert in_memory.collection.calls == from_file.collection.calls
+    assert [len(call[0]) for call in in_memory.collection.calls] == [2, 2, 1]
+    assert in_memory.collection.calls[0][1] == ["doc_chunk_0", "doc_chunk_1"]
+    assert chunks[0].metadata == {"page": "0"}
+
+
+class StoringCollection:
+    """Minimal in-memory stand-in for the Chroma collection get/add API."""
+
+    def __init__(self):
+        self.rows = {}
+
+    def add(self, documents, embeddings, metadatas, ids):
+        for row in zip(ids, documents, embeddings, metadatas):
+            self.rows[row[0]] = row
+
+    @staticmethod
+    def _matches(metadata, where):
+        if "$and" in where:
+            return all(StoringCollection._matches(metadata, clause) for clause in where["$and"])
+        return all(
+            metadata.get(key) == (cond["$eq"] if isinstance(cond, dict) else cond)
+            for key, cond in where.items()
+        )
+
+    def get(self, where, include):
+        rows = [row for row in self.rows.values() if self._matches(row[3], where)]
+        return {
+            "ids": [row[0] for row in rows],
+            "documents": [row[1] for row in rows],
+            "embeddings": [row[2] for row in rows],
+            "metadatas": [row[3] for row in rows],
+        }
+
+
+def test_copy_document_vectors_retags_ids_and_metadata():
+    service = _service()
+    service.collection = StoringCollection()
+    service.embed_chunks_inmem("src", "alice", [Chunk(text=f"chunk {i}", metadata={"page": str(i)}) for i in range(3)])
+
+    copied = service.copy_document_vectors("src", "dst", "alice")
+
+    assert copied == 3
+    result = service.collection.get(where={"document_id": "dst"}, include=["metadatas", "documents"])
+    assert sorted(result["ids"]) == ["dst_chunk_0", "dst_chunk_1", "dst_chunk_2"]
+    assert {m["user_id"] for m in result["metadatas"]} == {"alice"}
+    assert sorted(result["documents"]) == ["chunk 0", "chunk 1", "chunk 2"]
+    assert service.copy_document_vectors("missing", "dst2", "alice") == 0
+    # Another user's vectors are never copied
+    assert service.copy_document_vectors("src", "dst3", "bob") == 0
+
+
+def test_document_chunks_are_ordered_by_chunk_index():
+    class ListingCollection:
+        def get(self, where, include):
+            assert "embeddings" not in include
+            return {
+                "ids": ["doc_chunk_10", "doc_extra", "doc_chunk_2", "doc_chunk_0"],
+                "documents": ["ten", "extra", "two", "zero"],
+                "metadatas": [{}, {}, {}, {}],
+            }
+
+    service = _service()
+    service.collection = ListingCollection()
+
+    chunks = service.get_document_chunks("doc")
+
+    assert [c["text"] for c in chunks] == ["zero", "two", "ten", "extra"]
@@ -0,0 +1,138 @@
+import sys
+from pathlib import Path
+sys.path.insert(0, str(Path(__file__).parent.parent))
+
+"""
+Tests for the RAGAS evaluation service: embedding batching and batched agent evaluation.
+
+RAGAS itself is never run; the judge step is replaced by a stub scorer.
+"""
+
+import asyncio
+from types import SimpleNamespace
+
+import pytest
+
+pytest.importorskip("ragas")
+pd = pytest.importorskip("pandas")
+
+from app.services import agent_service
+from app.services.evaluation_service import RAGEvaluationService, _BatchedEmbeddings
+
+
+class StubEmbedder:
+    def __init__(self):
+        self.document_calls = []
+        self.query_calls = []
+
+    def embed_documents(self, texts):
+        self.document_calls.append(list(texts))
+        return [[float(len(t))] for t in texts]
+
+    async def aembed_documents(self, texts):
+        return self.embed_documents(texts)
+
+    def embed_query(self, text):
+        self.query_calls.append(text)
+        return [float(len(text))]
+
+
+def test_embed_documents_batches_only_unseen_texts():
+    stub = StubEmbedder()
+    embeddings = _BatchedEmbeddings(stub, batch_size=2)
+
+    first = embeddings.embed_documents(["a", "bb", "a", "ccc"])
+    second = embeddings.embed_documents(["bb", "dddd"])
+
+    assert stub.document_calls == [["a", "bb"], ["ccc"], ["dddd"]]
+    assert first == [[1.0], [2.0], [1.0], [3.0]]
+    assert second == [[2.0], [4.0]]
+
+
+def test_aembed_documents_matches_sync_batching():
+    stub = StubEmbedder()
+    embeddings = _BatchedEmbeddings(stub, batch_size=2)
+
+    vectors = asyncio.run(embeddings.aembed_documents(["x", "yy", "x", "zzz"]))
+
+    assert sorted(stub.document_calls) == [["x", "yy"], ["zzz"]]
+    assert vectors == [[1.0], [2.0], [1.0], [3.0]]
+
+
+def test_query_vectors_are_memoized_separately_from_documents():
+    stub = StubEmbedder()
+    embeddings = _BatchedEmbeddings(stub)
+
+    embeddings.embed_documents(["q"])
+    embeddings.embed_query("q")
+    embeddings.embed_query("q")
+
+    assert stub.query_calls == ["q"]
+
+
+class FakeAgentService:
+    calls = []
+
+    async def chat(self, query, user_id):
+        FakeAgentService.calls.append(query)
+        return SimpleNamespace(answer=f"answer {query}", sources=[{"text": f"ctx {query}"}], model_used="stub-model")
+
+
+class DictCache:
+    def __init__(self):
+        self.store = {}
+
+    def get(self, key):
+        return self.store.get(key)
+
+    def set(self, key, value):
+        self.store[key] = value
+
+
+@pytest.fixture
+def service(monkeypatch):
+    FakeAgentService.calls = []
+    monkeypatch.setattr(agent_service, "AgentService", FakeAgentService)
+    service = RAGEvaluationService()
+    service.scored_batches = []
+
+    def score(samples, include_ground_truth, judge_concurrency):
+        service.scored_batches.append([s.question for s in samples])
+        return pd.DataFrame([
+            {"user_input": s.question, "faithfulness": 1.0, "response_relevancy": 0.5, "context_precision": 0.5}
+            for s in samples
+        ])
+
+    monkeypatch.setattr(service, "_score_samples", score)
+    return service
+
+
+def test_batched_evaluation_keeps_question_order(service):
+    questions = [f"q{i}" for i in range(5)]
+    done = []
+
+    result = asyncio.run(service.aevaluate_from_agent(
+        "user", questions, batch_size=2, on_sample_done=done.append,
+    ))
+
+    assert service.scored_batches == [["q0", "q1"], ["q2", "q3"], ["q4"]]
+    assert [d["user_input"] for d in result.details] == questions
+    assert sorted(done) == list(range(5))
+    assert result.sample_count == 5
+    assert result.faithfulness == 1.0
+    assert result.answer_model == "stub-model"
+
+
+def test_cached_answers_skip_the_agent(service):
+    cache = DictCache()
+    asyncio.run(service.aevaluate_from_agent("user", ["q0", "q1"], answer_cache=cache))
+    FakeAgentService.calls = []
+
+    asyncio.run(service.aevaluate_from_agent("user", ["q0", "q1"], answer_cache=cache))
+
+    assert FakeAgentService.calls == []
+
+
+def test_empty_question_set_is_rejected(service):
+    with pytest.raises(ValueError):
+        asyncio.run(service.aevaluate_from_agent("user", []))
@@ -553,3 +553,34 @@ def test_weight_setter_rejects_invalid_values(invalid_weight: float):
         assert False, f"Should have raised ValueError for weight {invalid_weight}"
     except ValueError:
         pass  # Expected
+
+
+@settings(max_examples=50)
+@given(
+    vector_results=vector_results_strategy(min_size=0, max_size=5),
+    bm25_results=bm25_results_strategy(min_size=0, max_size=5),
+    k=st.integers(min_value=1, max_value=10),
+)
+def test_async_search_matches_sync_search(
+    vector_results: List[RetrievalResult],
+    bm25_results: List[RetrievalResult],
+    k: int,
+):
+    """
+    asearch() SHALL return the same fused ranking as search() for the same
+    underlying vector and BM25 results.
+    
+    **Validates: Requirements 6.3, 6.5**
+    """
+    import asyncio
+    import chromadb
+    
+    retriever = HybridRetriever(chroma_client=chromadb.Client())
+    retriever._vector_search = lambda **kwargs: list(vector_results)
+    retriever._bm25_search = lambda **kwargs: list(bm25_results)
+    
+    sync_results = retriever.search("query", "doc", "user", [0.0], k=k)
+    async_results = asyncio.run(retriever.asearch("query", "doc", "user", [0.0], k=k))
+    
+    assert [r.chunk_id for r in async_results] == [r.chunk_id for r in sync_results]
+    assert [r.fused_score for r in async_results] == [r.fused_score for r in sync_results]
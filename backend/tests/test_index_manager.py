@@ -224,6 +224,29 @@ class TestIndexDocument:
         assert stored_doc["metadata"]["document_id"] == "doc123"
         assert stored_doc["metadata"]["custom_field"] == "value"
 
+    def test_repeated_metadata_values_are_shared(self, index_manager, mock_vector_collection, bm25_store):
+        """Equal section paths become one object, in memory and in the reloaded BM25 index."""
+        section = "1. 技术 -> 共识"
+        request = IndexDocumentRequest(
+            document_id="doc123",
+            user_id="user456",
+            chunk_ids=["chunk1", "chunk2"],
+            texts=["Hello world", "Goodbye world"],
+            embeddings=[[0.1, 0.2], [0.3, 0.4]],
+            # Built separately, as after a JSON round-trip: equal but distinct
+            metadatas=[{"section_path": "".join(section)}, {"section_path": "".join(section)}],
+        )
+        assert request.metadatas[0]["section_path"] is not request.metadatas[1]["section_path"]
+
+        assert index_manager.index_document(request).success is True
+
+        first = mock_vector_collection.documents["chunk1"]["metadata"]["section_path"]
+        second = mock_vector_collection.documents["chunk2"]["metadata"]["section_path"]
+        assert first == section and first is second
+
+        loaded = bm25_store.load("doc123").get_chunks()
+        assert loaded[0].metadata["section_path"] is loaded[1].metadata["section_path"]
+
 
 class TestDeleteDocument:
     """Tests for delete_document method."""
@@ -0,0 +1,96 @@
+import sys
+from pathlib import Path
+sys.path.insert(0, str(Path(__file__).parent.parent))
+
+"""
+Tests for the LLM response cache and its use in intent classification.
+"""
+
+from types import SimpleNamespace
+
+from app.services import llm_cache
+from app.services.llm_cache import LLMCache, MemoryCacheBackend
+
+
+def test_cache_key_is_stable_and_sensitive_to_inputs():
+    messages = [{"role": "user", "content": "什么是共识机制?"}]
+
+    key = LLMCache.cache_key("gpt-4o-mini", messages, 0.1, {"type": "json_object"})
+
+    assert key == LLMCache.cache_key("gpt-4o-mini", [dict(messages[0])], 0.1, {"type": "json_object"})
+    assert key != LLMCache.cache_key("gpt-4o-mini", messages, 0.2, {"type": "json_object"})
+    assert key != LLMCache.cache_key("gpt-4o", messages, 0.1, {"type": "json_object"})
+    assert key.startswith("llm:")
+
+
+def test_memory_backend_expires_and_evicts(monkeypatch):
+    now = [100.0]
+    monkeypatch.setattr(llm_cache.time, "monotonic", lambda: now[0])
+    backend = MemoryCacheBackend(max_entries=2)
+
+    backend.set("a", "1", ttl=10)
+    backend.set("b", "2", ttl=10)
+    assert backend.get("a") == "1"
+    backend.set("c", "3", ttl=10)  # evicts least recently used "b"
+
+    assert backend.get("b") is None
+    assert backend.get("c") == "3"
+    now[0] = 111.0
+    assert backend.get("a") is None
+
+
+class DictRedis:
+    """In-memory stand-in for the two Redis commands CacheService uses."""
+
+    def __init__(self):
+        self.values = {}
+
+    def get(self, key):
+        return self.values.get(key)
+
+    def setex(self, key, ttl, value):
+        self.values[key] = value
+
+
+def test_redis_backend_records_llm_hits_and_misses():
+    from app.services.cache_service import CacheService
+
+    backend = CacheService(redis_client=DictRedis(), metric_layers=[LLMCache.LAYER])
+    cache = LLMCache(backend)
+
+    assert cache.get("llm:k") is None
+    cache.set("llm:k", "answer")
+    assert cache.get("llm:k") == "answer"
+    assert cache.get("llm:k") == "answer"
+
+    assert backend.metrics["llm"] == {"hit": 2, "miss": 1}
+
+
+def make_fake_openai(content: str) -> SimpleNamespace:
+    """Minimal chat-completions client returning ``content``; requests land in ``.calls``."""
+    response = SimpleNamespace(choices=[SimpleNamespace(message=SimpleNamespace(content=content))])
+    calls = []
+
+    def create(**kwargs):
+        calls.append(kwargs)
+        return response
+
+    return SimpleNamespace(chat=SimpleNamespace(completions=SimpleNamespace(create=create)), calls=calls)
+
+
+def test_router_reuses_cached_classification(monkeypatch):
+    from app.agent.router import IntentRouter
+    from app.agent.types import IntentType
+
+    cache = LLMCache(MemoryCacheBackend())
+    monkeypatch.setattr("app.agent.router.get_llm_cache", lambda: cache)
+    client = make_fake_openai('{"intent": "WEB_SEARCH", "confidence": 0.9, "reasoning": "news"}')
+    router = IntentRouter(openai_client=client)
+    router.provider = "openai"
+    router.openai = client
+
+    first = router.classify("latest bitcoin price today")
+    second = router.classify("latest bitcoin price today")
+
+    assert first.intent == second.intent == IntentType.WEB_SEARCH
+    assert len(client.calls) == 1
@@ -0,0 +1,116 @@
+import sys
+from pathlib import Path
+sys.path.insert(0, str(Path(__file__).parent.parent))
+
+"""
+Tests for the process-wide shared OpenAI clients.
+"""
+
+import asyncio
+import json
+import threading
+import weakref
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+
+import pytest
+
+from app.core.config import get_settings
+from app.services import openai_client
+from app.services.openai_client import get_async_client, get_openai_client
+
+
+class _ChatCompletionHandler(BaseHTTPRequestHandler):
+    """Minimal keep-alive chat completions endpoint; replies are set per server."""
+
+    protocol_version = "HTTP/1.1"
+
+    def do_POST(self):
+        self.rfile.read(int(self.headers.get("Content-Length", 0)))
+        body = json.dumps({
+            "id": "chatcmpl-test",
+            "object": "chat.completion",
+            "created": 0,
+            "model": "test-model",
+            "choices": [{"index": 0, "finish_reason": "stop", "message": self.server.reply}],
+        }).encode()
+        self.send_response(200)
+        self.send_header("Content-Type", "application/json")
+        self.send_header("Content-Length", str(len(body)))
+        self.end_headers()
+        self.wfile.write(body)
+
+    def log_message(self, format, *args):
+        pass
+
+
+@pytest.fixture
+def fresh_clients(monkeypatch):
+    monkeypatch.setenv("OPENAI_API_KEY", "sk-test")
+    monkeypatch.setattr(openai_client, "_OPENAI_CLIENT", None)
+    monkeypatch.setattr(openai_client, "_async_openai_clients", weakref.WeakKeyDictionary())
+
+
+@pytest.fixture
+def chat_server(fresh_clients, monkeypatch):
+    server = ThreadingHTTPServer(("127.0.0.1", 0), _ChatCompletionHandler)
+    server.reply = {"role": "assistant", "content": "pong"}
+    thread = threading.Thread(target=server.serve_forever, daemon=True)
+    thread.start()
+    monkeypatch.setenv("OPENAI_BASE_URL", f"http://127.0.0.1:{server.server_port}/v1")
+    monkeypatch.setattr(get_settings(), "openai_max_retries", 0)
+    yield server
+    server.shutdown()
+    server.server_close()
+
+
+def test_clients_are_shared_and_configured(fresh_clients):
+    settings = get_settings()
+
+    async def clients():
+        return get_async_client(), get_async_client()
+
+    client = get_openai_client()
+    async_client, again = asyncio.run(clients())
+
+    assert get_openai_client() is client
+    assert again is async_client
+    for c in (client, async_client):
+        assert c.max_retries == settings.openai_max_retries
+        assert c.timeout.read == settings.openai_timeout
+        assert c.timeout.connect == 5.0
+
+
+def test_async_client_survives_repeated_event_loops(chat_server):
+    async def ask():
+        response = await get_async_client().chat.completions.create(
+            model="test-model", messages=[{"role": "user", "content": "ping"}]
+        )
+        return response.choices[0].message.content
+
+    # Each asyncio.run gets its own client; a pooled connection from the
+    # first (closed) loop must not be reused by the second
+    assert asyncio.run(ask()) == "pong"
+    assert asyncio.run(ask()) == "pong"
+
+
+def test_agent_runs_under_repeated_event_loops(chat_server, monkeypatch):
+    from app.agent.react_agent import ReActAgent
+    from app.agent.tools.registry import ToolRegistry
+
+    settings = get_settings()
+    monkeypatch.setattr(settings, "llm_provider", "openai")
+    monkeypatch.setattr(settings, "openai_api_key", "sk-test")
+    chat_server.reply = {
+        "role": "assistant",
+        "content": None,
+        "tool_calls": [{
+            "id": "call_1",
+            "type": "function",
+            "function": {"name": "finish", "arguments": json.dumps({"answer": "done"})},
+        }],
+    }
+    # Built once outside any loop, like the agent behind the sync evaluation wrapper
+    agent = ReActAgent(tool_registry=ToolRegistry(), router=None)
+
+    assert asyncio.run(agent.run("q", user_id="u")).answer == "done"
+    assert asyncio.run(agent.run("q", user_id="u")).answer == "done"
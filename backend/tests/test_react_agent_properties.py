@@ -12,6 +12,7 @@ Property-based tests for ReAct Agent.
 
 import asyncio
 import json
+from functools import lru_cache
 from typing import Any, Dict, List
 from unittest.mock import MagicMock, patch
 
@@ -50,13 +51,22 @@ def create_mock_tool(name: str, description: str, return_value: Any) -> Tool:
     )
 
 
+# Canned search hits shared by every example; the agent only reads them
+_SEARCH_RESULTS = ({"id": "chunk1", "text": "Test content", "section": "intro"},)
+
+
+@lru_cache(maxsize=None)
 def create_registry_with_tools() -> ToolRegistry:
-    """Create a registry with standard test tools."""
+    """Create a registry with standard test tools.
+
+    Built once per module: agents never mutate their registry, so hypothesis
+    examples can share it instead of rebuilding schemas for every run.
+    """
     registry = ToolRegistry()
     registry.register(create_mock_tool(
         "document_search",
         "Search for relevant information in documents",
-        [{"id": "chunk1", "text": "Test content", "section": "intro"}],
+        _SEARCH_RESULTS,
     ))
     return registry
 
@@ -93,6 +103,11 @@ class MockLLMResponder:
         """
         self.responses = responses
         self.call_count = 0
+        # Encoded once: replayed for every call past the scripted responses
+        self.final_response = create_llm_response(
+            thought="Providing final answer",
+            final_answer="Default final answer after exhausting responses",
+        )
     
     def __call__(self, messages: List[Dict[str, str]]) -> str:
         """Return the next response in sequence."""
@@ -101,10 +116,7 @@ class MockLLMResponder:
             self.call_count += 1
             return response
         # If we run out of responses, return a final answer
-        return create_llm_response(
-            thought="Providing final answer",
-            final_answer="Default final answer after exhausting responses",
-        )
+        return self.final_response
 
 
 # =============================================================================
@@ -842,3 +854,225 @@ def test_agent_handles_immediate_final_answer(
     assert len(response.intermediate_steps) == 1
     assert response.intermediate_steps[0].action is None
     assert response.answer == "Direct answer without tool use."
+
+
+def test_parallel_tool_calls_execute_concurrently():
+    """Tool calls issued in one LLM turn run concurrently and each gets a tool message."""
+    import threading
+    import time
+
+    from app.agent.react_agent import ToolCall
+
+    active = {"now": 0, "peak": 0}
+    lock = threading.Lock()
+
+    def slow_search(**kwargs: Any) -> Any:
+        with lock:
+            active["now"] += 1
+            active["peak"] = max(active["peak"], active["now"])
+        time.sleep(0.1)
+        with lock:
+            active["now"] -= 1
+        return [{"id": kwargs["query"], "text": f"result for {kwargs['query']}"}]
+
+    registry = ToolRegistry()
+    registry.register(Tool(
+        schema=ToolSchema(name="document_search", description="search", parameters={"type": "object", "properties": {}}),
+        handler=slow_search,
+    ))
+    agent = ReActAgent(tool_registry=registry, router=None, max_steps=3)
+    agent.provider = "openai"
+
+    calls = [ToolCall(name="document_search", arguments={"query": f"q{i}"}, id=f"call_{i}") for i in range(3)]
+    histories = []
+
+    def responder(messages):
+        histories.append(list(messages))
+        if len(histories) == 1:
+            return "searching", calls[0]._replace(parallel=tuple(calls[1:]))
+        return "", ToolCall(name="finish", arguments={"answer": "done"}, id="call_finish")
+
+    with patch.object(agent, '_call_llm', side_effect=responder):
+        response = asyncio.run(agent.run(query="compare", user_id="user"))
+
+    assert response.answer == "done"
+    assert active["peak"] == 3
+    assert len(response.intermediate_steps) == 2
+    tool_messages = [m for m in histories[1] if m["role"] == "tool"]
+    assert [m["tool_call_id"] for m in tool_messages] == ["call_0", "call_1", "call_2"]
+    assert "result for q2" in tool_messages[2]["content"]
+    assert [tc["id"] for tc in histories[1][-4]["tool_calls"]] == ["call_0", "call_1", "call_2"]
+
+
+def test_single_tool_call_runs_off_the_event_loop():
+    """A lone tool call still runs in a worker thread so other sessions keep the loop."""
+    import threading
+
+    from app.agent.react_agent import ToolCall
+
+    caller_threads = []
+
+    def search(**kwargs: Any) -> Any:
+        caller_threads.append(threading.current_thread())
+        return [{"id": "c1", "text": "result"}]
+
+    registry = ToolRegistry()
+    registry.register(Tool(
+        schema=ToolSchema(name="document_search", description="search", parameters={"type": "object", "properties": {}}),
+        handler=search,
+    ))
+    agent = ReActAgent(tool_registry=registry, router=None)
+    call = ToolCall(name="document_search", arguments={"query": "q"}, id="call_0")
+
+    observations = asyncio.run(agent._execute_tool_calls([call], "user"))
+
+    assert "result" in observations[0]
+    assert caller_threads and caller_threads[0] is not threading.main_thread()
+
+
+@given(queries=st.lists(st.sampled_from(["a", "b", "c"]), min_size=1, max_size=10))
+def test_duplicate_tool_calls_are_planned_once(queries: List[str]):
+    """Identical calls in one turn collapse to one execution that every duplicate maps back to."""
+    from app.agent.react_agent import ToolCall
+
+    calls = [ToolCall(name="document_search", arguments={"query": q}, id=f"call_{i}") for i, q in enumerate(queries)]
+    unique_calls, slots = ReActAgent._plan_tool_calls(calls)
+
+    assert [c.arguments["query"] for c in unique_calls] == list(dict.fromkeys(queries))
+    assert [unique_calls[slot].arguments["query"] for slot in slots] == queries
+
+
+def test_repeated_search_results_are_listed_once_in_sources():
+    """A chunk returned by several searches appears once, with sources numbered contiguously."""
+    agent = ReActAgent(tool_registry=ToolRegistry(), router=None, max_steps=3)
+    sources: List[Dict[str, Any]] = []
+    seen: set = set()
+
+    first = json.dumps([{"id": "c1", "text": "alpha"}, {"id": "c2", "text": "beta"}])
+    second = json.dumps([{"id": "c2", "text": "beta"}, {"id": "c3", "text": "gamma"}])
+    agent._extract_sources("document_search", first, sources, seen)
+    agent._extract_sources("document_search", second, sources, seen)
+
+    assert [s["textSnippet"] for s in sources] == ["alpha", "beta", "gamma"]
+    assert [s["documentId"] for s in sources] == ["1", "2", "3"]
+
+
+def test_structured_tool_results_are_serialized_compactly():
+    """List/dict tool results become single-line JSON observations that still round-trip."""
+    chunks = [{"id": f"c{i}", "text": f"段落 {i}", "section": "A -> B"} for i in range(3)]
+    registry = ToolRegistry()
+    registry.register(Tool(
+        schema=ToolSchema(name="document_search", description="search", parameters={"type": "object", "properties": {}}),
+        handler=lambda **kwargs: chunks,
+    ))
+    agent = ReActAgent(tool_registry=registry, router=None, max_steps=3)
+
+    observation = agent._execute_tool("document_search", {"query": "q"}, "user")
+
+    assert "\n" not in observation and ", " not in observation
+    assert "段落 0" in observation
+    assert json.loads(observation) == chunks
+
+
+def test_stream_yields_parallel_tool_results_as_they_finish():
+    """A fast parallel call's result is streamed before a slow sibling finishes."""
+    import time
+
+    from app.agent.react_agent import ToolCall
+
+    def search(**kwargs: Any) -> Any:
+        time.sleep(0.3 if kwargs["query"] == "slow" else 0.0)
+        return [{"id": kwargs["query"], "text": kwargs["query"]}]
+
+    registry = ToolRegistry()
+    registry.register(Tool(
+        schema=ToolSchema(name="document_search", description="search", parameters={"type": "object", "properties": {}}),
+        handler=search,
+    ))
+    agent = ReActAgent(tool_registry=registry, router=None, max_steps=3)
+    agent.provider = "openai"
+
+    calls = [ToolCall(name="document_search", arguments={"query": q}, id=f"call_{q}") for q in ("slow", "fast")]
+    histories = []
+
+    def responder(messages):
+        histories.append(list(messages))
+        if len(histories) == 1:
+            return "", calls[0]._replace(parallel=(calls[1],))
+        return "", ToolCall(name="finish", arguments={"answer": "done"}, id="call_finish")
+
+    async def collect():
+        return [event async for event in agent.stream(query="compare", user_id="user")]
+
+    with patch.object(agent, '_call_llm', side_effect=responder):
+        events = asyncio.run(collect())
+
+    results = [json.loads(e.content)[0]["id"] for e in events if e.event_type == "tool_result"]
+    assert results == ["fast", "slow"]
+    assert events[-1].event_type == "answer"
+    # Citations are numbered in call order regardless of which call finished first
+    assert [s["textSnippet"] for s in events[-1].metadata["sources"]] == ["slow", "fast"]
+    tool_messages = [m for m in histories[1] if m["role"] == "tool"]
+    assert [m["tool_call_id"] for m in tool_messages] == ["call_slow", "call_fast"]
+
+
+def test_system_prompt_keeps_date_in_suffix():
+    """Only the trailing Operational Context varies by date, so the prompt prefix stays cacheable."""
+    from app.agent.prompts import REACT_AGENT_SYSTEM_PROMPT
+
+    first = REACT_AGENT_SYSTEM_PROMPT.format(current_date="2024-01-01")
+    second = REACT_AGENT_SYSTEM_PROMPT.format(current_date="2024-01-02")
+    static_prefix = REACT_AGENT_SYSTEM_PROMPT.split("{current_date}")[0]
+
+    assert first.startswith(static_prefix) and second.startswith(static_prefix)
+    assert static_prefix.rstrip().endswith("**Current Date**:")
+
+
+def test_openai_calls_do_not_block_the_event_loop():
+    """The async client is awaited; an injected sync client runs off the event loop thread."""
+    import threading
+    from types import SimpleNamespace
+    from unittest.mock import AsyncMock
+
+    from openai import AsyncOpenAI
+
+    message = SimpleNamespace(content="thinking", tool_calls=None)
+    response = SimpleNamespace(choices=[SimpleNamespace(message=message)])
+
+    async_client = AsyncOpenAI(api_key="test-key")
+    async_client.chat.completions.create = AsyncMock(return_value=response)
+    agent = ReActAgent(tool_registry=create_registry_with_tools(), router=None)
+    agent.provider = "openai"
+    agent.openai = async_client
+
+    assert asyncio.run(agent._call_llm([{"role": "user", "content": "hi"}])) == ("thinking", None)
+    async_client.chat.completions.create.assert_awaited_once()
+
+    caller_threads = []
+
+    def create(**kwargs: Any) -> Any:
+        caller_threads.append(threading.current_thread())
+        return response
+
+    sync_client = MagicMock()
+    sync_client.chat.completions.create.side_effect = create
+    agent.openai = sync_client
+
+    assert asyncio.run(agent._call_llm([{"role": "user", "content": "hi"}])) == ("thinking", None)
+    assert caller_threads and caller_threads[0] is not threading.main_thread()
+
+
+def test_synthesis_sends_repeated_observations_once():
+    """Identical observations from repeated searches appear once, in first-seen order."""
+    agent = ReActAgent(tool_registry=create_registry_with_tools(), router=None)
+    prompts = []
+
+    def responder(messages):
+        prompts.append(messages[-1]["content"])
+        return "summary", None
+
+    with patch.object(agent, '_call_llm', side_effect=responder):
+        answer = asyncio.run(agent._synthesize_final_answer("q", ["A", "B", "A", "C", "B"], []))
+
+    assert answer == "summary"
+    assert prompts[0].endswith("Info:\nA\nB\nC")
@@ -0,0 +1,142 @@
+import sys
+from pathlib import Path
+sys.path.insert(0, str(Path(__file__).parent.parent))
+
+"""
+Tests for the rule-based reranker used as the neural reranker fallback.
+"""
+
+from typing import Dict, List
+
+from hypothesis import given, strategies as st, settings
+
+from app.services.rerank_service import RuleBasedReranker
+
+
+def _reference_rerank(reranker: RuleBasedReranker, query: str, chunks: List[Dict], top_n: int) -> List[Dict]:
+    """Straightforward two-pass grouping the optimized implementation must match."""
+    section_groups: Dict[str, List[Dict]] = {}
+    for chunk in chunks:
+        section = chunk.get("metadata", {}).get("section_path", "unknown")
+        section_groups.setdefault(section, []).append(chunk)
+
+    scores = []
+    for section, section_chunks in section_groups.items():
+        distances = [c.get("distance", 1.0) for c in section_chunks]
+        score = sum(distances) / len(distances)
+        if any(core in section for core in reranker.CORE_SECTIONS):
+            score *= 0.7
+        has_table = any(c.get("metadata", {}).get("element_type") == "table" for c in section_chunks)
+        if ("表格" in query or "table" in query.lower()) and has_table:
+            score *= 0.8
+        scores.append((section, score))
+    scores.sort(key=lambda item: item[1])
+
+    reranked = []
+    for section, section_score in scores:
+        for chunk in sorted(section_groups[section], key=lambda c: int(c.get("metadata", {}).get("chunk_index", 0))):
+            chunk_copy = chunk.copy()
+            chunk_copy["rerank_score"] = 1.0 - section_score
+            reranked.append(chunk_copy)
+    return reranked[:top_n]
+
+
+chunk_strategy = st.fixed_dictionaries({
+    "id": st.uuids().map(str),
+    "text": st.text(max_size=20),
+    "distance": st.floats(min_value=0.0, max_value=2.0, allow_nan=False),
+    "metadata": st.fixed_dictionaries({
+        "section_path": st.sampled_from(["Abstract", "1. Intro", "2. Design", "结论"]),
+        "chunk_index": st.integers(min_value=0, max_value=50),
+        "element_type": st.sampled_from(["text", "table"]),
+    }),
+})
+
+
+@settings(max_examples=100)
+@given(
+    chunks=st.lists(chunk_strategy, max_size=15),
+    query=st.sampled_from(["what is the design", "show the table", "费用表格"]),
+    top_n=st.integers(min_value=0, max_value=20),
+)
+def test_rerank_chunks_with_metadata_matches_reference(chunks: List[Dict], query: str, top_n: int):
+    reranker = RuleBasedReranker()
+    assert reranker.rerank_chunks_with_metadata(query, chunks, top_n) == _reference_rerank(
+        reranker, query, chunks, top_n
+    )
+
+
+def test_rerank_chunks_with_metadata_handles_missing_metadata():
+    reranker = RuleBasedReranker()
+    chunks = [{"text": "a", "distance": 0.2}, {"text": "b", "metadata": None}]
+
+    result = reranker.rerank_chunks_with_metadata("query", chunks, top_n=5)
+
+    assert [c["text"] for c in result] == ["a", "b"]
+    assert all("rerank_score" in c for c in result)
+
+
+class RecordingReranker(RuleBasedReranker):
+    def __init__(self):
+        super().__init__()
+        self.calls: List[List[str]] = []
+
+    def _rerank_impl(self, query, documents, top_n):
+        self.calls.append(list(documents))
+        return super()._rerank_impl(query, documents, top_n)
+
+
+def test_rerank_chunks_sends_duplicate_texts_once():
+    reranker = RecordingReranker()
+    chunks = [
+        {"id": "a", "text": "Bitcoin  consensus"},
+        {"id": "b", "text": "bitcoin consensus "},
+        {"id": "c", "text": "fee market"},
+    ]
+
+    result = reranker.rerank_chunks("bitcoin consensus", chunks, top_n=3)
+
+    assert reranker.calls == [["Bitcoin  consensus", "fee market"]]
+    assert [c["id"] for c in result] == ["a", "c"]
+
+
+def test_rerank_chunks_keeps_one_chunk_per_duplicate_group():
+    reranker = RecordingReranker()
+    chunks = [{"id": str(i), "text": "same text"} for i in range(4)] + [{"id": "x", "text": "other text"}]
+
+    result = reranker.rerank_chunks("same", chunks, top_n=2)
+
+    assert sorted(c["id"] for c in result) == ["0", "x"]
+
+
+def test_bge_models_are_shared_across_instances(monkeypatch):
+    from app.services import rerank_service
+
+    class FakeModel:
+        def compute_score(self, pairs, normalize=True):
+            return [0.5 for _ in pairs]
+
+    monkeypatch.setattr(rerank_service.BGEReranker, "_models", {"fake-model": FakeModel()})
+
+    first = rerank_service.BGEReranker(model_name="fake-model")
+    first.warmup()
+    second = rerank_service.BGEReranker(model_name="fake-model")
+
+    assert second._load_model() is first._load_model()
+    assert second.rerank("q", ["doc"], top_n=1)[0].relevance_score == 0.5
+
+
+def test_async_http_client_is_shared_per_event_loop():
+    import asyncio
+
+    from app.services.rerank_service import get_async_http_client
+
+    async def twice():
+        return get_async_http_client(), get_async_http_client()
+
+    first_a, first_b = asyncio.run(twice())
+    second, _ = asyncio.run(twice())
+
+    assert first_a is first_b
+    # A later asyncio.run must not reuse the client bound to the closed loop
+    assert second is not first_a
@@ -0,0 +1,22 @@
+import sys
+from pathlib import Path
+sys.path.insert(0, str(Path(__file__).parent.parent))
+
+"""
+Tests for process-wide client sharing in RetrievalService.
+"""
+
+from types import SimpleNamespace
+
+from app.agent.retrieval.hybrid_retriever import HybridRetriever  # noqa: F401  load app.agent first (import cycle)
+from app.services import retrieval_service
+
+
+def test_gemini_clients_are_shared_per_api_key(monkeypatch):
+    monkeypatch.setattr(retrieval_service, "genai", SimpleNamespace(Client=lambda api_key: SimpleNamespace(api_key=api_key)))
+    monkeypatch.setattr(retrieval_service, "_GEMINI_CLIENTS", {})
+
+    first = retrieval_service._get_gemini_client("key-a")
+
+    assert retrieval_service._get_gemini_client("key-a") is first
+    assert retrieval_service._get_gemini_client("key-b").api_key == "key-b"
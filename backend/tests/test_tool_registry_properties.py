@@ -171,6 +171,28 @@ def test_tool_registry_round_trip(
     assert listed_schema.required == original_schema.required, "Listed tool required fields should match"
 
 
+@settings(max_examples=50)
+@given(tool_names=st.lists(valid_tool_name, min_size=1, max_size=4, unique=True))
+def test_exported_tool_definitions_track_registrations(tool_names: List[str]):
+    """
+    Exported OpenAI/Gemini definitions are reused between calls and rebuilt
+    after every registration, so they always list exactly the registered tools.
+    """
+    registry = ToolRegistry()
+    for name in tool_names:
+        registry.register(Tool(
+            schema=ToolSchema(name=name, description="d", parameters={"properties": {}}),
+            handler=lambda **kwargs: None,
+        ))
+        openai_tools = registry.to_openai_tools()
+        gemini_tools = registry.to_gemini_tools()
+
+        assert registry.to_openai_tools() is openai_tools
+        assert registry.to_gemini_tools() is gemini_tools
+        assert [t["function"]["name"] for t in openai_tools] == [s.name for s in registry.list_tools()]
+        assert [t["name"] for t in gemini_tools] == [s.name for s in registry.list_tools()]
+
+
 @settings(max_examples=100)
 @given(
     tool_names=st.lists(valid_tool_name, min_size=2, max_size=5, unique=True),
@@ -1,39 +1,98 @@
 #!/usr/bin/env python3
-"""Test MinerU table extraction after fix."""
+"""Test MinerU table extraction after fix.
+
+Usage: python test_mineru.py [--workers N] [PDF ...]
+
+With the default single worker all PDFs are parsed in one process, so
+MinerU's model singleton is loaded once and reused. ``--workers N`` parses
+files in N spawned processes instead (each loads its own models), which pays
+off for many PDFs on a machine with spare cores and memory.
+"""
+import argparse
 import sys
+import time
+from pathlib import Path
+
+ROOT = Path(__file__).resolve().parent
+
+def report_tables(result):
+    print(f"Backend: {result['backend']}")
+
+    # Find table elements
+    tables = [e for e in result['elements'] if e['category'] == 'Table']
+    print(f"Tables found: {len(tables)}")
+
+    # Show first few tables with content
+    for i, t in enumerate(tables[:3]):
+        print(f"\n=== Table {i+1} (Page {t['metadata'].get('page_number')}) ===")
+        text = t['text']
+        if text:
+            print(f"Text ({len(text)} chars):")
+            print(text[:600] if len(text) > 600 else text)
+        else:
+            print("Text: EMPTY")
+        print(f"Has HTML: {'text_as_html' in t['metadata']}")
+
+def parse(test_pdf):
+    """Parse one PDF with the pipeline backend; returns (result, seconds)."""
+    if str(ROOT) not in sys.path:
+        sys.path.insert(0, str(ROOT))
+    from backend.app.services.mineru_parser import parse_pdf_with_mineru
+
+    start = time.perf_counter()
+    result = parse_pdf_with_mineru(test_pdf, backend="pipeline")
+    return result, time.perf_counter() - start
 
 def main():
-    sys.path.insert(0, '/Users/vincentjin/CodingProject/Prism')
-    
-    from pathlib import Path
-    from backend.app.services.mineru_parser import parse_pdf_with_mineru, MINERU_AVAILABLE
-    
-    test_pdf = Path.home() / '2024体检报告.pdf'
-    print(f"Testing with: {test_pdf}")
-    
-    if MINERU_AVAILABLE and test_pdf.exists():
+    parser = argparse.ArgumentParser(description="Check MinerU table extraction")
+    parser.add_argument("pdfs", nargs="*", type=Path, help="PDF files to parse")
+    parser.add_argument("--workers", type=int, default=1, help="Parse files in this many processes")
+    args = parser.parse_args()
+
+    sys.path.insert(0, str(ROOT))
+    from backend.app.services.mineru_parser import MINERU_AVAILABLE
+
+    if not MINERU_AVAILABLE:
+        print("MinerU is not installed")
+        return
+
+    test_pdfs = []
+    for test_pdf in args.pdfs or [Path.home() / '2024体检报告.pdf']:
+        if test_pdf.exists():
+            test_pdfs.append(test_pdf)
+        else:
+            print(f"File not found, skipping: {test_pdf}")
+
+    if args.workers > 1 and len(test_pdfs) > 1:
+        from concurrent.futures import ProcessPoolExecutor
+        import multiprocessing
+
+        # spawn: torch / model state must not be forked
+        context = multiprocessing.get_context("spawn")
+        with ProcessPoolExecutor(max_workers=args.workers, mp_context=context) as pool:
+            futures = [pool.submit(parse, test_pdf) for test_pdf in test_pdfs]
+            for test_pdf, future in zip(test_pdfs, futures):
+                print(f"Testing with: {test_pdf}")
+                try:
+                    result, seconds = future.result()
+                except Exception:
+                    import traceback
+                    traceback.print_exc()
+                    continue
+                print(f"Parsed in {seconds:.1f}s")
+                report_tables(result)
+        return
+
+    for test_pdf in test_pdfs:
+        print(f"Testing with: {test_pdf}")
         try:
-            result = parse_pdf_with_mineru(test_pdf, backend="pipeline")
-            print(f"Backend: {result['backend']}")
-            
-            # Find table elements
-            tables = [e for e in result['elements'] if e['category'] == 'Table']
-            print(f"Tables found: {len(tables)}")
-            
-            # Show first few tables with content
-            for i, t in enumerate(tables[:3]):
-                print(f"\n=== Table {i+1} (Page {t['metadata'].get('page_number')}) ===")
-                text = t['text']
-                if text:
-                    print(f"Text ({len(text)} chars):")
-                    print(text[:600] if len(text) > 600 else text)
-                else:
-                    print("Text: EMPTY")
-                print(f"Has HTML: {'text_as_html' in t['metadata']}")
-                
-        except Exception as e:
+            result, seconds = parse(test_pdf)
+        except Exception:
             import traceback
             traceback.print_exc()
+            continue
+        print(f"Parsed in {seconds:.1f}s")
+        report_tables(result)
 
 if __name__ == '__main__':
     import multiprocessing